@@ -0,0 +1,189 @@
+package com.example.golden
+
+// Kotlin file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import java.text.Normalizer
+
+interface PyRawRepresentable {
+    val pyRawValue: Any
+}
+
+// Lowercased, without diacritics, and with each run of characters other than ASCII letters and digits
+// replaced by a single underscore (none at the ends), in a single pass over the decomposed string
+fun String.pyNormalized(): String {
+    val decomposed = Normalizer.normalize(this.lowercase(), Normalizer.Form.NFD)
+    val normalized = StringBuilder(decomposed.length)
+    var separated = false
+    var index = 0
+    while (index < decomposed.length) {
+        val codePoint = decomposed.codePointAt(index)
+        index += Character.charCount(codePoint)
+        if (Character.getType(codePoint) == Character.NON_SPACING_MARK.toInt()) {
+            continue
+        }
+        if ((codePoint >= 'a'.code && codePoint <= 'z'.code) || (codePoint >= 'A'.code && codePoint <= 'Z'.code) || (codePoint >= '0'.code && codePoint <= '9'.code)) {
+            if (separated && normalized.length > 0) {
+                normalized.append('_')
+            }
+            normalized.append(codePoint.toChar())
+            separated = false
+        }
+        else {
+            separated = true
+        }
+    }
+    return normalized.toString()
+}
+
+// Capacity of a HashMap holding count entries without being resized
+private fun pyHashMapCapacity(count: Int): Int = (count / 0.75f).toInt() + 1
+
+fun Map<String, Any?>.pyNormalized(): Map<String, Any> {
+    val map = HashMap<String, Any>(pyHashMapCapacity(this.size))
+    for ((key, value) in this) {
+        val v = value ?: continue
+        if (v is String) {
+            map.put(key.pyNormalized(), v.pyNormalized())
+        }
+        else {
+            map.put(key.pyNormalized(), v)
+        }
+    }
+    return map
+}
+
+class EventData private constructor(val name: String, val params: Map<String, Any>, @Suppress("UNUSED_PARAMETER") normalized: Boolean) {
+    constructor(rawName: String, rawParams: Map<String, Any?>) : this(rawName.pyNormalized(), rawParams.pyNormalized(), true)
+
+    override fun equals(other: Any?) = other is EventData && other.name == this.name && other.params == this.params
+    override fun hashCode() = 31 * this.name.hashCode() + this.params.hashCode()
+    override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+
+    companion object {
+        // The generated methods write the name and the keys already normalized, only their values are normalized when called
+        fun normalized(name: String, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(params.size))
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        // Same, with the fixed default params of the event's group shared by its events
+        fun normalized(name: String, defaults: Map<String, Any>, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(defaults.size + params.size))
+            map.putAll(defaults)
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        fun normalizedValue(value: Any?): Any? = if (value is String) value.pyNormalized() else value
+    }
+}
+        
+object GoldenEvents {
+    
+    interface ScreenKind: PyRawRepresentable {
+        companion object {
+            private data class EnumData(override val pyRawValue: Any): ScreenKind
+
+            val home: ScreenKind = EnumData("home-screen")
+            val count: ScreenKind = EnumData(3)
+            fun custom(screenName: String): ScreenKind = EnumData(screenName)
+        }
+    }        
+
+    
+    interface Origin: PyRawRepresentable {
+        companion object {
+            private data class EnumData(override val pyRawValue: Any): Origin
+
+            val push: Origin = EnumData("Push Notification")
+            fun deep(linkId: Int): Origin = EnumData(linkId)
+        }
+    }        
+
+    const val constantWithFixedStringValue = "value-one"
+    const val flag = 1
+    private val pyDefaultParams: Map<String, Any> = mapOf("usuario_acao" to "ola_mundo", "ratio" to 1.50)
+    private val pyDefaultParams2: Map<String, Any> = mapOf("defaultparam2" to 23, "usuario_acao" to "ola_mundo", "ratio" to 1.50)
+
+    fun earlyEvent(aB: String): EventData {
+        return EventData.normalized("early_event", mapOf("a_b" to aB.pyNormalized(), "fixed" to 1))
+    }
+    fun eventMethodName(param1: String, param3: Int?, screen: ScreenKind, origin: Origin?, price: Double, CaoNX: String?, defaultParam1: String): EventData {
+        return EventData.normalized("event_name", pyDefaultParams, mapOf("param1" to param1.pyNormalized(), "param2" to 42, "param3" to param3, "screen" to EventData.normalizedValue(screen.pyRawValue), "origin" to EventData.normalizedValue(origin?.pyRawValue), "price" to price, "cao_n_x" to CaoNX?.pyNormalized(), "fixedstr" to "some_value", "defaultparam1" to defaultParam1.pyNormalized()))
+    }
+    fun simpleEvent(defaultParam1: String): EventData {
+        return EventData.normalized("simple", pyDefaultParams2, mapOf("defaultparam1" to defaultParam1.pyNormalized()))
+    }
+    fun methodWithParam(stringParam: String, a2: String, intParam: Int): String {
+        return "value-two-${stringParam}-and-${a2}-with-${intParam}"
+    }
+    fun methodEnd(a1: String): String {
+        return "prefix-${a1}"
+    }
+    fun methodFloat(theValue: Double): String {
+        return "${theValue}?"
+    }
+    fun methodOpt(a1: String?): String {
+        return "x-${a1}?"
+    }
+    fun methodEnum(ScreenKind: ScreenKind): String {
+        return "${ScreenKind.pyRawValue}"
+    }
+
+    object SubgroupOfPropertiesAndMethods {
+        const val constantWithFixedIntValue = 29
+        const val constantWithFixedDoubleValue = 88.21
+    
+        fun subEvent(x: String, sub: Int): EventData {
+            return EventData.normalized("sub_event", mapOf("x" to x.pyNormalized(), "sub" to sub))
+        }
+    
+            object Deeper {
+                
+            interface Deep: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Deep
+
+                    val a: Deep = EnumData("A")
+                    fun b(a1: String): Deep = EnumData(a1)
+                }
+            }        
+
+                const val deepConst = "d"
+            
+                fun deepMethod(a1: Int, a2: Int): String {
+                    return "${a1}-${a2}"
+                }
+                fun deepEvent(k: Double?): EventData {
+                    return EventData.normalized("deep", mapOf("k" to k))
+                }
+            
+                        object Deepest {
+                            const val z = 1
+                        
+                            fun zEvent(q: String): EventData {
+                                return EventData.normalized("zz", mapOf("q" to q.pyNormalized()))
+                            }
+                        
+                                        object Empty {
+                                        }
+                        }
+            }
+            object Sibling {
+                const val s = "s"
+            }
+    }
+    object LastGroup {
+    
+        fun last(AeIOu: String): String {
+            return "${AeIOu}"
+        }
+    }
+}
@@ -0,0 +1,250 @@
+// Swift file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import Foundation
+
+protocol PyRawRepresentable {
+    var pyRawValue: Any { get }
+}
+
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
+extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
+    func pyNormalized() -> String {
+        let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
+    }
+}
+
+extension Dictionary where Key == String, Value == Any? {
+    func pyNormalized() -> [String: Any] {
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
+    }
+}
+
+public struct EventData {
+    public let name: String
+    public let params: [String: Any]
+    
+    init(name: String, params: [String: Any?]) {
+        self.name = name.pyNormalized()
+        self.params = params.pyNormalized()
+    }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
+}
+        
+public struct GoldenEvents {
+    private init() {}
+
+    
+    public struct ScreenKind: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let home = ScreenKind("home-screen")
+        public static let count = ScreenKind(3)
+        public static func custom(screenName: String) -> ScreenKind { return ScreenKind(screenName) }
+    }        
+
+    
+    public struct Origin: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let push = Origin("Push Notification")
+        public static func deep(linkId: Int) -> Origin { return Origin(linkId) }
+    }        
+
+    public static let constantWithFixedStringValue = "value-one"
+    public static let flag = 1
+    private static let pyDefaultParams: [String: Any] = ["usuario_acao" : "ola_mundo", "ratio" : 1.50]
+    private static let pyDefaultParams2: [String: Any] = ["defaultparam2" : 23, "usuario_acao" : "ola_mundo", "ratio" : 1.50]
+
+    public static func earlyEvent(aB: String) -> EventData {
+        return EventData(normalizedName: "early_event", params: ["a_b" : aB.pyNormalized(), "fixed" : 1])
+    }
+    public static func eventMethodName(param1: String, param3: Int?, screen: ScreenKind, origin: Origin?, price: Double, CaoNX: String?, defaultParam1: String) -> EventData {
+        return EventData(normalizedName: "event_name", defaults: pyDefaultParams, params: ["param1" : param1.pyNormalized(), "param2" : 42, "param3" : param3, "screen" : EventData.normalizedValue(screen.pyRawValue), "origin" : EventData.normalizedValue(origin?.pyRawValue), "price" : price, "cao_n_x" : CaoNX?.pyNormalized(), "fixedstr" : "some_value", "defaultparam1" : defaultParam1.pyNormalized()])
+    }
+    public static func simpleEvent(defaultParam1: String) -> EventData {
+        return EventData(normalizedName: "simple", defaults: pyDefaultParams2, params: ["defaultparam1" : defaultParam1.pyNormalized()])
+    }
+    public static func methodWithParam(stringParam: String, _ a2: String, intParam: Int) -> String {
+        return "value-two-\(stringParam)-and-\(a2)-with-\(intParam)"
+    }
+    public static func methodEnd(_ a1: String) -> String {
+        return "prefix-\(a1)"
+    }
+    public static func methodFloat(theValue: Double) -> String {
+        return "\(theValue)?"
+    }
+    public static func methodOpt(_ a1: String?) -> String {
+        return "x-\(a1)?"
+    }
+    public static func methodEnum(ScreenKind: ScreenKind) -> String {
+        return "\(ScreenKind.pyRawValue)"
+    }
+
+    public struct SubgroupOfPropertiesAndMethods {
+        private init() {}
+
+        public static let constantWithFixedIntValue = 29
+        public static let constantWithFixedDoubleValue = 88.21
+    
+        public static func subEvent(x: String, sub: Int) -> EventData {
+            return EventData(normalizedName: "sub_event", params: ["x" : x.pyNormalized(), "sub" : sub])
+        }
+    
+            public struct Deeper {
+            private init() {}
+
+                
+            public struct Deep: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let a = Deep("A")
+                public static func b(_ a1: String) -> Deep { return Deep(a1) }
+            }        
+
+                public static let deepConst = "d"
+            
+                public static func deepMethod(_ a1: Int, _ a2: Int) -> String {
+                    return "\(a1)-\(a2)"
+                }
+                public static func deepEvent(k: Double?) -> EventData {
+                    return EventData(normalizedName: "deep", params: ["k" : k])
+                }
+            
+                        public struct Deepest {
+                private init() {}
+
+                            public static let z = 1
+                        
+                            public static func zEvent(q: String) -> EventData {
+                                return EventData(normalizedName: "zz", params: ["q" : q.pyNormalized()])
+                            }
+                        
+                                        public struct Empty {
+                    private init() {}
+
+                                        }
+                        }
+            }
+            public struct Sibling {
+            private init() {}
+
+                public static let s = "s"
+            }
+    }
+    public struct LastGroup {
+        private init() {}
+
+    
+        public static func last(AeIOu: String) -> String {
+            return "\(AeIOu)"
+        }
+    }
+}
+
+// Every event of GoldenEvents by its normalized name (the one of EventData.name), found with a binary search
+public enum GoldenEventsEventRegistry {
+    public struct Entry {
+        public let name: String
+        public let method: String
+        public let params: [String: String]
+    }
+
+    // A "name\tmethod\tkey:type,key:type" line per event, sorted by name
+    private static let chunks: [String] = [
+        "deep\tGoldenEvents.SubgroupOfPropertiesAndMethods.Deeper.deepEvent\tk:Double?\nearly_event\tGoldenEvents.earlyEvent\ta_b:String,fixed:Int\nevent_name\tGoldenEvents.eventMethodName\tparam1:String,param2:Int,param3:Int?,screen:ScreenKind,origin:Origin?,price:Double,cao_n_x:String?,fixedstr:String,defaultparam1:String,usuario_acao:String,ratio:Double\nsimple\tGoldenEvents.simpleEvent\tdefaultparam1:String,defaultparam2:Int,usuario_acao:String,ratio:Double\nsub_event\tGoldenEvents.SubgroupOfPropertiesAndMethods.subEvent\tx:String,sub:Int\nzz\tGoldenEvents.SubgroupOfPropertiesAndMethods.Deeper.Deepest.zEvent\tq:String\n"
+    ]
+    private static let lines: [Substring] = chunks.joined().split(separator: "\n")
+    private static let names: [String] = lines.map { String($0.prefix(while: { $0 != "\t" })) }
+
+    public static var count: Int {
+        return names.count
+    }
+
+    public static func contains(_ name: String) -> Bool {
+        return index(of: name) != nil
+    }
+
+    public static func lookup(_ name: String) -> Entry? {
+        guard let index = index(of: name) else { return nil }
+        let fields = lines[index].split(separator: "\t", omittingEmptySubsequences: false)
+        var params = [String: String]()
+        for param in fields[2].split(separator: ",") {
+            let keyAndType = param.split(separator: ":", maxSplits: 1)
+            params[String(keyAndType[0])] = String(keyAndType[1])
+        }
+        return Entry(name: String(fields[0]), method: String(fields[1]), params: params)
+    }
+
+    private static func index(of name: String) -> Int? {
+        var low = 0
+        var high = names.count - 1
+        while (low <= high) {
+            let middle = (low + high) / 2
+            if (names[middle] == name) {
+                return middle
+            }
+            if (names[middle] < name) {
+                low = middle + 1
+            }
+            else {
+                high = middle - 1
+            }
+        }
+        return nil
+    }
+}
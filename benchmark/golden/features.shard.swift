@@ -0,0 +1,220 @@
+// shard: runtime
+// Swift runtime of GoldenEvents generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import Foundation
+
+protocol PyRawRepresentable {
+    var pyRawValue: Any { get }
+}
+
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
+extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
+    func pyNormalized() -> String {
+        let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
+    }
+}
+
+extension Dictionary where Key == String, Value == Any? {
+    func pyNormalized() -> [String: Any] {
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
+    }
+}
+
+public struct EventData {
+    public let name: String
+    public let params: [String: Any]
+    
+    init(name: String, params: [String: Any?]) {
+        self.name = name.pyNormalized()
+        self.params = params.pyNormalized()
+    }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
+}
+        
+
+
+// shard: root
+// Swift file generated by pykotlinswift script. Version: 1.0.0 
+
+
+public struct GoldenEvents {
+    private init() {}
+
+    
+    public struct ScreenKind: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let home = ScreenKind("home-screen")
+        public static let count = ScreenKind(3)
+        public static func custom(screenName: String) -> ScreenKind { return ScreenKind(screenName) }
+    }        
+
+    
+    public struct Origin: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let push = Origin("Push Notification")
+        public static func deep(linkId: Int) -> Origin { return Origin(linkId) }
+    }        
+
+    public static let constantWithFixedStringValue = "value-one"
+    public static let flag = 1
+    private static let pyDefaultParams: [String: Any] = ["usuario_acao" : "ola_mundo", "ratio" : 1.50]
+    private static let pyDefaultParams2: [String: Any] = ["defaultparam2" : 23, "usuario_acao" : "ola_mundo", "ratio" : 1.50]
+
+    public static func earlyEvent(aB: String) -> EventData {
+        return EventData(normalizedName: "early_event", params: ["a_b" : aB.pyNormalized(), "fixed" : 1])
+    }
+    public static func eventMethodName(param1: String, param3: Int?, screen: ScreenKind, origin: Origin?, price: Double, CaoNX: String?, defaultParam1: String) -> EventData {
+        return EventData(normalizedName: "event_name", defaults: pyDefaultParams, params: ["param1" : param1.pyNormalized(), "param2" : 42, "param3" : param3, "screen" : EventData.normalizedValue(screen.pyRawValue), "origin" : EventData.normalizedValue(origin?.pyRawValue), "price" : price, "cao_n_x" : CaoNX?.pyNormalized(), "fixedstr" : "some_value", "defaultparam1" : defaultParam1.pyNormalized()])
+    }
+    public static func simpleEvent(defaultParam1: String) -> EventData {
+        return EventData(normalizedName: "simple", defaults: pyDefaultParams2, params: ["defaultparam1" : defaultParam1.pyNormalized()])
+    }
+    public static func methodWithParam(stringParam: String, _ a2: String, intParam: Int) -> String {
+        return "value-two-\(stringParam)-and-\(a2)-with-\(intParam)"
+    }
+    public static func methodEnd(_ a1: String) -> String {
+        return "prefix-\(a1)"
+    }
+    public static func methodFloat(theValue: Double) -> String {
+        return "\(theValue)?"
+    }
+    public static func methodOpt(_ a1: String?) -> String {
+        return "x-\(a1)?"
+    }
+    public static func methodEnum(ScreenKind: ScreenKind) -> String {
+        return "\(ScreenKind.pyRawValue)"
+    }
+}
+
+
+// shard: SubgroupOfPropertiesAndMethods
+// Swift shard of GoldenEvents generated by pykotlinswift script. Version: 1.0.0 
+
+
+extension GoldenEvents {
+    public struct SubgroupOfPropertiesAndMethods {
+        private init() {}
+
+        public static let constantWithFixedIntValue = 29
+        public static let constantWithFixedDoubleValue = 88.21
+    
+        public static func subEvent(x: String, sub: Int) -> EventData {
+            return EventData(normalizedName: "sub_event", params: ["x" : x.pyNormalized(), "sub" : sub])
+        }
+    
+            public struct Deeper {
+            private init() {}
+
+                
+            public struct Deep: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let a = Deep("A")
+                public static func b(_ a1: String) -> Deep { return Deep(a1) }
+            }        
+
+                public static let deepConst = "d"
+            
+                public static func deepMethod(_ a1: Int, _ a2: Int) -> String {
+                    return "\(a1)-\(a2)"
+                }
+                public static func deepEvent(k: Double?) -> EventData {
+                    return EventData(normalizedName: "deep", params: ["k" : k])
+                }
+            
+                        public struct Deepest {
+                private init() {}
+
+                            public static let z = 1
+                        
+                            public static func zEvent(q: String) -> EventData {
+                                return EventData(normalizedName: "zz", params: ["q" : q.pyNormalized()])
+                            }
+                        
+                                        public struct Empty {
+                    private init() {}
+
+                                        }
+                        }
+            }
+            public struct Sibling {
+            private init() {}
+
+                public static let s = "s"
+            }
+    }
+}
+
+
+// shard: LastGroup
+// Swift shard of GoldenEvents generated by pykotlinswift script. Version: 1.0.0 
+
+
+extension GoldenEvents {
+    public struct LastGroup {
+        private init() {}
+
+    
+        public static func last(AeIOu: String) -> String {
+            return "\(AeIOu)"
+        }
+    }
+}
+
@@ -0,0 +1,262 @@
+package com.example.golden
+
+// Kotlin file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import java.text.Normalizer
+
+interface PyRawRepresentable {
+    val pyRawValue: Any
+}
+
+// Lowercased, without diacritics, and with each run of characters other than ASCII letters and digits
+// replaced by a single underscore (none at the ends), in a single pass over the decomposed string
+fun String.pyNormalized(): String {
+    val decomposed = Normalizer.normalize(this.lowercase(), Normalizer.Form.NFD)
+    val normalized = StringBuilder(decomposed.length)
+    var separated = false
+    var index = 0
+    while (index < decomposed.length) {
+        val codePoint = decomposed.codePointAt(index)
+        index += Character.charCount(codePoint)
+        if (Character.getType(codePoint) == Character.NON_SPACING_MARK.toInt()) {
+            continue
+        }
+        if ((codePoint >= 'a'.code && codePoint <= 'z'.code) || (codePoint >= 'A'.code && codePoint <= 'Z'.code) || (codePoint >= '0'.code && codePoint <= '9'.code)) {
+            if (separated && normalized.length > 0) {
+                normalized.append('_')
+            }
+            normalized.append(codePoint.toChar())
+            separated = false
+        }
+        else {
+            separated = true
+        }
+    }
+    return normalized.toString()
+}
+
+// Capacity of a HashMap holding count entries without being resized
+private fun pyHashMapCapacity(count: Int): Int = (count / 0.75f).toInt() + 1
+
+fun Map<String, Any?>.pyNormalized(): Map<String, Any> {
+    val map = HashMap<String, Any>(pyHashMapCapacity(this.size))
+    for ((key, value) in this) {
+        val v = value ?: continue
+        if (v is String) {
+            map.put(key.pyNormalized(), v.pyNormalized())
+        }
+        else {
+            map.put(key.pyNormalized(), v)
+        }
+    }
+    return map
+}
+
+class EventData private constructor(val name: String, val params: Map<String, Any>, @Suppress("UNUSED_PARAMETER") normalized: Boolean) {
+    constructor(rawName: String, rawParams: Map<String, Any?>) : this(rawName.pyNormalized(), rawParams.pyNormalized(), true)
+
+    override fun equals(other: Any?) = other is EventData && other.name == this.name && other.params == this.params
+    override fun hashCode() = 31 * this.name.hashCode() + this.params.hashCode()
+    override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+
+    companion object {
+        // The generated methods write the name and the keys already normalized, only their values are normalized when called
+        fun normalized(name: String, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(params.size))
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        // Same, with the fixed default params of the event's group shared by its events
+        fun normalized(name: String, defaults: Map<String, Any>, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(defaults.size + params.size))
+            map.putAll(defaults)
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        fun normalizedValue(value: Any?): Any? = if (value is String) value.pyNormalized() else value
+    }
+}
+        
+// Receives the params of a typed event without boxing its numbers
+interface EventParamVisitor {
+    fun param(key: String, value: String)
+    fun param(key: String, value: Int)
+    fun param(key: String, value: Double)
+
+    fun rawParam(key: String, value: Any) {
+        when (value) {
+            is String -> this.param(key, value.pyNormalized())
+            is Int -> this.param(key, value)
+            is Double -> this.param(key, value)
+        }
+    }
+}
+
+abstract class TypedEventData(val name: String, private val paramCount: Int) {
+    private var paramsMap: Map<String, Any>? = null
+
+    abstract fun forEachParam(visitor: EventParamVisitor)
+
+    // Map view of the params, only built when asked for
+    val params: Map<String, Any>
+        get() {
+            val cached = this.paramsMap
+            if (cached != null) {
+                return cached
+            }
+            val map = HashMap<String, Any>(pyHashMapCapacity(this.paramCount))
+            this.forEachParam(object : EventParamVisitor {
+                override fun param(key: String, value: String) { map.put(key, value) }
+                override fun param(key: String, value: Int) { map.put(key, value) }
+                override fun param(key: String, value: Double) { map.put(key, value) }
+            })
+            this.paramsMap = map
+            return map
+        }
+
+    fun toEventData(): EventData = EventData.normalized(this.name, this.params)
+
+    override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+}
+
+object GoldenEvents {
+    
+    interface ScreenKind: PyRawRepresentable {
+        companion object {
+            private data class EnumData(override val pyRawValue: Any): ScreenKind
+
+            val home: ScreenKind = EnumData("home-screen")
+            val count: ScreenKind = EnumData(3)
+            fun custom(screenName: String): ScreenKind = EnumData(screenName)
+        }
+    }        
+
+    
+    interface Origin: PyRawRepresentable {
+        companion object {
+            private data class EnumData(override val pyRawValue: Any): Origin
+
+            val push: Origin = EnumData("Push Notification")
+            fun deep(linkId: Int): Origin = EnumData(linkId)
+        }
+    }        
+
+    const val constantWithFixedStringValue = "value-one"
+    const val flag = 1
+
+    class EarlyEventPayload(private val p0: String) : TypedEventData("early_event", 2) {
+        override fun forEachParam(visitor: EventParamVisitor) {
+            visitor.param("a_b", this.p0.pyNormalized())
+            visitor.param("fixed", 1)
+        }
+    }
+    fun earlyEvent(aB: String): EarlyEventPayload = EarlyEventPayload(aB)
+    class EventMethodNamePayload(private val p0: String, private val p1: Int?, private val p2: ScreenKind, private val p3: Origin?, private val p4: Double, private val p5: String?, private val p6: String) : TypedEventData("event_name", 11) {
+        override fun forEachParam(visitor: EventParamVisitor) {
+            visitor.param("param1", this.p0.pyNormalized())
+            visitor.param("param2", 42)
+            this.p1?.let { visitor.param("param3", it) }
+            visitor.rawParam("screen", this.p2.pyRawValue)
+            this.p3?.let { visitor.rawParam("origin", it.pyRawValue) }
+            visitor.param("price", this.p4)
+            this.p5?.let { visitor.param("cao_n_x", it.pyNormalized()) }
+            visitor.param("fixedstr", "some_value")
+            visitor.param("defaultparam1", this.p6.pyNormalized())
+            visitor.param("usuario_acao", "ola_mundo")
+            visitor.param("ratio", 1.50)
+        }
+    }
+    fun eventMethodName(param1: String, param3: Int?, screen: ScreenKind, origin: Origin?, price: Double, CaoNX: String?, defaultParam1: String): EventMethodNamePayload = EventMethodNamePayload(param1, param3, screen, origin, price, CaoNX, defaultParam1)
+    class SimpleEventPayload(private val p0: String) : TypedEventData("simple", 4) {
+        override fun forEachParam(visitor: EventParamVisitor) {
+            visitor.param("defaultparam1", this.p0.pyNormalized())
+            visitor.param("defaultparam2", 23)
+            visitor.param("usuario_acao", "ola_mundo")
+            visitor.param("ratio", 1.50)
+        }
+    }
+    fun simpleEvent(defaultParam1: String): SimpleEventPayload = SimpleEventPayload(defaultParam1)
+    fun methodWithParam(stringParam: String, a2: String, intParam: Int): String {
+        return "value-two-${stringParam}-and-${a2}-with-${intParam}"
+    }
+    fun methodEnd(a1: String): String {
+        return "prefix-${a1}"
+    }
+    fun methodFloat(theValue: Double): String {
+        return "${theValue}?"
+    }
+    fun methodOpt(a1: String?): String {
+        return "x-${a1}?"
+    }
+    fun methodEnum(ScreenKind: ScreenKind): String {
+        return "${ScreenKind.pyRawValue}"
+    }
+
+    object SubgroupOfPropertiesAndMethods {
+        const val constantWithFixedIntValue = 29
+        const val constantWithFixedDoubleValue = 88.21
+    
+        class SubEventPayload(private val p0: String, private val p1: Int) : TypedEventData("sub_event", 2) {
+            override fun forEachParam(visitor: EventParamVisitor) {
+                visitor.param("x", this.p0.pyNormalized())
+                visitor.param("sub", this.p1)
+            }
+        }
+        fun subEvent(x: String, sub: Int): SubEventPayload = SubEventPayload(x, sub)
+    
+            object Deeper {
+                
+            interface Deep: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Deep
+
+                    val a: Deep = EnumData("A")
+                    fun b(a1: String): Deep = EnumData(a1)
+                }
+            }        
+
+                const val deepConst = "d"
+            
+                fun deepMethod(a1: Int, a2: Int): String {
+                    return "${a1}-${a2}"
+                }
+                class DeepEventPayload(private val p0: Double?) : TypedEventData("deep", 1) {
+                    override fun forEachParam(visitor: EventParamVisitor) {
+                        this.p0?.let { visitor.param("k", it) }
+                    }
+                }
+                fun deepEvent(k: Double?): DeepEventPayload = DeepEventPayload(k)
+            
+                        object Deepest {
+                            const val z = 1
+                        
+                            class ZEventPayload(private val p0: String) : TypedEventData("zz", 1) {
+                                override fun forEachParam(visitor: EventParamVisitor) {
+                                    visitor.param("q", this.p0.pyNormalized())
+                                }
+                            }
+                            fun zEvent(q: String): ZEventPayload = ZEventPayload(q)
+                        
+                                        object Empty {
+                                        }
+                        }
+            }
+            object Sibling {
+                const val s = "s"
+            }
+    }
+    object LastGroup {
+    
+        fun last(AeIOu: String): String {
+            return "${AeIOu}"
+        }
+    }
+}
@@ -0,0 +1,315 @@
+// Swift file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import Foundation
+
+protocol PyRawRepresentable {
+    var pyRawValue: Any { get }
+}
+
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
+extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
+    func pyNormalized() -> String {
+        let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
+    }
+}
+
+extension Dictionary where Key == String, Value == Any? {
+    func pyNormalized() -> [String: Any] {
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
+    }
+}
+
+public struct EventData {
+    public let name: String
+    public let params: [String: Any]
+    
+    init(name: String, params: [String: Any?]) {
+        self.name = name.pyNormalized()
+        self.params = params.pyNormalized()
+    }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
+}
+        
+// Receives the params of a typed event without boxing its numbers
+public protocol EventParamVisitor: AnyObject {
+    func param(_ key: String, _ value: String)
+    func param(_ key: String, _ value: Int)
+    func param(_ key: String, _ value: Double)
+}
+
+extension EventParamVisitor {
+    func rawParam(_ key: String, _ value: Any) {
+        if let value = value as? String {
+            self.param(key, value.pyNormalized())
+        } else if let value = value as? Int {
+            self.param(key, value)
+        } else if let value = value as? Double {
+            self.param(key, value)
+        }
+    }
+}
+
+public protocol TypedEventData {
+    var name: String { get }
+    var paramCount: Int { get }
+    func forEachParam(_ visitor: EventParamVisitor)
+}
+
+private final class PyParamsCollector: EventParamVisitor {
+    var params: [String: Any]
+
+    init(capacity: Int) {
+        self.params = [String: Any](minimumCapacity: capacity)
+    }
+
+    func param(_ key: String, _ value: String) { self.params[key] = value }
+    func param(_ key: String, _ value: Int) { self.params[key] = value }
+    func param(_ key: String, _ value: Double) { self.params[key] = value }
+}
+
+extension TypedEventData {
+    // Map view of the params, only built when asked for
+    public var params: [String: Any] {
+        let collector = PyParamsCollector(capacity: self.paramCount)
+        self.forEachParam(collector)
+        return collector.params
+    }
+
+    public var eventData: EventData {
+        return EventData(normalizedName: self.name, params: self.params)
+    }
+}
+
+public struct GoldenEvents {
+    private init() {}
+
+    
+    public struct ScreenKind: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let home = ScreenKind("home-screen")
+        public static let count = ScreenKind(3)
+        public static func custom(screenName: String) -> ScreenKind { return ScreenKind(screenName) }
+    }        
+
+    
+    public struct Origin: PyRawRepresentable {
+        let pyRawValue: Any
+        private init(_ value: Any) { self.pyRawValue = value }
+
+        public static let push = Origin("Push Notification")
+        public static func deep(linkId: Int) -> Origin { return Origin(linkId) }
+    }        
+
+    public static let constantWithFixedStringValue = "value-one"
+    public static let flag = 1
+
+    public struct EarlyEventPayload: TypedEventData {
+        let p0: String
+        public var name: String { return "early_event" }
+        public var paramCount: Int { return 2 }
+        public func forEachParam(_ visitor: EventParamVisitor) {
+            visitor.param("a_b", self.p0.pyNormalized())
+            visitor.param("fixed", 1)
+        }
+    }
+    public static func earlyEvent(aB: String) -> EarlyEventPayload {
+        return EarlyEventPayload(p0: aB)
+    }
+    public struct EventMethodNamePayload: TypedEventData {
+        let p0: String
+        let p1: Int?
+        let p2: ScreenKind
+        let p3: Origin?
+        let p4: Double
+        let p5: String?
+        let p6: String
+        public var name: String { return "event_name" }
+        public var paramCount: Int { return 11 }
+        public func forEachParam(_ visitor: EventParamVisitor) {
+            visitor.param("param1", self.p0.pyNormalized())
+            visitor.param("param2", 42)
+            if let p1 = self.p1 { visitor.param("param3", p1) }
+            visitor.rawParam("screen", self.p2.pyRawValue)
+            if let p3 = self.p3 { visitor.rawParam("origin", p3.pyRawValue) }
+            visitor.param("price", self.p4)
+            if let p5 = self.p5 { visitor.param("cao_n_x", p5.pyNormalized()) }
+            visitor.param("fixedstr", "some_value")
+            visitor.param("defaultparam1", self.p6.pyNormalized())
+            visitor.param("usuario_acao", "ola_mundo")
+            visitor.param("ratio", 1.50)
+        }
+    }
+    public static func eventMethodName(param1: String, param3: Int?, screen: ScreenKind, origin: Origin?, price: Double, CaoNX: String?, defaultParam1: String) -> EventMethodNamePayload {
+        return EventMethodNamePayload(p0: param1, p1: param3, p2: screen, p3: origin, p4: price, p5: CaoNX, p6: defaultParam1)
+    }
+    public struct SimpleEventPayload: TypedEventData {
+        let p0: String
+        public var name: String { return "simple" }
+        public var paramCount: Int { return 4 }
+        public func forEachParam(_ visitor: EventParamVisitor) {
+            visitor.param("defaultparam1", self.p0.pyNormalized())
+            visitor.param("defaultparam2", 23)
+            visitor.param("usuario_acao", "ola_mundo")
+            visitor.param("ratio", 1.50)
+        }
+    }
+    public static func simpleEvent(defaultParam1: String) -> SimpleEventPayload {
+        return SimpleEventPayload(p0: defaultParam1)
+    }
+    public static func methodWithParam(stringParam: String, _ a2: String, intParam: Int) -> String {
+        return "value-two-\(stringParam)-and-\(a2)-with-\(intParam)"
+    }
+    public static func methodEnd(_ a1: String) -> String {
+        return "prefix-\(a1)"
+    }
+    public static func methodFloat(theValue: Double) -> String {
+        return "\(theValue)?"
+    }
+    public static func methodOpt(_ a1: String?) -> String {
+        return "x-\(a1)?"
+    }
+    public static func methodEnum(ScreenKind: ScreenKind) -> String {
+        return "\(ScreenKind.pyRawValue)"
+    }
+
+    public struct SubgroupOfPropertiesAndMethods {
+        private init() {}
+
+        public static let constantWithFixedIntValue = 29
+        public static let constantWithFixedDoubleValue = 88.21
+    
+        public struct SubEventPayload: TypedEventData {
+            let p0: String
+            let p1: Int
+            public var name: String { return "sub_event" }
+            public var paramCount: Int { return 2 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("x", self.p0.pyNormalized())
+                visitor.param("sub", self.p1)
+            }
+        }
+        public static func subEvent(x: String, sub: Int) -> SubEventPayload {
+            return SubEventPayload(p0: x, p1: sub)
+        }
+    
+            public struct Deeper {
+            private init() {}
+
+                
+            public struct Deep: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let a = Deep("A")
+                public static func b(_ a1: String) -> Deep { return Deep(a1) }
+            }        
+
+                public static let deepConst = "d"
+            
+                public static func deepMethod(_ a1: Int, _ a2: Int) -> String {
+                    return "\(a1)-\(a2)"
+                }
+                public struct DeepEventPayload: TypedEventData {
+                    let p0: Double?
+                    public var name: String { return "deep" }
+                    public var paramCount: Int { return 1 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        if let p0 = self.p0 { visitor.param("k", p0) }
+                    }
+                }
+                public static func deepEvent(k: Double?) -> DeepEventPayload {
+                    return DeepEventPayload(p0: k)
+                }
+            
+                        public struct Deepest {
+                private init() {}
+
+                            public static let z = 1
+                        
+                            public struct ZEventPayload: TypedEventData {
+                                let p0: String
+                                public var name: String { return "zz" }
+                                public var paramCount: Int { return 1 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("q", self.p0.pyNormalized())
+                                }
+                            }
+                            public static func zEvent(q: String) -> ZEventPayload {
+                                return ZEventPayload(p0: q)
+                            }
+                        
+                                        public struct Empty {
+                    private init() {}
+
+                                        }
+                        }
+            }
+            public struct Sibling {
+            private init() {}
+
+                public static let s = "s"
+            }
+    }
+    public struct LastGroup {
+        private init() {}
+
+    
+        public static func last(AeIOu: String) -> String {
+            return "\(AeIOu)"
+        }
+    }
+}
@@ -0,0 +1,370 @@
+package com.example.golden
+
+// Kotlin file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import java.text.Normalizer
+
+interface PyRawRepresentable {
+    val pyRawValue: Any
+}
+
+// Lowercased, without diacritics, and with each run of characters other than ASCII letters and digits
+// replaced by a single underscore (none at the ends), in a single pass over the decomposed string
+fun String.pyNormalized(): String {
+    val decomposed = Normalizer.normalize(this.lowercase(), Normalizer.Form.NFD)
+    val normalized = StringBuilder(decomposed.length)
+    var separated = false
+    var index = 0
+    while (index < decomposed.length) {
+        val codePoint = decomposed.codePointAt(index)
+        index += Character.charCount(codePoint)
+        if (Character.getType(codePoint) == Character.NON_SPACING_MARK.toInt()) {
+            continue
+        }
+        if ((codePoint >= 'a'.code && codePoint <= 'z'.code) || (codePoint >= 'A'.code && codePoint <= 'Z'.code) || (codePoint >= '0'.code && codePoint <= '9'.code)) {
+            if (separated && normalized.length > 0) {
+                normalized.append('_')
+            }
+            normalized.append(codePoint.toChar())
+            separated = false
+        }
+        else {
+            separated = true
+        }
+    }
+    return normalized.toString()
+}
+
+// Capacity of a HashMap holding count entries without being resized
+private fun pyHashMapCapacity(count: Int): Int = (count / 0.75f).toInt() + 1
+
+fun Map<String, Any?>.pyNormalized(): Map<String, Any> {
+    val map = HashMap<String, Any>(pyHashMapCapacity(this.size))
+    for ((key, value) in this) {
+        val v = value ?: continue
+        if (v is String) {
+            map.put(key.pyNormalized(), v.pyNormalized())
+        }
+        else {
+            map.put(key.pyNormalized(), v)
+        }
+    }
+    return map
+}
+
+class EventData private constructor(val name: String, val params: Map<String, Any>, @Suppress("UNUSED_PARAMETER") normalized: Boolean) {
+    constructor(rawName: String, rawParams: Map<String, Any?>) : this(rawName.pyNormalized(), rawParams.pyNormalized(), true)
+
+    override fun equals(other: Any?) = other is EventData && other.name == this.name && other.params == this.params
+    override fun hashCode() = 31 * this.name.hashCode() + this.params.hashCode()
+    override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+
+    companion object {
+        // The generated methods write the name and the keys already normalized, only their values are normalized when called
+        fun normalized(name: String, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(params.size))
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        // Same, with the fixed default params of the event's group shared by its events
+        fun normalized(name: String, defaults: Map<String, Any>, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(defaults.size + params.size))
+            map.putAll(defaults)
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        fun normalizedValue(value: Any?): Any? = if (value is String) value.pyNormalized() else value
+    }
+}
+        
+object GoldenEvents {
+
+    object Group0 {
+        
+        interface Kind0: PyRawRepresentable {
+            companion object {
+                private data class EnumData(override val pyRawValue: Any): Kind0
+
+                val first: Kind0 = EnumData("first value")
+                val second: Kind0 = EnumData(2)
+                fun custom(customName: String): Kind0 = EnumData(customName)
+            }
+        }        
+
+        
+        interface Kind1: PyRawRepresentable {
+            companion object {
+                private data class EnumData(override val pyRawValue: Any): Kind1
+
+                val first: Kind1 = EnumData("first value")
+                val second: Kind1 = EnumData(2)
+                fun custom(customName: String): Kind1 = EnumData(customName)
+            }
+        }        
+
+        const val constant1 = "Constant Value 1"
+        const val number3 = 4.50
+        private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+    
+        fun method0(itemName: String, a2: Int): String {
+            return "value-0-${itemName}-with-${a2}"
+        }
+        fun method2(itemName: String, a2: Int): String {
+            return "value-2-${itemName}-with-${a2}"
+        }
+        fun method4(itemName: String, a2: Int): String {
+            return "value-4-${itemName}-with-${a2}"
+        }
+        fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+            return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+        }
+        fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+            return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+        }
+        fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+            return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+        }
+    
+            object Subgroup {
+                
+            interface Kind0: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Kind0
+
+                    val first: Kind0 = EnumData("first value")
+                    val second: Kind0 = EnumData(2)
+                    fun custom(customName: String): Kind0 = EnumData(customName)
+                }
+            }        
+
+                
+            interface Kind1: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Kind1
+
+                    val first: Kind1 = EnumData("first value")
+                    val second: Kind1 = EnumData(2)
+                    fun custom(customName: String): Kind1 = EnumData(customName)
+                }
+            }        
+
+                const val constant1 = "Constant Value 1"
+                const val number3 = 4.50
+                private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+            
+                fun method0(itemName: String, a2: Int): String {
+                    return "value-0-${itemName}-with-${a2}"
+                }
+                fun method2(itemName: String, a2: Int): String {
+                    return "value-2-${itemName}-with-${a2}"
+                }
+                fun method4(itemName: String, a2: Int): String {
+                    return "value-4-${itemName}-with-${a2}"
+                }
+                fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                    return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                }
+                fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                    return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                }
+                fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+                    return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+                }
+            
+                        object Subgroup {
+                            
+                interface Kind0: PyRawRepresentable {
+                    companion object {
+                        private data class EnumData(override val pyRawValue: Any): Kind0
+
+                        val first: Kind0 = EnumData("first value")
+                        val second: Kind0 = EnumData(2)
+                        fun custom(customName: String): Kind0 = EnumData(customName)
+                    }
+                }        
+
+                            
+                interface Kind1: PyRawRepresentable {
+                    companion object {
+                        private data class EnumData(override val pyRawValue: Any): Kind1
+
+                        val first: Kind1 = EnumData("first value")
+                        val second: Kind1 = EnumData(2)
+                        fun custom(customName: String): Kind1 = EnumData(customName)
+                    }
+                }        
+
+                            const val constant1 = "Constant Value 1"
+                            const val number3 = 4.50
+                            private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+                        
+                            fun method0(itemName: String, a2: Int): String {
+                                return "value-0-${itemName}-with-${a2}"
+                            }
+                            fun method2(itemName: String, a2: Int): String {
+                                return "value-2-${itemName}-with-${a2}"
+                            }
+                            fun method4(itemName: String, a2: Int): String {
+                                return "value-4-${itemName}-with-${a2}"
+                            }
+                            fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                                return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                            }
+                            fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                                return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                            }
+                            fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+                                return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+                            }
+                        }
+            }
+    }
+    object Group1 {
+        
+        interface Kind0: PyRawRepresentable {
+            companion object {
+                private data class EnumData(override val pyRawValue: Any): Kind0
+
+                val first: Kind0 = EnumData("first value")
+                val second: Kind0 = EnumData(2)
+                fun custom(customName: String): Kind0 = EnumData(customName)
+            }
+        }        
+
+        
+        interface Kind1: PyRawRepresentable {
+            companion object {
+                private data class EnumData(override val pyRawValue: Any): Kind1
+
+                val first: Kind1 = EnumData("first value")
+                val second: Kind1 = EnumData(2)
+                fun custom(customName: String): Kind1 = EnumData(customName)
+            }
+        }        
+
+        const val constant1 = "Constant Value 1"
+        const val number3 = 4.50
+        private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+    
+        fun method0(itemName: String, a2: Int): String {
+            return "value-0-${itemName}-with-${a2}"
+        }
+        fun method2(itemName: String, a2: Int): String {
+            return "value-2-${itemName}-with-${a2}"
+        }
+        fun method4(itemName: String, a2: Int): String {
+            return "value-4-${itemName}-with-${a2}"
+        }
+        fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+            return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+        }
+        fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+            return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+        }
+        fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+            return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+        }
+    
+            object Subgroup {
+                
+            interface Kind0: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Kind0
+
+                    val first: Kind0 = EnumData("first value")
+                    val second: Kind0 = EnumData(2)
+                    fun custom(customName: String): Kind0 = EnumData(customName)
+                }
+            }        
+
+                
+            interface Kind1: PyRawRepresentable {
+                companion object {
+                    private data class EnumData(override val pyRawValue: Any): Kind1
+
+                    val first: Kind1 = EnumData("first value")
+                    val second: Kind1 = EnumData(2)
+                    fun custom(customName: String): Kind1 = EnumData(customName)
+                }
+            }        
+
+                const val constant1 = "Constant Value 1"
+                const val number3 = 4.50
+                private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+            
+                fun method0(itemName: String, a2: Int): String {
+                    return "value-0-${itemName}-with-${a2}"
+                }
+                fun method2(itemName: String, a2: Int): String {
+                    return "value-2-${itemName}-with-${a2}"
+                }
+                fun method4(itemName: String, a2: Int): String {
+                    return "value-4-${itemName}-with-${a2}"
+                }
+                fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                    return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                }
+                fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                    return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                }
+                fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+                    return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+                }
+            
+                        object Subgroup {
+                            
+                interface Kind0: PyRawRepresentable {
+                    companion object {
+                        private data class EnumData(override val pyRawValue: Any): Kind0
+
+                        val first: Kind0 = EnumData("first value")
+                        val second: Kind0 = EnumData(2)
+                        fun custom(customName: String): Kind0 = EnumData(customName)
+                    }
+                }        
+
+                            
+                interface Kind1: PyRawRepresentable {
+                    companion object {
+                        private data class EnumData(override val pyRawValue: Any): Kind1
+
+                        val first: Kind1 = EnumData("first value")
+                        val second: Kind1 = EnumData(2)
+                        fun custom(customName: String): Kind1 = EnumData(customName)
+                    }
+                }        
+
+                            const val constant1 = "Constant Value 1"
+                            const val number3 = 4.50
+                            private val pyDefaultParams: Map<String, Any> = mapOf("default_fixed_1" to "default_value_1")
+                        
+                            fun method0(itemName: String, a2: Int): String {
+                                return "value-0-${itemName}-with-${a2}"
+                            }
+                            fun method2(itemName: String, a2: Int): String {
+                                return "value-2-${itemName}-with-${a2}"
+                            }
+                            fun method4(itemName: String, a2: Int): String {
+                                return "value-4-${itemName}-with-${a2}"
+                            }
+                            fun event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                                return EventData.normalized("event_0", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                            }
+                            fun event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double): EventData {
+                                return EventData.normalized("event_1", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_0" to default0.pyNormalized(), "default_2" to default2))
+                            }
+                            fun event2(param0: String, param2: Kind0, param4: Int?, default2: Double): EventData {
+                                return EventData.normalized("event_2", pyDefaultParams, mapOf("param_0" to param0.pyNormalized(), "fixed_1" to 1, "param_2" to EventData.normalizedValue(param2.pyRawValue), "fixed_3" to 3, "param_4" to param4, "default_2" to default2))
+                            }
+                        }
+            }
+    }
+}
@@ -0,0 +1,369 @@
+// Swift file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import Foundation
+
+protocol PyRawRepresentable {
+    var pyRawValue: Any { get }
+}
+
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
+extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
+    func pyNormalized() -> String {
+        let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
+    }
+}
+
+extension Dictionary where Key == String, Value == Any? {
+    func pyNormalized() -> [String: Any] {
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
+    }
+}
+
+public struct EventData {
+    public let name: String
+    public let params: [String: Any]
+    
+    init(name: String, params: [String: Any?]) {
+        self.name = name.pyNormalized()
+        self.params = params.pyNormalized()
+    }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
+}
+        
+public struct GoldenEvents {
+    private init() {}
+
+
+    public struct Group0 {
+        private init() {}
+
+        
+        public struct Kind0: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind0("first value")
+            public static let second = Kind0(2)
+            public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+        }        
+
+        
+        public struct Kind1: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind1("first value")
+            public static let second = Kind1(2)
+            public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+        }        
+
+        public static let constant1 = "Constant Value 1"
+        public static let number3 = 4.50
+        private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+    
+        public static func method0(itemName: String, _ a2: Int) -> String {
+            return "value-0-\(itemName)-with-\(a2)"
+        }
+        public static func method2(itemName: String, _ a2: Int) -> String {
+            return "value-2-\(itemName)-with-\(a2)"
+        }
+        public static func method4(itemName: String, _ a2: Int) -> String {
+            return "value-4-\(itemName)-with-\(a2)"
+        }
+        public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+        }
+        public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+        }
+        public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+        }
+    
+            public struct Subgroup {
+            private init() {}
+
+                
+            public struct Kind0: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind0("first value")
+                public static let second = Kind0(2)
+                public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+            }        
+
+                
+            public struct Kind1: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind1("first value")
+                public static let second = Kind1(2)
+                public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+            }        
+
+                public static let constant1 = "Constant Value 1"
+                public static let number3 = 4.50
+                private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+            
+                public static func method0(itemName: String, _ a2: Int) -> String {
+                    return "value-0-\(itemName)-with-\(a2)"
+                }
+                public static func method2(itemName: String, _ a2: Int) -> String {
+                    return "value-2-\(itemName)-with-\(a2)"
+                }
+                public static func method4(itemName: String, _ a2: Int) -> String {
+                    return "value-4-\(itemName)-with-\(a2)"
+                }
+                public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                }
+                public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                }
+                public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+                }
+            
+                        public struct Subgroup {
+                private init() {}
+
+                            
+                public struct Kind0: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind0("first value")
+                    public static let second = Kind0(2)
+                    public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+                }        
+
+                            
+                public struct Kind1: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind1("first value")
+                    public static let second = Kind1(2)
+                    public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+                }        
+
+                            public static let constant1 = "Constant Value 1"
+                            public static let number3 = 4.50
+                            private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+                        
+                            public static func method0(itemName: String, _ a2: Int) -> String {
+                                return "value-0-\(itemName)-with-\(a2)"
+                            }
+                            public static func method2(itemName: String, _ a2: Int) -> String {
+                                return "value-2-\(itemName)-with-\(a2)"
+                            }
+                            public static func method4(itemName: String, _ a2: Int) -> String {
+                                return "value-4-\(itemName)-with-\(a2)"
+                            }
+                            public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                            }
+                            public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                            }
+                            public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+                            }
+                        }
+            }
+    }
+    public struct Group1 {
+        private init() {}
+
+        
+        public struct Kind0: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind0("first value")
+            public static let second = Kind0(2)
+            public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+        }        
+
+        
+        public struct Kind1: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind1("first value")
+            public static let second = Kind1(2)
+            public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+        }        
+
+        public static let constant1 = "Constant Value 1"
+        public static let number3 = 4.50
+        private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+    
+        public static func method0(itemName: String, _ a2: Int) -> String {
+            return "value-0-\(itemName)-with-\(a2)"
+        }
+        public static func method2(itemName: String, _ a2: Int) -> String {
+            return "value-2-\(itemName)-with-\(a2)"
+        }
+        public static func method4(itemName: String, _ a2: Int) -> String {
+            return "value-4-\(itemName)-with-\(a2)"
+        }
+        public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+        }
+        public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+        }
+        public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+            return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+        }
+    
+            public struct Subgroup {
+            private init() {}
+
+                
+            public struct Kind0: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind0("first value")
+                public static let second = Kind0(2)
+                public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+            }        
+
+                
+            public struct Kind1: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind1("first value")
+                public static let second = Kind1(2)
+                public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+            }        
+
+                public static let constant1 = "Constant Value 1"
+                public static let number3 = 4.50
+                private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+            
+                public static func method0(itemName: String, _ a2: Int) -> String {
+                    return "value-0-\(itemName)-with-\(a2)"
+                }
+                public static func method2(itemName: String, _ a2: Int) -> String {
+                    return "value-2-\(itemName)-with-\(a2)"
+                }
+                public static func method4(itemName: String, _ a2: Int) -> String {
+                    return "value-4-\(itemName)-with-\(a2)"
+                }
+                public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                }
+                public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                }
+                public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+                    return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+                }
+            
+                        public struct Subgroup {
+                private init() {}
+
+                            
+                public struct Kind0: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind0("first value")
+                    public static let second = Kind0(2)
+                    public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+                }        
+
+                            
+                public struct Kind1: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind1("first value")
+                    public static let second = Kind1(2)
+                    public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+                }        
+
+                            public static let constant1 = "Constant Value 1"
+                            public static let number3 = 4.50
+                            private static let pyDefaultParams: [String: Any] = ["default_fixed_1" : "default_value_1"]
+                        
+                            public static func method0(itemName: String, _ a2: Int) -> String {
+                                return "value-0-\(itemName)-with-\(a2)"
+                            }
+                            public static func method2(itemName: String, _ a2: Int) -> String {
+                                return "value-2-\(itemName)-with-\(a2)"
+                            }
+                            public static func method4(itemName: String, _ a2: Int) -> String {
+                                return "value-4-\(itemName)-with-\(a2)"
+                            }
+                            public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_0", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                            }
+                            public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_1", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_0" : default0.pyNormalized(), "default_2" : default2])
+                            }
+                            public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> EventData {
+                                return EventData(normalizedName: "event_2", defaults: pyDefaultParams, params: ["param_0" : param0.pyNormalized(), "fixed_1" : 1, "param_2" : EventData.normalizedValue(param2.pyRawValue), "fixed_3" : 3, "param_4" : param4, "default_2" : default2])
+                            }
+                        }
+            }
+    }
+}
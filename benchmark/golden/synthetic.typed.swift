@@ -0,0 +1,743 @@
+// Swift file generated by pykotlinswift script. Version: 1.0.0 
+
+
+
+import Foundation
+
+protocol PyRawRepresentable {
+    var pyRawValue: Any { get }
+}
+
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
+extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
+    func pyNormalized() -> String {
+        let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
+    }
+}
+
+extension Dictionary where Key == String, Value == Any? {
+    func pyNormalized() -> [String: Any] {
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
+    }
+}
+
+public struct EventData {
+    public let name: String
+    public let params: [String: Any]
+    
+    init(name: String, params: [String: Any?]) {
+        self.name = name.pyNormalized()
+        self.params = params.pyNormalized()
+    }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
+}
+        
+// Receives the params of a typed event without boxing its numbers
+public protocol EventParamVisitor: AnyObject {
+    func param(_ key: String, _ value: String)
+    func param(_ key: String, _ value: Int)
+    func param(_ key: String, _ value: Double)
+}
+
+extension EventParamVisitor {
+    func rawParam(_ key: String, _ value: Any) {
+        if let value = value as? String {
+            self.param(key, value.pyNormalized())
+        } else if let value = value as? Int {
+            self.param(key, value)
+        } else if let value = value as? Double {
+            self.param(key, value)
+        }
+    }
+}
+
+public protocol TypedEventData {
+    var name: String { get }
+    var paramCount: Int { get }
+    func forEachParam(_ visitor: EventParamVisitor)
+}
+
+private final class PyParamsCollector: EventParamVisitor {
+    var params: [String: Any]
+
+    init(capacity: Int) {
+        self.params = [String: Any](minimumCapacity: capacity)
+    }
+
+    func param(_ key: String, _ value: String) { self.params[key] = value }
+    func param(_ key: String, _ value: Int) { self.params[key] = value }
+    func param(_ key: String, _ value: Double) { self.params[key] = value }
+}
+
+extension TypedEventData {
+    // Map view of the params, only built when asked for
+    public var params: [String: Any] {
+        let collector = PyParamsCollector(capacity: self.paramCount)
+        self.forEachParam(collector)
+        return collector.params
+    }
+
+    public var eventData: EventData {
+        return EventData(normalizedName: self.name, params: self.params)
+    }
+}
+
+public struct GoldenEvents {
+    private init() {}
+
+
+    public struct Group0 {
+        private init() {}
+
+        
+        public struct Kind0: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind0("first value")
+            public static let second = Kind0(2)
+            public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+        }        
+
+        
+        public struct Kind1: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind1("first value")
+            public static let second = Kind1(2)
+            public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+        }        
+
+        public static let constant1 = "Constant Value 1"
+        public static let number3 = 4.50
+    
+        public static func method0(itemName: String, _ a2: Int) -> String {
+            return "value-0-\(itemName)-with-\(a2)"
+        }
+        public static func method2(itemName: String, _ a2: Int) -> String {
+            return "value-2-\(itemName)-with-\(a2)"
+        }
+        public static func method4(itemName: String, _ a2: Int) -> String {
+            return "value-4-\(itemName)-with-\(a2)"
+        }
+        public struct Event0Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: String
+            let p4: Double
+            public var name: String { return "event_0" }
+            public var paramCount: Int { return 8 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_0", self.p3.pyNormalized())
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p4)
+            }
+        }
+        public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+            return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+        }
+        public struct Event1Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: String
+            let p4: Double
+            public var name: String { return "event_1" }
+            public var paramCount: Int { return 8 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_0", self.p3.pyNormalized())
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p4)
+            }
+        }
+        public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+            return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+        }
+        public struct Event2Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: Double
+            public var name: String { return "event_2" }
+            public var paramCount: Int { return 7 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p3)
+            }
+        }
+        public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+            return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+        }
+    
+            public struct Subgroup {
+            private init() {}
+
+                
+            public struct Kind0: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind0("first value")
+                public static let second = Kind0(2)
+                public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+            }        
+
+                
+            public struct Kind1: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind1("first value")
+                public static let second = Kind1(2)
+                public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+            }        
+
+                public static let constant1 = "Constant Value 1"
+                public static let number3 = 4.50
+            
+                public static func method0(itemName: String, _ a2: Int) -> String {
+                    return "value-0-\(itemName)-with-\(a2)"
+                }
+                public static func method2(itemName: String, _ a2: Int) -> String {
+                    return "value-2-\(itemName)-with-\(a2)"
+                }
+                public static func method4(itemName: String, _ a2: Int) -> String {
+                    return "value-4-\(itemName)-with-\(a2)"
+                }
+                public struct Event0Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: String
+                    let p4: Double
+                    public var name: String { return "event_0" }
+                    public var paramCount: Int { return 8 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_0", self.p3.pyNormalized())
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p4)
+                    }
+                }
+                public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+                    return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                }
+                public struct Event1Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: String
+                    let p4: Double
+                    public var name: String { return "event_1" }
+                    public var paramCount: Int { return 8 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_0", self.p3.pyNormalized())
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p4)
+                    }
+                }
+                public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+                    return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                }
+                public struct Event2Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: Double
+                    public var name: String { return "event_2" }
+                    public var paramCount: Int { return 7 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p3)
+                    }
+                }
+                public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+                    return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+                }
+            
+                        public struct Subgroup {
+                private init() {}
+
+                            
+                public struct Kind0: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind0("first value")
+                    public static let second = Kind0(2)
+                    public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+                }        
+
+                            
+                public struct Kind1: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind1("first value")
+                    public static let second = Kind1(2)
+                    public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+                }        
+
+                            public static let constant1 = "Constant Value 1"
+                            public static let number3 = 4.50
+                        
+                            public static func method0(itemName: String, _ a2: Int) -> String {
+                                return "value-0-\(itemName)-with-\(a2)"
+                            }
+                            public static func method2(itemName: String, _ a2: Int) -> String {
+                                return "value-2-\(itemName)-with-\(a2)"
+                            }
+                            public static func method4(itemName: String, _ a2: Int) -> String {
+                                return "value-4-\(itemName)-with-\(a2)"
+                            }
+                            public struct Event0Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: String
+                                let p4: Double
+                                public var name: String { return "event_0" }
+                                public var paramCount: Int { return 8 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_0", self.p3.pyNormalized())
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p4)
+                                }
+                            }
+                            public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+                                return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                            }
+                            public struct Event1Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: String
+                                let p4: Double
+                                public var name: String { return "event_1" }
+                                public var paramCount: Int { return 8 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_0", self.p3.pyNormalized())
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p4)
+                                }
+                            }
+                            public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+                                return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                            }
+                            public struct Event2Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: Double
+                                public var name: String { return "event_2" }
+                                public var paramCount: Int { return 7 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p3)
+                                }
+                            }
+                            public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+                                return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+                            }
+                        }
+            }
+    }
+    public struct Group1 {
+        private init() {}
+
+        
+        public struct Kind0: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind0("first value")
+            public static let second = Kind0(2)
+            public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+        }        
+
+        
+        public struct Kind1: PyRawRepresentable {
+            let pyRawValue: Any
+            private init(_ value: Any) { self.pyRawValue = value }
+
+            public static let first = Kind1("first value")
+            public static let second = Kind1(2)
+            public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+        }        
+
+        public static let constant1 = "Constant Value 1"
+        public static let number3 = 4.50
+    
+        public static func method0(itemName: String, _ a2: Int) -> String {
+            return "value-0-\(itemName)-with-\(a2)"
+        }
+        public static func method2(itemName: String, _ a2: Int) -> String {
+            return "value-2-\(itemName)-with-\(a2)"
+        }
+        public static func method4(itemName: String, _ a2: Int) -> String {
+            return "value-4-\(itemName)-with-\(a2)"
+        }
+        public struct Event0Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: String
+            let p4: Double
+            public var name: String { return "event_0" }
+            public var paramCount: Int { return 8 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_0", self.p3.pyNormalized())
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p4)
+            }
+        }
+        public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+            return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+        }
+        public struct Event1Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: String
+            let p4: Double
+            public var name: String { return "event_1" }
+            public var paramCount: Int { return 8 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_0", self.p3.pyNormalized())
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p4)
+            }
+        }
+        public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+            return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+        }
+        public struct Event2Payload: TypedEventData {
+            let p0: String
+            let p1: Kind0
+            let p2: Int?
+            let p3: Double
+            public var name: String { return "event_2" }
+            public var paramCount: Int { return 7 }
+            public func forEachParam(_ visitor: EventParamVisitor) {
+                visitor.param("param_0", self.p0.pyNormalized())
+                visitor.param("fixed_1", 1)
+                visitor.rawParam("param_2", self.p1.pyRawValue)
+                visitor.param("fixed_3", 3)
+                if let p2 = self.p2 { visitor.param("param_4", p2) }
+                visitor.param("default_fixed_1", "default_value_1")
+                visitor.param("default_2", self.p3)
+            }
+        }
+        public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+            return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+        }
+    
+            public struct Subgroup {
+            private init() {}
+
+                
+            public struct Kind0: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind0("first value")
+                public static let second = Kind0(2)
+                public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+            }        
+
+                
+            public struct Kind1: PyRawRepresentable {
+                let pyRawValue: Any
+                private init(_ value: Any) { self.pyRawValue = value }
+
+                public static let first = Kind1("first value")
+                public static let second = Kind1(2)
+                public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+            }        
+
+                public static let constant1 = "Constant Value 1"
+                public static let number3 = 4.50
+            
+                public static func method0(itemName: String, _ a2: Int) -> String {
+                    return "value-0-\(itemName)-with-\(a2)"
+                }
+                public static func method2(itemName: String, _ a2: Int) -> String {
+                    return "value-2-\(itemName)-with-\(a2)"
+                }
+                public static func method4(itemName: String, _ a2: Int) -> String {
+                    return "value-4-\(itemName)-with-\(a2)"
+                }
+                public struct Event0Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: String
+                    let p4: Double
+                    public var name: String { return "event_0" }
+                    public var paramCount: Int { return 8 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_0", self.p3.pyNormalized())
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p4)
+                    }
+                }
+                public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+                    return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                }
+                public struct Event1Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: String
+                    let p4: Double
+                    public var name: String { return "event_1" }
+                    public var paramCount: Int { return 8 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_0", self.p3.pyNormalized())
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p4)
+                    }
+                }
+                public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+                    return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                }
+                public struct Event2Payload: TypedEventData {
+                    let p0: String
+                    let p1: Kind0
+                    let p2: Int?
+                    let p3: Double
+                    public var name: String { return "event_2" }
+                    public var paramCount: Int { return 7 }
+                    public func forEachParam(_ visitor: EventParamVisitor) {
+                        visitor.param("param_0", self.p0.pyNormalized())
+                        visitor.param("fixed_1", 1)
+                        visitor.rawParam("param_2", self.p1.pyRawValue)
+                        visitor.param("fixed_3", 3)
+                        if let p2 = self.p2 { visitor.param("param_4", p2) }
+                        visitor.param("default_fixed_1", "default_value_1")
+                        visitor.param("default_2", self.p3)
+                    }
+                }
+                public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+                    return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+                }
+            
+                        public struct Subgroup {
+                private init() {}
+
+                            
+                public struct Kind0: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind0("first value")
+                    public static let second = Kind0(2)
+                    public static func custom(customName: String) -> Kind0 { return Kind0(customName) }
+                }        
+
+                            
+                public struct Kind1: PyRawRepresentable {
+                    let pyRawValue: Any
+                    private init(_ value: Any) { self.pyRawValue = value }
+
+                    public static let first = Kind1("first value")
+                    public static let second = Kind1(2)
+                    public static func custom(customName: String) -> Kind1 { return Kind1(customName) }
+                }        
+
+                            public static let constant1 = "Constant Value 1"
+                            public static let number3 = 4.50
+                        
+                            public static func method0(itemName: String, _ a2: Int) -> String {
+                                return "value-0-\(itemName)-with-\(a2)"
+                            }
+                            public static func method2(itemName: String, _ a2: Int) -> String {
+                                return "value-2-\(itemName)-with-\(a2)"
+                            }
+                            public static func method4(itemName: String, _ a2: Int) -> String {
+                                return "value-4-\(itemName)-with-\(a2)"
+                            }
+                            public struct Event0Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: String
+                                let p4: Double
+                                public var name: String { return "event_0" }
+                                public var paramCount: Int { return 8 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_0", self.p3.pyNormalized())
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p4)
+                                }
+                            }
+                            public static func event0(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event0Payload {
+                                return Event0Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                            }
+                            public struct Event1Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: String
+                                let p4: Double
+                                public var name: String { return "event_1" }
+                                public var paramCount: Int { return 8 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_0", self.p3.pyNormalized())
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p4)
+                                }
+                            }
+                            public static func event1(param0: String, param2: Kind0, param4: Int?, default0: String, default2: Double) -> Event1Payload {
+                                return Event1Payload(p0: param0, p1: param2, p2: param4, p3: default0, p4: default2)
+                            }
+                            public struct Event2Payload: TypedEventData {
+                                let p0: String
+                                let p1: Kind0
+                                let p2: Int?
+                                let p3: Double
+                                public var name: String { return "event_2" }
+                                public var paramCount: Int { return 7 }
+                                public func forEachParam(_ visitor: EventParamVisitor) {
+                                    visitor.param("param_0", self.p0.pyNormalized())
+                                    visitor.param("fixed_1", 1)
+                                    visitor.rawParam("param_2", self.p1.pyRawValue)
+                                    visitor.param("fixed_3", 3)
+                                    if let p2 = self.p2 { visitor.param("param_4", p2) }
+                                    visitor.param("default_fixed_1", "default_value_1")
+                                    visitor.param("default_2", self.p3)
+                                }
+                            }
+                            public static func event2(param0: String, param2: Kind0, param4: Int?, default2: Double) -> Event2Payload {
+                                return Event2Payload(p0: param0, p1: param2, p2: param4, p3: default2)
+                            }
+                        }
+            }
+    }
+}
@@ -1,62 +1,598 @@
 #!/usr/bin/env python3
 
 import os
+import io
+import copy
+import time
 import json
-from pykotlinswift_const_creator import convertToKotlinFile, convertToSwiftFile, raiseException
+import stat
+import hashlib
+import tempfile
+from pykotlinswift_cache import GenerationCache, defaultCacheDirectory, defaultCacheMaxBytes, fileContentHash
 import sys
 
+# pykotlinswift_const_creator is only imported when something has to be generated,
+# so a cache hit doesn't pay for loading the generator.
+def raiseException(msg):
+    from pykotlinswift_const_creator import raiseException
+    raiseException(msg)
 
-def exportFile(eventsFilePath, classContent):
-    open(eventsFilePath, "w").write(classContent)
+class SettingsError(ValueError):
+    # Raised on invalid settings by the functions used as a library (e.g. by the daemon), which never exit;
+    # the command line reports it and exits with status 3
+    pass
 
 
-def exportAndroid(eventsJson, androidProjectEventsFilePath, className, version):    
-    kotlinFile = convertToKotlinFile(eventsJson, className, version) 
+class HashingFileWriter(io.RawIOBase):
+    def __init__(self, file):
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
 
-    exportFile(
+    def writable(self):
+        return True
+
+    def write(self, data):
+        written = self.file.write(data)
+        self.hash.update(memoryview(data)[:written])
+        self.size += written
+        return written
+
+    def close(self):
+        self.file.close()
+        super().close()
+
+
+class GenerationStats:
+    # Wall time per phase (the emitting phases per language), IR node counts, bytes written and cache hit rates,
+    # filled along a generation when --stats is given. Worker processes fill their own, merged by the parent.
+    phaseOrder = ["read", "cache", "json.loads", "parse", "generation", "assembly", "write"]
+
+    def __init__(self):
+        self.phases = {}
+        self.nodes = {}
+        self.files = {}
+
+    def addTime(self, phase, seconds, language=None):
+        key = (phase, language)
+        self.phases[key] = self.phases.get(key, 0) + seconds
+
+    def addNodes(self, counts):
+        for kind in counts:
+            self.nodes[kind] = self.nodes.get(kind, 0) + counts[kind]
+
+    def addFile(self, language, size, status):
+        files = self.files.setdefault(language, {"files": 0, "bytes": 0, "bytesWritten": 0})
+        files["files"] += 1
+        files["bytes"] += size
+        if (status != "unchanged"):
+            files["bytesWritten"] += size
+
+    def merge(self, other):
+        for (phase, language) in other.phases:
+            self.addTime(phase, other.phases[(phase, language)], language)
+        self.addNodes(other.nodes)
+        for language in other.files:
+            files = self.files.setdefault(language, {"files": 0, "bytes": 0, "bytesWritten": 0})
+            for key in files:
+                files[key] += other.files[language][key]
+
+    def report(self, cache=None):
+        phases = []
+        for (phase, language) in sorted(self.phases, key=lambda key: (self.phaseOrder.index(key[0]), key[1] or "")):
+            phases.append({"phase": phase, "language": language, "ms": self.phases[(phase, language)] * 1000})
+
+        caches = {}
+        if (cache != None):
+            caches["generation"] = {"hits": cache.hits, "misses": cache.misses}
+            if (cache.fragments != None):
+                caches["fragments"] = {"hits": cache.fragments.hits, "misses": cache.fragments.misses}
+        if ("pykotlinswift_const_creator" in sys.modules):
+            # Memoized functions of the generator, only loaded when something was generated
+            generator = sys.modules["pykotlinswift_const_creator"]
+            for function in [generator.camelCasedString, generator.tokenizeMask, generator.getMaskParamType]:
+                cacheInfo = function.cache_info()
+                caches[function.__name__] = {"hits": cacheInfo.hits, "misses": cacheInfo.misses}
+        for name in caches:
+            lookups = caches[name]["hits"] + caches[name]["misses"]
+            caches[name]["hitRate"] = (caches[name]["hits"] / lookups) if lookups > 0 else None
+
+        report = {"phases": phases, "nodes": self.nodes, "files": self.files, "caches": caches}
+        try:
+            import resource
+            # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            report["peakRssBytes"] = maxrss if sys.platform == "darwin" else maxrss * 1024
+        except ImportError:
+            pass
+        import tracemalloc
+        if (tracemalloc.is_tracing()):
+            report["peakTracedBytes"] = tracemalloc.get_traced_memory()[1]
+        return report
+
+    def reportText(self, cache=None):
+        report = self.report(cache)
+        lines = ["Generation stats:"]
+        for phase in report["phases"]:
+            lines.append("  %-12s %-8s %10.2f ms" % (phase["phase"], phase["language"] or "", phase["ms"]))
+        if (len(report["nodes"]) > 0):
+            lines.append("  nodes: %s" % ", ".join(["%s %d" % (kind, report["nodes"][kind]) for kind in report["nodes"]]))
+        for language in report["files"]:
+            files = report["files"][language]
+            lines.append("  %s: %d file(s), %d bytes generated, %d bytes written" % (language, files["files"], files["bytes"], files["bytesWritten"]))
+        for name in report["caches"]:
+            cacheStats = report["caches"][name]
+            hitRate = "-"
+            if (cacheStats["hitRate"] != None):
+                hitRate = "%.1f%%" % (cacheStats["hitRate"] * 100)
+            lines.append("  %s cache: %d hits, %d misses (%s)" % (name, cacheStats["hits"], cacheStats["misses"], hitRate))
+        if ("peakRssBytes" in report):
+            lines.append("  peak RSS: %.1f MB" % (report["peakRssBytes"] / (1024 * 1024)))
+        if ("peakTracedBytes" in report):
+            lines.append("  peak traced memory: %.1f MB" % (report["peakTracedBytes"] / (1024 * 1024)))
+        return "\n".join(lines)
+
+
+def exportFile(eventsFilePath, writeClassContent, stats=None, language=None):
+    return exportFiles([eventsFilePath], lambda files: writeClassContent(files[0]), stats, [language])[0]
+
+def exportFiles(eventsFilePaths, writeClassContents, stats=None, languages=None):
+    # The generated lines are streamed to temporary files next to the targets, which then atomically
+    # replace them, so a concurrent build never reads a half written file. Several files are written together
+    # when their content is generated in the same pass (see exportStreamedTarget).
+    # Returns the status ("created", "updated" or "unchanged") and the content hash of every file. An unchanged
+    # target is left untouched (keeping its mtime), so Gradle and Xcode don't recompile it.
+    if (languages == None):
+        languages = [None] * len(eventsFilePaths)
+    eventsFilePaths = [os.path.realpath(eventsFilePath) for eventsFilePath in eventsFilePaths]
+    temporaryFilePaths = []
+    try:
+        hashingWriters = []
+        files = []
+        for eventsFilePath in eventsFilePaths:
+            fileDescriptor, temporaryFilePath = tempfile.mkstemp(
+                dir=os.path.dirname(eventsFilePath),
+                prefix=".%s." % os.path.basename(eventsFilePath),
+                suffix=".tmp"
+            )
+            temporaryFilePaths.append(temporaryFilePath)
+            hashingWriters.append(HashingFileWriter(os.fdopen(fileDescriptor, "wb", buffering=0)))
+            files.append(io.TextIOWrapper(io.BufferedWriter(hashingWriters[-1])))
+
+        try:
+            writeClassContents(files)
+        finally:
+            for file in files:
+                file.close()
+
+        results = []
+        for (eventsFilePath, temporaryFilePath, hashingWriter, language) in zip(eventsFilePaths, temporaryFilePaths, hashingWriters, languages):
+            start = time.perf_counter()
+            status = "created"
+            contentHash = hashingWriter.hash.hexdigest()
+            if (os.path.exists(eventsFilePath)):
+                status = "updated"
+                if (os.path.getsize(eventsFilePath) == hashingWriter.size and fileContentHash(eventsFilePath) == contentHash):
+                    status = "unchanged"
+                    os.remove(temporaryFilePath)
+                else:
+                    os.chmod(temporaryFilePath, stat.S_IMODE(os.stat(eventsFilePath).st_mode))
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temporaryFilePath, 0o666 & ~umask)
+
+            if (status != "unchanged"):
+                os.replace(temporaryFilePath, eventsFilePath)
+            if (stats != None):
+                stats.addTime("write", time.perf_counter() - start, language)
+                stats.addFile(language, hashingWriter.size, status)
+            results.append((status, contentHash))
+        return results
+    except BaseException:
+        for temporaryFilePath in temporaryFilePaths:
+            if (os.path.exists(temporaryFilePath)):
+                os.remove(temporaryFilePath)
+        raise
+
+
+def reportExport(target, filePath, status):
+    print("%s: %s (%s)" % (target, status, filePath))
+
+
+def exportAndroid(template, androidProjectEventsFilePath, androidClassPackage, version, fragmentCache=None, stats=None, shard=None, typedPayloads=False, registry=None):    
+    from pykotlinswift_const_creator import writeKotlinFile
+
+    return exportFile(
         eventsFilePath= androidProjectEventsFilePath,
-        classContent= kotlinFile
+        writeClassContent= lambda file: writeKotlinFile(template, file, version, header=androidClassPackage, fragmentCache=fragmentCache, stats=stats, shard=shard, typedPayloads=typedPayloads, registry=registry),
+        stats= stats,
+        language= "Kotlin"
     )
 
-def exportIOS(eventsJson, iOSProjectEventsFilePath, className, version):            
-    swiftFile = convertToSwiftFile(eventsJson, className, version)
+def exportIOS(template, iOSProjectEventsFilePath, version, fragmentCache=None, stats=None, shard=None, typedPayloads=False, registry=None):            
+    from pykotlinswift_const_creator import writeSwiftFile
 
-    exportFile(
+    return exportFile(
         eventsFilePath= iOSProjectEventsFilePath,
-        classContent= swiftFile
+        writeClassContent= lambda file: writeSwiftFile(template, file, version, fragmentCache=fragmentCache, stats=stats, shard=shard, typedPayloads=typedPayloads, registry=registry),
+        stats= stats,
+        language= "Swift"
     )
 
-def export(jsonFilePath, iosFilePath, androidFilePath, className, androidClassPackage, version):
-    eventsJsonFile = open(jsonFilePath)
-    eventsJson = eventsJsonFile.read()
-    eventsJsonFile.close()
+class ExportTarget:
+    # One settings target: a template emitted to a swift and a kotlin file
+    def __init__(self, jsonFilePath, iosFilePath, androidFilePath, className, androidClassPackage, version, name=None, stream=False, shard=False, typedPayloads=False, registryFilePath=None):
+        self.jsonFilePath = jsonFilePath
+        self.iosFilePath = iosFilePath
+        self.androidFilePath = androidFilePath
+        self.className = className
+        self.androidClassPackage = androidClassPackage
+        self.version = version
+        self.name = name
+        if (self.name == None):
+            self.name = className
+        # A streamed template is never loaded whole, see exportStreamedTarget
+        self.stream = stream
+        # A sharded target is written to a file per top-level group, see shardExportJobs
+        self.shard = shard
+        # Events are generated as typed payloads instead of EventData maps
+        self.typedPayloads = typedPayloads
+        # When set, an event registry is written after the root class and its JSON manifest to this path
+        self.registryFilePath = registryFilePath
 
-    exportIOS(
-        eventsJson= eventsJson,
-        iOSProjectEventsFilePath = iosFilePath,
-        className = className,
-        version = version
-    )
+class TargetResult:
+    # Outcome of a target: its generation time, the (target, filePath, status) of each of its files and the
+    # real paths of the files included by its template
+    def __init__(self, target, elapsed, files, cacheHit=False, includedFiles=()):
+        self.target = target
+        self.elapsed = elapsed
+        self.files = files
+        self.cacheHit = cacheHit
+        self.includedFiles = includedFiles
 
-    exportAndroid(
-        eventsJson= eventsJson,
-        androidProjectEventsFilePath = androidFilePath,
-        className = className,
-        version = version
-    )
+class ExportJob:
+    # One generated file: the template (by key), or one shard of it, emitted in one language.
+    # The event registry written in the file, if any, is given by key too, as jobs are pickled to the workers.
+    def __init__(self, target, templateKey, language, filePath, header, version, shard=None, typedPayloads=False, registryKey=None):
+        self.target = target
+        self.templateKey = templateKey
+        self.language = language
+        self.filePath = filePath
+        self.header = header
+        self.version = version
+        self.shard = shard
+        self.typedPayloads = typedPayloads
+        self.registryKey = registryKey
+
+def exportJobFile(template, job, fragmentCache=None, stats=None, registry=None):
+    # Returns the status, the content hash and the generation time of the job's file
+    start = time.perf_counter()
+    if (job.language == "Kotlin"):
+        (status, contentHash) = exportAndroid(template, job.filePath, job.header, job.version, fragmentCache, stats, job.shard, job.typedPayloads, registry)
+    else:
+        (status, contentHash) = exportIOS(template, job.filePath, job.version, fragmentCache, stats, job.shard, job.typedPayloads, registry)
+    return (status, contentHash, time.perf_counter() - start)
+
+# State of the export worker processes, set by initExportWorker. With the fork start method the parsed
+# templates, the event registries and the loaded fragment cache are inherited from the parent instead of being pickled.
+workerTemplates = None
+workerRegistries = None
+workerFragmentCache = None
+workerCollectsStats = False
+
+def initExportWorker(templates, registries, fragmentCache, collectStats=False):
+    global workerTemplates, workerRegistries, workerFragmentCache, workerCollectsStats
+    workerTemplates = templates
+    workerRegistries = registries
+    workerFragmentCache = fragmentCache
+    workerCollectsStats = collectStats
+
+def runExportJob(job):
+    jobStats = None
+    if (workerCollectsStats):
+        jobStats = GenerationStats()
+    (status, contentHash, elapsed) = exportJobFile(workerTemplates[job.templateKey], job, workerFragmentCache, jobStats, workerRegistries.get(job.registryKey))
+    fragmentUpdates = None
+    if (workerFragmentCache != None):
+        fragmentUpdates = workerFragmentCache.takeUpdates()
+    return (status, contentHash, elapsed, fragmentUpdates, jobStats)
+
+def runExportJobs(templates, exportJobs, jobs=1, fragmentCache=None, stats=None, registries=None):
+    # Returns the (status, contentHash, elapsed) of every job, in the order of exportJobs whatever the scheduling
+    if (registries == None):
+        registries = {}
+    if (jobs <= 1 or len(exportJobs) <= 1):
+        return [exportJobFile(templates[job.templateKey], job, fragmentCache, stats, registries.get(job.registryKey)) for job in exportJobs]
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = None
+    if ("fork" in multiprocessing.get_all_start_methods()):
+        context = multiprocessing.get_context("fork")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=min(jobs, len(exportJobs)), mp_context=context, initializer=initExportWorker, initargs=(templates, registries, fragmentCache, stats != None)) as pool:
+        futures = [pool.submit(runExportJob, job) for job in exportJobs]
+        for future in futures:
+            (status, contentHash, elapsed, fragmentUpdates, jobStats) = future.result()
+            # Subgroup blocks generated by the workers are merged, so the parent saves them once
+            if (fragmentUpdates != None):
+                fragmentCache.mergeUpdates(fragmentUpdates)
+            if (jobStats != None):
+                stats.merge(jobStats)
+            results.append((status, contentHash, elapsed))
+    return results
+
+def exportStreamedTarget(target, fragmentCache=None, stats=None, registry=None, includeLoader=None):
+    # Both files are written in a single pass over the template, which is read one top-level group at a time.
+    # Returns the (status, contentHash, elapsed) of the swift and kotlin files, as runExportJobs does.
+    # registry, when given, is filled along the pass.
+    from pykotlinswift_const_creator import writeStreamedTemplateFiles, SwiftClass, KotlinClass
+
+    start = time.perf_counter()
+    swiftClass = SwiftClass()
+    kotlinClass = KotlinClass()
+    swiftClass.typedPayloads = target.typedPayloads
+    kotlinClass.typedPayloads = target.typedPayloads
+    try:
+        results = exportFiles(
+            eventsFilePaths=[target.iosFilePath, target.androidFilePath],
+            writeClassContents=lambda files: writeStreamedTemplateFiles(target.jsonFilePath, target.className, [
+                (swiftClass, files[0], None),
+                (kotlinClass, files[1], target.androidClassPackage)
+            ], target.version, fragmentCache, registry, includeLoader, stats),
+            stats=stats,
+            languages=["Swift", "Kotlin"]
+        )
+    except ValueError as error:
+        error.templatePath = target.jsonFilePath
+        raise
+    elapsed = (time.perf_counter() - start) / len(results)
+    return [(status, contentHash, elapsed) for (status, contentHash) in results]
+
+def shardExportJobs(target, templateKey, template, registryKey=None):
+    # Next to each output file: <file>Runtime with EventData and its helpers, and a file per top-level group
+    # (<file>+<Group>.swift and <file>_<Group>.kt), while the output file keeps the members of the root class
+    from pykotlinswift_const_creator import runtimeShard, rootShard
+
+    exportJobs = []
+    for (fileTarget, language, filePath, header, separator) in [
+        ("iosfile", "Swift", target.iosFilePath, None, "+"),
+        ("androidfile", "Kotlin", target.androidFilePath, target.androidClassPackage, "_")
+    ]:
+        (stem, extension) = os.path.splitext(filePath)
+        exportJobs.append(ExportJob(fileTarget, templateKey, language, filePath, header, target.version, rootShard, target.typedPayloads, registryKey))
+        exportJobs.append(ExportJob(fileTarget, templateKey, language, "%sRuntime%s" % (stem, extension), header, target.version, runtimeShard, target.typedPayloads))
+        for (index, subgroup) in enumerate(template.subgroups):
+            shardFilePath = "%s%s%s%s" % (stem, separator, subgroup.name, extension)
+            exportJobs.append(ExportJob(fileTarget, templateKey, language, shardFilePath, header, target.version, index, target.typedPayloads))
+    return exportJobs
+
+def isShardFileOf(filePath, className):
+    with open(filePath, "rb") as file:
+        start = file.read(4096)
+    return (b"shard of %s generated by pykotlinswift" % className.encode("utf-8")) in start or (b"runtime of %s generated by pykotlinswift" % className.encode("utf-8")) in start
+
+def removeStaleShardFiles(target, exportedFilePaths):
+    # Shards of groups removed from the template, or of a target which is no longer sharded, would still be
+    # compiled along the new files. Only files generated as shards of the target's class are removed.
+    # Returns the (target, filePath, "removed") of every removed file.
+    removedFiles = []
+    for (fileTarget, filePath, separator) in [("iosfile", target.iosFilePath, "+"), ("androidfile", target.androidFilePath, "_")]:
+        directory = os.path.dirname(os.path.realpath(filePath))
+        (stem, extension) = os.path.splitext(os.path.basename(filePath))
+        if (not os.path.isdir(directory)):
+            continue
+        for fileName in sorted(os.listdir(directory)):
+            if (not fileName.endswith(extension)):
+                continue
+            if (not fileName.startswith(stem + separator) and fileName != "%sRuntime%s" % (stem, extension)):
+                continue
+            shardFilePath = os.path.join(directory, fileName)
+            if (shardFilePath in exportedFilePaths or not os.path.isfile(shardFilePath)):
+                continue
+            if (isShardFileOf(shardFilePath, target.className)):
+                os.remove(shardFilePath)
+                removedFiles.append((fileTarget, os.path.join(os.path.dirname(filePath), fileName), "removed"))
+    return removedFiles
+
+def exportRegistryManifest(target, registry):
+    # The JSON manifest of the target's events, reporting the event names sent by more than one method and the
+    # events left out of the generated registry. Returns the status and the content hash of the manifest.
+    duplicates = registry.duplicates()
+    for name in duplicates:
+        print("Warning: event %s is sent by %d methods: %s" % (name, len(duplicates[name]), ", ".join(duplicates[name])))
+    for registryEvent in registry.unregisteredEvents():
+        print("Warning: event %s (%s) is only in the registry manifest, its name or keys are normalized at runtime" % (registryEvent.event.eventName, registryEvent.method))
+
+    def writeManifest(file):
+        json.dump(registry.manifest(), file, indent=2)
+        file.write("\n")
+
+    return exportFile(target.registryFilePath, writeManifest)
+
+def exportTargets(targets, cache=None, jobs=1, parsedGroups=None, stats=None):
+    # Every template file is read and parsed once, however many targets share it, and the files of all the
+    # targets are generated in a single run of export jobs.
+    # parsedGroups keeps the parsed subgroups of each template path from one call to the next (see watchSettingsFile).
+    templateContents = {}
+    templateHashes = {}
+    streamedTargets = []
+    parsedTemplates = {}
+    templates = {}
+    exportJobs = []
+    targetJobs = {}
+    targetCacheKeys = {}
+    targetTimes = {}
+    targetRegistries = {}
+    registries = {}
+    fragmentCache = None
+    # Files included by several templates are read and expanded once (see TemplateIncludeLoader)
+    includeLoader = None
+    # The registry needs every event, so the templates it is written for are parsed whole, subgroups found in
+    # the fragment cache included (their lines are still spliced from it)
+    registryTemplatePaths = set([os.path.realpath(target.jsonFilePath) for target in targets if target.registryFilePath != None])
+    # A subgroup is only taken from the fragment cache when it is cached for all the generated variants
+    fragmentLanguages = []
+    for target in targets:
+        for language in ["Kotlin", "Swift"]:
+            if (target.typedPayloads):
+                language = "%s+typed" % language
+            if (language not in fragmentLanguages):
+                fragmentLanguages.append(language)
+
+    for target in targets:
+        start = time.perf_counter()
+        templatePath = os.path.realpath(target.jsonFilePath)
+        if (target.stream):
+            if (templatePath not in templateHashes):
+                templateHashes[templatePath] = fileContentHash(templatePath)
+        elif (templatePath not in templateContents):
+            eventsJsonFile = open(target.jsonFilePath, "rb")
+            templateContents[templatePath] = eventsJsonFile.read()
+            eventsJsonFile.close()
+            if (stats != None):
+                stats.addTime("read", time.perf_counter() - start)
+        eventsJson = templateContents.get(templatePath)
+
+        if (cache != None):
+            lookupStart = time.perf_counter()
+            cacheKey = cache.generationKey(eventsJson, [
+                target.className,
+                target.androidClassPackage,
+                target.version,
+                os.path.realpath(target.iosFilePath),
+                os.path.realpath(target.androidFilePath),
+                target.shard,
+                target.typedPayloads,
+                target.registryFilePath and os.path.realpath(target.registryFilePath)
+            ], templateHashes.get(templatePath))
+            cacheHit = cache.lookup(cacheKey)
+            if (stats != None):
+                stats.addTime("cache", time.perf_counter() - lookupStart)
+            targetCacheKeys[target] = cacheKey
+            if (cacheHit):
+                targetTimes[target] = time.perf_counter() - start
+                continue
+            # Subgroups that didn't change since they were last generated are spliced from the fragment cache
+            fragmentCache = cache.fragmentCache()
+            fragmentCache.languages = fragmentLanguages
+
+        if (includeLoader == None):
+            from pykotlinswift_const_creator import TemplateIncludeLoader
+            includeLoader = TemplateIncludeLoader()
+
+        if (target.stream):
+            if (target.shard):
+                raise SettingsError("Target %s: a streamed template can't be sharded, use either one or the other." % target.name)
+            targetJobs[target] = [
+                ExportJob("iosfile", None, "Swift", target.iosFilePath, None, target.version),
+                ExportJob("androidfile", None, "Kotlin", target.androidFilePath, target.androidClassPackage, target.version)
+            ]
+            if (target.registryFilePath != None):
+                from pykotlinswift_const_creator import EventRegistry
+                targetRegistries[target] = EventRegistry(target.className)
+            streamedTargets.append(target)
+            targetTimes[target] = time.perf_counter() - start
+            continue
 
-    # Inserting zoom kotlin class package definition
-    kotlinFile = open(androidFilePath, "r")
-    kotlinFileContent = "%s\n\n%s" % (androidClassPackage, kotlinFile.read())
-    kotlinFile.close()
-    kotlinFile = open(androidFilePath, "w")
-    kotlinFile.write(kotlinFileContent)
-    kotlinFile.close()    
+        templateKey = (templatePath, target.className)
+        if (templateKey not in templates):
+            if (templatePath not in parsedTemplates):
+                from pykotlinswift_const_creator import parseTemplate
+                templateGroups = None
+                if (parsedGroups != None):
+                    templateGroups = parsedGroups.setdefault(templatePath, {})
+                try:
+                    parsedTemplates[templatePath] = parseTemplate(eventsJson, target.className, fragmentCache, templateGroups, stats, templatePath not in registryTemplatePaths, includeLoader, templatePath)
+                except ValueError as error:
+                    error.templatePath = target.jsonFilePath
+                    raise
+                if (stats != None):
+                    from pykotlinswift_const_creator import countTemplateNodes
+                    stats.addNodes(countTemplateNodes(parsedTemplates[templatePath]))
+            template = parsedTemplates[templatePath]
+            if (template.name != target.className):
+                # Only the root class name differs between the targets sharing a template
+                template = copy.copy(template)
+                template.name = target.className
+            templates[templateKey] = template
+
+        # The registry of a template is the same for all its targets, and is given to the jobs by key like the template
+        registryKey = None
+        if (target.registryFilePath != None):
+            if (templateKey not in registries):
+                from pykotlinswift_const_creator import buildEventRegistry
+                registries[templateKey] = buildEventRegistry(templates[templateKey])
+            registryKey = templateKey
+            targetRegistries[target] = registries[templateKey]
+
+        # The template is shared by both language emitters, the kotlin class package definition is written as the file header
+        if (target.shard):
+            targetJobs[target] = shardExportJobs(target, templateKey, templates[templateKey], registryKey)
+        else:
+            targetJobs[target] = [
+                ExportJob("iosfile", templateKey, "Swift", target.iosFilePath, None, target.version, typedPayloads=target.typedPayloads, registryKey=registryKey),
+                ExportJob("androidfile", templateKey, "Kotlin", target.androidFilePath, target.androidClassPackage, target.version, typedPayloads=target.typedPayloads, registryKey=registryKey)
+            ]
+        exportJobs.extend(targetJobs[target])
+        targetTimes[target] = time.perf_counter() - start
+
+    results = runExportJobs(templates, exportJobs, jobs, fragmentCache, stats, registries)
+    jobResults = dict(zip(exportJobs, results))
+    for target in streamedTargets:
+        jobResults.update(zip(targetJobs[target], exportStreamedTarget(target, fragmentCache, stats, targetRegistries.get(target), includeLoader)))
+
+    targetResults = []
+    for target in targets:
+        if (target not in targetJobs):
+            files = [
+                ("iosfile", target.iosFilePath, "unchanged"),
+                ("androidfile", target.androidFilePath, "unchanged")
+            ]
+            if (target.registryFilePath != None):
+                files.append(("registry", target.registryFilePath, "unchanged"))
+            targetResults.append(TargetResult(target, targetTimes[target], files, cacheHit=True, includedFiles=cache.dependencies(targetCacheKeys[target])))
+            continue
+
+        outputHashes = {}
+        elapsed = targetTimes[target]
+        for job in targetJobs[target]:
+            (status, contentHash, jobElapsed) = jobResults[job]
+            outputHashes[os.path.realpath(job.filePath)] = contentHash
+            elapsed += jobElapsed
+
+        files = [(job.target, job.filePath, jobResults[job][0]) for job in targetJobs[target]]
+        files.extend(removeStaleShardFiles(target, outputHashes))
+        if (target in targetRegistries):
+            (status, contentHash) = exportRegistryManifest(target, targetRegistries[target])
+            outputHashes[os.path.realpath(target.registryFilePath)] = contentHash
+            files.append(("registry", target.registryFilePath, status))
+        includedFiles = sorted(includeLoader.includedFiles(target.jsonFilePath))
+        targetResults.append(TargetResult(target, elapsed, files, includedFiles=includedFiles))
+
+        if (cache != None):
+            cache.store(targetCacheKeys[target], outputHashes, dict([(filePath, includeLoader.fileHashes[filePath]) for filePath in includedFiles]))
+    return targetResults
+
+def reportTargetResults(targetResults, reportTimings=False):
+    for result in targetResults:
+        if (reportTimings):
+            print("target %s: %.2f ms" % (result.target.name, result.elapsed * 1000))
+        if (result.cacheHit):
+            print("Template and settings unchanged since the last generation (cache hit)")
+        for (fileTarget, filePath, status) in result.files:
+            reportExport(fileTarget, filePath, status)
+
+def export(jsonFilePath, iosFilePath, androidFilePath, className, androidClassPackage, version, cache=None, jobs=1, stats=None, stream=False, shard=False, typedPayloads=False, registryFilePath=None):
+    reportTargetResults(exportTargets([ExportTarget(jsonFilePath, iosFilePath, androidFilePath, className, androidClassPackage, version, stream=stream, shard=shard, typedPayloads=typedPayloads, registryFilePath=registryFilePath)], cache, jobs, stats=stats))
 
 def getArgument(key, args):
         for arg in args:
-            keyValue = arg.split("=")
-            if (keyValue[0] == key):
+            keyValue = arg.split("=", 1)
+            if (keyValue[0] == key and len(keyValue) > 1):
                 value = keyValue[1]
                 if (value != None and len(value) > 0):
                     return value
@@ -73,34 +609,115 @@ def getPathArgument(key, args):
         
         raiseException("Param %s does not contain a valid file path" % key)
 
-def exportFromArgs(args):
+def getJobsArgument(args):
+    # Accepts jobs=N, --jobs=N and --jobs N
+    jobs = getArgument("jobs", args)
+    if (jobs == None):
+        jobs = getArgument("--jobs", args)
+    if (jobs == None and "--jobs" in args):
+        index = args.index("--jobs")
+        if (index + 1 < len(args)):
+            jobs = args[index + 1]
+    if (jobs == None):
+        return 1
+    try:
+        return max(1, int(jobs))
+    except ValueError:
+        raise SettingsError("jobs must be a positive integer")
+
+def getStatsArgument(args):
+    # Accepts --stats (text report), --stats=json and stats=text|json
+    statsFormat = getArgument("stats", args)
+    if (statsFormat == None):
+        statsFormat = getArgument("--stats", args)
+    if (statsFormat == None and "--stats" in args):
+        statsFormat = "text"
+    if (statsFormat != None and statsFormat not in ["text", "json"]):
+        raiseException("Unknown stats format %s, use text or json" % statsFormat)
+    return statsFormat
+
+def createCacheFromArgs(args):
+    if ("--no-cache" in args):
+        return None
+
+    cacheDirectory = getArgument("cachedir", args)
+    if (cacheDirectory == None):
+        cacheDirectory = defaultCacheDirectory
+
+    cacheMaxBytes = defaultCacheMaxBytes
+    cacheSize = getArgument("cachesize", args)
+    if (cacheSize != None):
+        cacheMaxBytes = int(cacheSize) * 1024 * 1024
+
+    return GenerationCache(directory=cacheDirectory, maxBytes=cacheMaxBytes)
+
+def reportTemplateDiagnostics(templatePath, diagnostics):
+    for diagnostic in diagnostics:
+        print("Error: %s %s: %s" % (templatePath, diagnostic.path, diagnostic.message))
+    print("%d problem(s) found in %s" % (len(diagnostics), templatePath))
+
+def checkTemplates(templatePaths):
+    # Validates the templates without generating anything, returning the number of problems found
+    from pykotlinswift_const_creator import validateTemplate
+
+    problemCount = 0
+    for templatePath in templatePaths:
+        templateFile = open(templatePath, "rb")
+        diagnostics = validateTemplate(templateFile.read(), templatePath)
+        templateFile.close()
+        if (len(diagnostics) == 0):
+            print("%s: valid" % templatePath)
+        else:
+            reportTemplateDiagnostics(templatePath, diagnostics)
+        problemCount += len(diagnostics)
+    return problemCount
+
+def checkFromArgs(args, jsonSettingsPath=None):
+    templatePaths = []
+    if (jsonSettingsPath != None):
+        settingsJsonFile = open(jsonSettingsPath)
+        targets = getSettingsTargets(json.loads(settingsJsonFile.read()))
+        settingsJsonFile.close()
+        for target in targets:
+            if (target.jsonFilePath not in templatePaths):
+                templatePaths.append(target.jsonFilePath)
+    else:
+        jsonFilePath = getPathArgument("json", args)
+        if (jsonFilePath == None):
+            raiseException("Missing param 'json', please inform the json file containing the events to check.")
+        templatePaths.append(jsonFilePath)
+
+    if (checkTemplates(templatePaths) > 0):
+        exit(3)
+
+def exportFromArgs(args, cache=None, jobs=1, stats=None):
     if (len(args) == 0):
         raiseException("Missing arguments classname, json, iosfile and androidfile using the pattern <param>=<value> (Separating param name and value with an '=' without spaces.)")
 
-    def getArgument(key):
+    def argument(key):
         return getArgument(key, args)
 
-    def getPathArgument(key):
+    def pathArgument(key):
         return getPathArgument(key, args)
     
-    jsonFilePath = getPathArgument("json")
+    jsonFilePath = pathArgument("json")
     if (jsonFilePath == None):
         raiseException("Missing param 'json', please inform the json file containing the events to generate the code.")
 
-    iosFilePath = getPathArgument("iosfile")
+    iosFilePath = pathArgument("iosfile")
     if (iosFilePath == None):
         raiseException("Missing param 'iosfile', please inform the swift file to output the generated code.")
 
-    androidFilePath = getPathArgument("androidfile")
+    androidFilePath = pathArgument("androidfile")
     if (androidFilePath == None):
         raiseException("Missing param 'androidfile', please inform the kotlin file to output the generated code.")
 
-    className = getArgument("classname")
+    className = argument("classname")
     if (className == None):
         print("classname not specified, using 'HelloWorld' instead.")
         className = "HelloWorld"
 
-    androidClassPackage = getArgument("androidpackage")    
+    androidClassPackage = argument("androidpackage")    
     if (androidClassPackage == None):
         print("androidpackage not specified, which will cause problems to be imported by other classes in the project")
         androidClassPackage = "// package not specified in the pykotlinswift call"
@@ -113,30 +730,216 @@ def exportFromArgs(args):
         androidFilePath=androidFilePath,
         className=className,
         androidClassPackage=androidClassPackage,
-        version=getArgument("version")
+        version=argument("version"),
+        cache=cache,
+        jobs=jobs,
+        stats=stats,
+        stream="--stream" in args,
+        shard="--shard" in args,
+        typedPayloads="--typed-payloads" in args,
+        registryFilePath=argument("registry")
     )
 
-def exportFromSettingsFile(settingsFilePath):
+def getSettingsTarget(settingsObject, defaults):
+    # The keys of a target override the ones given at the settings root
+    settings = dict(defaults)
+    settings.update(settingsObject)
+
+    def setting(key):
+        if (key not in settings):
+            raise SettingsError("Missing setting '%s' in the settings file target %s" % (key, settings.get("_name", settings.get("_rootClassName"))))
+        return settings[key]
+
+    return ExportTarget(
+        jsonFilePath=setting("_jsonTemplateFilePath"),
+        iosFilePath=setting("_iosOutputFilePath"),
+        androidFilePath=setting("_androidOutputFilePath"),
+        className=setting("_rootClassName"),
+        androidClassPackage=setting("_androidClassPackage"),
+        version=setting("_version"),
+        name=settings.get("_name"),
+        stream=settings.get("_stream", False),
+        shard=settings.get("_shard", False),
+        typedPayloads=settings.get("_typedPayloads", False),
+        registryFilePath=settings.get("_registryFilePath")
+    )
+
+def getSettingsTargets(settingsObject):
+    if ("_targets" not in settingsObject):
+        return [getSettingsTarget(settingsObject, {})]
+
+    defaults = dict(settingsObject)
+    del defaults["_targets"]
+    return [getSettingsTarget(targetObject, defaults) for targetObject in settingsObject["_targets"]]
+
+def exportFromSettingsFile(settingsFilePath, cache=None, jobs=1, stats=None, stream=False, shard=False, typedPayloads=False):
     settingsJsonFile = open(settingsFilePath)
     settingsObject = json.loads(settingsJsonFile.read())
     settingsJsonFile.close()
 
-    export(
-        jsonFilePath=settingsObject["_jsonTemplateFilePath"],
-        iosFilePath=settingsObject["_iosOutputFilePath"],
-        androidFilePath=settingsObject["_androidOutputFilePath"],
-        className=settingsObject["_rootClassName"],
-        androidClassPackage=settingsObject["_androidClassPackage"],
-        version=settingsObject["_version"]
-    )
+    start = time.perf_counter()
+    targets = getSettingsTargets(settingsObject)
+    if (stream):
+        for target in targets:
+            target.stream = True
+    if (shard):
+        for target in targets:
+            target.shard = True
+    if (typedPayloads):
+        for target in targets:
+            target.typedPayloads = True
+
+    if ("_targets" not in settingsObject):
+        reportTargetResults(exportTargets(targets, cache, jobs, stats=stats))
+        return
+
+    reportTargetResults(exportTargets(targets, cache, jobs, stats=stats), reportTimings=True)
+    print("%d targets: %.2f ms" % (len(targets), (time.perf_counter() - start) * 1000))
     
     
+def watchedFileState(filePath):
+    try:
+        fileStat = os.stat(filePath)
+    except OSError:
+        return None # Editors saving by replacing the file can leave it missing for a moment
+    return (fileStat.st_mtime_ns, fileStat.st_size)
+
+def watchFiles(filePaths, fileStates, fileHashes):
+    for filePath in filePaths:
+        if (filePath not in fileStates):
+            fileStates[filePath] = watchedFileState(filePath)
+            fileHashes[filePath] = fileContentHash(filePath)
+
+def watchSettingsFile(settingsFilePath, cache=None, jobs=1, interval=0.5, debounce=0.3):
+    # Generates the targets of the settings file, then keeps polling the settings and template files and
+    # regenerates the targets whose template (or a file it includes) changed. The process stays alive, so the parsed
+    # subgroups, the normalized names, the mask tokens and the fragment cache are all reused from one generation to the next.
+    parsedGroups = {}
+    includedFiles = {} # template real path -> real paths of the files it includes
+    fileStates = {}
+    fileHashes = {}
+    targets = []
+    changedPaths = None
+
+    while True:
+        try:
+            if (changedPaths == None or os.path.realpath(settingsFilePath) in changedPaths):
+                settingsJsonFile = open(settingsFilePath)
+                targets = getSettingsTargets(json.loads(settingsJsonFile.read()))
+                settingsJsonFile.close()
+                changedTargets = targets
+            else:
+                changedTargets = []
+                for target in targets:
+                    templatePath = os.path.realpath(target.jsonFilePath)
+                    if (templatePath in changedPaths or len(changedPaths.intersection(includedFiles.get(templatePath, ()))) > 0):
+                        changedTargets.append(target)
+
+            templatePaths = set([os.path.realpath(target.jsonFilePath) for target in targets])
+            for filePath in list(parsedGroups):
+                if (filePath not in templatePaths):
+                    del parsedGroups[filePath]
+
+            # The files included by the templates are only known once they are parsed, so they are watched after
+            watchedPaths = set([os.path.realpath(settingsFilePath)]).union(templatePaths)
+            watchFiles(watchedPaths, fileStates, fileHashes)
+            start = time.perf_counter()
+            targetResults = exportTargets(changedTargets, cache, jobs, parsedGroups)
+            for result in targetResults:
+                includedFiles[os.path.realpath(result.target.jsonFilePath)] = result.includedFiles
+            for templatePath in templatePaths:
+                watchedPaths.update(includedFiles.get(templatePath, ()))
+            watchFiles(watchedPaths, fileStates, fileHashes)
+            reportTargetResults(targetResults, reportTimings=len(targets) > 1)
+            if (cache != None):
+                cache.save()
+            print("Generated in %.2f ms, watching %d files for changes (Ctrl+C to stop)" % ((time.perf_counter() - start) * 1000, len(watchedPaths)))
+        except Exception as error:
+            # A half saved or invalid template only fails this generation, the next save is picked up
+            print("Error: %s" % error)
+            print("Generation failed, watching for the next change (Ctrl+C to stop)")
+
+        changedPaths = set()
+        while (len(changedPaths) == 0):
+            time.sleep(interval)
+            if (all(watchedFileState(filePath) == fileStates[filePath] for filePath in fileStates)):
+                continue
+
+            # Bursts of saves are debounced: the files must stay the same for a whole debounce period
+            states = None
+            while (states != fileStates):
+                states = fileStates
+                time.sleep(debounce)
+                fileStates = dict((filePath, watchedFileState(filePath)) for filePath in fileStates)
+
+            # A touched file whose content is the same is not a change
+            for filePath in fileStates:
+                if (fileStates[filePath] == None):
+                    continue
+                contentHash = fileContentHash(filePath)
+                if (contentHash != fileHashes[filePath]):
+                    fileHashes[filePath] = contentHash
+                    changedPaths.add(filePath)
+
+
 if __name__ == '__main__':
     args = sys.argv[1:]
+    cache = createCacheFromArgs(args)
+    try:
+        jobs = getJobsArgument(args)
+    except SettingsError as error:
+        print("Error: %s" % error)
+        exit(3)
     jsonSettingsPath = getPathArgument("settings", args)
-    if jsonSettingsPath != None:
-        exportFromSettingsFile(jsonSettingsPath)
-    else:
-        exportFromArgs(args)
-    
-    
\ No newline at end of file
+
+    stats = None
+    statsFormat = getStatsArgument(args)
+    if (statsFormat != None):
+        stats = GenerationStats()
+        if ("--trace-memory" in args):
+            # Python heap peak, at the cost of slowing down every phase while tracing
+            import tracemalloc
+            tracemalloc.start()
+
+    profiler = None
+    profilePath = getArgument("profile", args)
+    if (profilePath != None):
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        if ("--check" in args):
+            checkFromArgs(args, jsonSettingsPath)
+        elif (len(args) > 0 and args[0] == "watch"):
+            if (jsonSettingsPath == None):
+                raiseException("Missing param 'settings', watch mode needs the settings file of the targets to regenerate.")
+            try:
+                watchSettingsFile(jsonSettingsPath, cache, jobs)
+            except KeyboardInterrupt:
+                pass
+        elif jsonSettingsPath != None:
+            exportFromSettingsFile(jsonSettingsPath, cache, jobs, stats, "--stream" in args, "--shard" in args, "--typed-payloads" in args)
+        else:
+            exportFromArgs(args, cache, jobs, stats)
+    except ValueError as error:
+        from pykotlinswift_const_creator import TemplateValidationError
+        if (isinstance(error, SettingsError)):
+            print("Error: %s" % error)
+        elif (isinstance(error, TemplateValidationError)):
+            reportTemplateDiagnostics(getattr(error, "templatePath", "template"), error.diagnostics)
+        else:
+            raise
+        exit(3)
+    finally:
+        if (profiler != None):
+            profiler.disable()
+            profiler.dump_stats(profilePath)
+
+    if (cache != None):
+        cache.save()
+
+    if (statsFormat == "json"):
+        print(json.dumps(stats.report(cache), indent=2))
+    elif (statsFormat == "text"):
+        print(stats.reportText(cache))
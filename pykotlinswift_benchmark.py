@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import io
+import sys
+import json
+import math
+import time
+import random
+import difflib
+import tracemalloc
+import tempfile
+import contextlib
+import unicodedata
+from pykotlinswift_const_creator import parseTemplate, parseTemplateGroup, generateStringFromCodeClass, generateKotlinFile, generateSwiftFile, writeKotlinFile, writeSwiftFile, runtimeShard, rootShard, camelCasedString, convertToKotlinFile, convertToSwiftFile, countTemplateNodes, buildEventRegistry, KotlinClass, SwiftClass, TemplateValidationError
+from pykotlinswift import export
+
+##
+## SYNTHETIC TEMPLATE BUILDER:
+##
+paramMasks = ["%s", "%d", "%f", "%s?", "%d{count}?"]
+
+def isMaskIndex(index, maskDensity):
+    # Spreads the masks evenly: with a density of 0.5 every other member is a mask, starting with the first one
+    return math.floor(index * maskDensity) != math.floor((index - 1) * maskDensity)
+
+def buildSyntheticGroup(depth, eventsPerGroup, paramsPerEvent, defaultParams=0, enumCount=0, maskDensity=0.5, constantsPerGroup=0):
+    group = {}
+    for enumIndex in range(0, enumCount):
+        enums = group.setdefault("_enums", {})
+        enums["Kind%d" % enumIndex] = {
+            "first": "first value",
+            "second": 2,
+            "custom": "%s{custom name}"
+        }
+
+    if (defaultParams > 0):
+        group["_defaultParams"] = {}
+        for paramIndex in range(0, defaultParams):
+            if (isMaskIndex(paramIndex, maskDensity)):
+                group["_defaultParams"]["default %d" % paramIndex] = paramMasks[paramIndex % len(paramMasks)]
+            else:
+                group["_defaultParams"]["default_fixed_%d" % paramIndex] = "Default Value %d" % paramIndex
+
+    for constantIndex in range(0, constantsPerGroup):
+        if (isMaskIndex(constantIndex, maskDensity)):
+            group["method%d" % constantIndex] = "value-%d-%%s{item name}-with-%%d" % constantIndex
+        elif (constantIndex % 4 < 2):
+            group["constant%d" % constantIndex] = "Constant Value %d" % constantIndex
+        else:
+            group["number%d" % constantIndex] = constantIndex * 1.5
+
+    for eventIndex in range(0, eventsPerGroup):
+        params = {}
+        for paramIndex in range(0, paramsPerEvent):
+            if (isMaskIndex(paramIndex, maskDensity)):
+                mask = paramMasks[paramIndex % len(paramMasks)]
+                if (enumCount > 0 and paramIndex % 4 == 2):
+                    mask = "%%{Kind%d}" % (paramIndex % enumCount)
+                params["param %d" % paramIndex] = mask
+            else:
+                params["fixed_%d" % paramIndex] = paramIndex
+        event = {
+            "_name": "Event %d" % eventIndex,
+            "_params": params
+        }
+        if (defaultParams > 0 and eventIndex % 3 == 2):
+            event["_excludeParams"] = list(group["_defaultParams"])[0:1]
+        group["event%d" % eventIndex] = event
+
+    if (depth > 1):
+        group["Subgroup"] = buildSyntheticGroup(depth - 1, eventsPerGroup, paramsPerEvent, defaultParams, enumCount, maskDensity, constantsPerGroup)
+    return group
+
+def buildSyntheticTemplate(groups=10, depth=1, eventsPerGroup=10, paramsPerEvent=3, defaultParams=0, enumCount=0, maskDensity=0.5, constantsPerGroup=0):
+    template = {}
+    for groupIndex in range(0, groups):
+        template["Group%d" % groupIndex] = buildSyntheticGroup(depth, eventsPerGroup, paramsPerEvent, defaultParams, enumCount, maskDensity, constantsPerGroup)
+    return template
+
+# Template sizes the conversion and export benchmarks run on
+benchmarkSizes = [
+    ("small", dict(groups=5, depth=2, eventsPerGroup=10, paramsPerEvent=4, defaultParams=2, enumCount=1, constantsPerGroup=4)),
+    ("medium", dict(groups=40, depth=3, eventsPerGroup=20, paramsPerEvent=6, defaultParams=3, enumCount=2, constantsPerGroup=8)),
+    ("large", dict(groups=100, depth=4, eventsPerGroup=25, paramsPerEvent=8, defaultParams=4, enumCount=2, constantsPerGroup=8))
+]
+
+##
+## BENCHMARKS:
+##
+def timeBest(function, repeat=3):
+    best = None
+    result = None
+    for i in range(0, repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        if (best == None or elapsed < best):
+            best = elapsed
+    return (best, result)
+
+def buildParamKeyCorpus(size=20000, distinctKeys=400, seed=7):
+    # Analytics param keys as they show up in templates: snake_case, kebab-case, spaced, accented
+    words = ["screen", "name", "item", "category", "user", "id", "cta", "label", "origin", "Ação", "usuário", "preço", "Número", "step", "flow", "A/B", "variant", "2fa"]
+    separators = ["_", "-", " ", ".", ""]
+    generator = random.Random(seed)
+    keys = []
+    for keyIndex in range(0, distinctKeys):
+        separator = generator.choice(separators)
+        keys.append(separator.join(generator.sample(words, generator.randint(1, 4))))
+    return [generator.choice(keys) for i in range(0, size)]
+
+def legacyCamelCasedString(x):
+    # The character loop camelCasedString used before being memoized, kept as the benchmark reference
+    diactrictsRemoved = u"".join([c for c in unicodedata.normalize('NFKD', x) if not unicodedata.combining(c)])
+    specialCharactersRemoved = re.sub(r'[^\w]|_', ' ', diactrictsRemoved)
+    camelCase = ""
+    for i in range(0, len(specialCharactersRemoved)):        
+        char = specialCharactersRemoved[i]        
+        if char == " ": continue
+        elif char.isdigit() or char.isupper(): camelCase += char
+        elif i == 0: camelCase += char.lower()
+        elif specialCharactersRemoved[i - 1] == " ": camelCase += char.upper()
+        else: camelCase += char.lower()
+    return camelCase
+
+def benchmarkCamelCase():
+    corpus = buildParamKeyCorpus()
+    for key in set(corpus):
+        if (legacyCamelCasedString(key) != camelCasedString.__wrapped__(key)):
+            raise Exception("camelCasedString differs from the legacy implementation for %s" % key)
+
+    print("camelCasedString over %d param keys (%d distinct):" % (len(corpus), len(set(corpus))))
+    implementations = [
+        ("legacy character loop", legacyCamelCasedString),
+        ("translate tables", camelCasedString.__wrapped__),
+        ("memoized", camelCasedString)
+    ]
+    for (name, implementation) in implementations:
+        camelCasedString.cache_clear()
+        (elapsed, result) = timeBest(lambda: [implementation(key) for key in corpus], repeat=1)
+        print("%24s %10.2f ms %10.3f us/key" % (name, elapsed * 1000, elapsed * 1000000 / len(corpus)))
+    print("%24s %s" % ("cache stats", camelCasedString.cache_info()))
+
+def benchmarkAssembly(maxLines=50000, depths=(1, 8), eventsPerGroup=20):
+    print("Output generation (generateStringFromCodeClass) scaling:")
+    print("%8s %6s %10s %10s %10s" % ("language", "depth", "lines", "ms", "us/line"))
+
+    linesPerGroup = eventsPerGroup * 3 + 3
+    for codeClassType in [KotlinClass, SwiftClass]:
+        for depth in depths:
+            lineCount = maxLines // 8
+            while (lineCount <= maxLines):
+                groups = max(1, lineCount // (linesPerGroup * depth))
+                template = parseTemplateGroup(buildSyntheticTemplate(groups, depth, eventsPerGroup), "Benchmark")
+                codeClass = codeClassType()
+                codeClass.loadTemplateGroup(template)
+
+                (elapsed, output) = timeBest(lambda: generateStringFromCodeClass(codeClass, None))
+                outputLines = output.count("\n")
+                print("%8s %6d %10d %10.2f %10.3f" % (codeClass.language, depth, outputLines, elapsed * 1000, elapsed * 1000000 / outputLines))
+                lineCount *= 2
+
+
+def benchmarkConvert(sizes=benchmarkSizes):
+    # Template json to file content, through the library entry points
+    results = {}
+    print("Conversion (convertToKotlinFile/convertToSwiftFile):")
+    print("%8s %8s %10s %10s" % ("size", "language", "events", "ms"))
+    for (sizeName, sizeParameters) in sizes:
+        templateJson = json.dumps(buildSyntheticTemplate(**sizeParameters))
+        events = sizeParameters["groups"] * sizeParameters["depth"] * sizeParameters["eventsPerGroup"]
+        for (language, convert) in [("Kotlin", convertToKotlinFile), ("Swift", convertToSwiftFile)]:
+            (elapsed, output) = timeBest(lambda: convert(templateJson, "Benchmark", "1.0.0"))
+            results["convert.%s.%s" % (language, sizeName)] = elapsed * 1000
+            print("%8s %8s %10d %10.2f" % (sizeName, language, events, elapsed * 1000))
+    return results
+
+def benchmarkExport(sizes=benchmarkSizes):
+    # The whole export() path (reading the template, parsing once, streaming both files to disk), without the
+    # generation cache, so every run generates. Files are only replaced the first time, as they don't change after.
+    results = {}
+    print("Export (export() without cache):")
+    print("%8s %10s" % ("size", "ms"))
+    with tempfile.TemporaryDirectory() as directory:
+        for (sizeName, sizeParameters) in sizes:
+            templatePath = os.path.join(directory, "%s.json" % sizeName)
+            with open(templatePath, "w") as templateFile:
+                templateFile.write(json.dumps(buildSyntheticTemplate(**sizeParameters)))
+
+            def exportSize():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    export(templatePath, os.path.join(directory, "%s.swift" % sizeName), os.path.join(directory, "%s.kt" % sizeName), "Benchmark", "package benchmark", "1.0.0")
+
+            (elapsed, result) = timeBest(exportSize)
+            results["export.%s" % sizeName] = elapsed * 1000
+            print("%8s %10.2f" % (sizeName, elapsed * 1000))
+    return results
+
+def measureMemory(function):
+    # The bytes allocated by function that its result still holds, and the peak of the allocations while it ran
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = function()
+        (current, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (current - start, peak - start, result)
+
+# Classes of the parsed tree as they were before the nodes had __slots__, kept as the benchmark reference
+legacyTemplateClasses = {}
+
+def legacyTemplateClass(nodeClass):
+    # One class per node class, so its instances share the keys of their __dict__ as the original ones did
+    if (nodeClass not in legacyTemplateClasses):
+        legacyTemplateClasses[nodeClass] = type("Legacy%s" % nodeClass.__name__, (), {})
+    return legacyTemplateClasses[nodeClass]
+
+def legacyTemplateTree(value, nodes):
+    # The tree with a __dict__ node for each distinct node (nodes maps their id to their copy, as the mask
+    # fragments are shared by the masks tokenized once). The param values and event names are copied, as they were
+    # the strings decoded by json.loads instead of interned ones (the keys were already shared by its decoder).
+    if (hasattr(value, "__slots__")):
+        if (id(value) not in nodes):
+            node = legacyTemplateClass(type(value))()
+            nodes[id(value)] = node
+            for name in value.__slots__:
+                attribute = legacyTemplateTree(getattr(value, name), nodes)
+                if (name in ["value", "eventName"] and isinstance(attribute, str) and len(attribute) > 1):
+                    attribute = attribute[0] + attribute[1:]
+                setattr(node, name, attribute)
+        return nodes[id(value)]
+    elif (isinstance(value, list)):
+        return [legacyTemplateTree(item, nodes) for item in value]
+    elif (isinstance(value, tuple)):
+        return tuple([legacyTemplateTree(item, nodes) for item in value])
+    return value
+
+def benchmarkMemory(sizes=benchmarkSizes):
+    # Size of the parsed tree (the IR every emitter reads) and peak memory of the parse. The memoized names and
+    # mask tokens held by the caches of the parser are part of what a parse retains, so they are counted too.
+    # The legacy tree is the same one made of __dict__ nodes, without the interned strings.
+    results = {}
+    print("Memory of the parsed template (parseTemplate):")
+    print("%8s %10s %10s %12s %12s %10s %12s" % ("size", "nodes", "tree KB", "bytes/node", "peak KB", "legacy KB", "legacy b/node"))
+    for (sizeName, sizeParameters) in sizes:
+        templateJson = json.dumps(buildSyntheticTemplate(**sizeParameters))
+        (treeBytes, peakBytes, template) = measureMemory(lambda: parseTemplate(templateJson, "Benchmark"))
+        nodes = sum(countTemplateNodes(template).values())
+        legacyBytes = measureMemory(lambda: legacyTemplateTree(template, {}))[0]
+        results["memory.tree.%s" % sizeName] = treeBytes / 1024
+        results["memory.peak.%s" % sizeName] = peakBytes / 1024
+        print("%8s %10d %10.1f %12.1f %12.1f %10.1f %12.1f" % (sizeName, nodes, treeBytes / 1024, treeBytes / nodes, peakBytes / 1024, legacyBytes / 1024, legacyBytes / nodes))
+        # Freed before the next size is measured
+        template = None
+    return results
+
+def compareWithBaseline(results, baselinePath, threshold=0.25, minimumDelta=0.5):
+    # Returns the names of the results slower than the baseline by more than threshold (a fraction of the
+    # baseline time). Differences under minimumDelta milliseconds are taken as noise.
+    with open(baselinePath) as baselineFile:
+        baseline = json.loads(baselineFile.read())
+
+    regressions = []
+    print("Comparison with %s (threshold %d%%):" % (baselinePath, threshold * 100))
+    for name in results:
+        if (name not in baseline):
+            continue
+        change = (results[name] - baseline[name]) / baseline[name]
+        regressed = change > threshold and results[name] - baseline[name] > minimumDelta
+        if (regressed):
+            regressions.append(name)
+        unit = "ms"
+        if (name.startswith("memory.")):
+            unit = "KB"
+        print("%24s %10.2f %s %10.2f %s %+8.1f%%%s" % (name, baseline[name], unit, results[name], unit, change * 100, " REGRESSION" if regressed else ""))
+    return regressions
+
+##
+## GOLDEN OUTPUTS: every template of the golden directory is converted to both languages and compared
+## with the outputs stored next to it, so performance work can't silently change the generated code.
+## The templates named invalid* are compared with the problems reported for them instead.
+##
+goldenDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark", "golden")
+
+def generateGoldenDiagnostics(templateJson, templatePath):
+    # The problems reported for an invalid template, one per line
+    try:
+        parseTemplate(templateJson, "GoldenEvents", templatePath=templatePath)
+    except TemplateValidationError as error:
+        return "".join(["%s\n" % diagnostic for diagnostic in error.diagnostics])
+    return ""
+
+def generateGoldenShards(template, writeFile, header=None):
+    # The files of the sharded output (runtime, root class, then one per top-level group), each one after a line naming it
+    shards = []
+    for shard in [runtimeShard, rootShard] + list(range(len(template.subgroups))):
+        shardFile = io.StringIO()
+        writeFile(template, shardFile, "1.0.0", header=header, shard=shard)
+        shardName = shard
+        if (isinstance(shard, int)):
+            shardName = template.subgroups[shard].name
+        shards.append("// shard: %s\n%s\n" % (shardName, shardFile.getvalue()))
+    return "\n".join(shards)
+
+def generateGoldenOutputs(templatePath):
+    with open(templatePath, "rb") as templateFile:
+        templateJson = templateFile.read()
+    if (os.path.basename(templatePath).startswith("invalid")):
+        return [(".diagnostics", generateGoldenDiagnostics(templateJson, templatePath))]
+
+    template = parseTemplate(templateJson, "GoldenEvents")
+    registry = buildEventRegistry(template)
+    return [
+        (".kt", convertToKotlinFile(templateJson, "GoldenEvents", "1.0.0", header="package com.example.golden")),
+        (".swift", convertToSwiftFile(templateJson, "GoldenEvents", "1.0.0")),
+        (".typed.kt", generateKotlinFile(template, "1.0.0", header="package com.example.golden", typedPayloads=True)),
+        (".typed.swift", generateSwiftFile(template, "1.0.0", typedPayloads=True)),
+        (".registry.kt", generateKotlinFile(template, "1.0.0", header="package com.example.golden", registry=registry)),
+        (".registry.swift", generateSwiftFile(template, "1.0.0", registry=registry)),
+        (".registry.json", json.dumps(registry.manifest(), indent=2) + "\n"),
+        (".shard.kt", generateGoldenShards(template, writeKotlinFile, header="package com.example.golden")),
+        (".shard.swift", generateGoldenShards(template, writeSwiftFile))
+    ]
+
+def checkGoldenOutputs(update=False):
+    # Returns the number of outputs differing from their golden file (rewritten instead when update is set)
+    mismatches = 0
+    for fileName in sorted(os.listdir(goldenDirectory)):
+        # The other JSON files are golden outputs, e.g. the registry manifests (<template>.registry.json)
+        if (not fileName.endswith(".json") or fileName.count(".") > 1):
+            continue
+        templatePath = os.path.join(goldenDirectory, fileName)
+        for (extension, output) in generateGoldenOutputs(templatePath):
+            goldenPath = templatePath[0:-len(".json")] + extension
+            if (update):
+                with open(goldenPath, "w") as goldenFile:
+                    goldenFile.write(output)
+                print("golden: updated %s" % goldenPath)
+                continue
+
+            golden = None
+            if (os.path.exists(goldenPath)):
+                with open(goldenPath) as goldenFile:
+                    golden = goldenFile.read()
+            if (golden == output):
+                print("golden: matches %s" % goldenPath)
+                continue
+
+            mismatches += 1
+            print("golden: DIFFERS %s" % goldenPath)
+            diff = difflib.unified_diff((golden or "").splitlines(), output.splitlines(), goldenPath, "generated", lineterm="")
+            for line in list(diff)[0:40]:
+                print("    %s" % line)
+    return mismatches
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    benchmarks = [arg for arg in args if "=" not in arg and not arg.startswith("--")]
+    options = dict([arg.split("=", 1) for arg in args if "=" in arg])
+    failed = False
+
+    if (len(benchmarks) == 0 or "golden" in benchmarks):
+        failed = checkGoldenOutputs(update="--update-golden" in args) > 0 or failed
+
+    results = {}
+    if (len(benchmarks) == 0 or "convert" in benchmarks):
+        results.update(benchmarkConvert())
+    if (len(benchmarks) == 0 or "export" in benchmarks):
+        results.update(benchmarkExport())
+    if (len(benchmarks) == 0 or "memory" in benchmarks):
+        results.update(benchmarkMemory())
+    if ("assembly" in benchmarks):
+        benchmarkAssembly()
+    if ("camelcase" in benchmarks):
+        benchmarkCamelCase()
+
+    baselinePath = options.get("baseline")
+    if (baselinePath != None and len(results) > 0):
+        if ("--record" in args or not os.path.exists(baselinePath)):
+            with open(baselinePath, "w") as baselineFile:
+                baselineFile.write(json.dumps(results, indent=2, sort_keys=True) + "\n")
+            print("Baseline recorded in %s" % baselinePath)
+        else:
+            threshold = float(options.get("threshold", "0.25"))
+            failed = len(compareWithBaseline(results, baselinePath, threshold)) > 0 or failed
+
+    if (failed):
+        exit(1)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+
+# Kept free of the generator imports, so a cache hit costs little more than the interpreter startup.
+import os
+import json
+import stat
+import time
+import pickle
+import hashlib
+import tempfile
+
+defaultCacheDirectory = ".pykotlinswift-cache"
+defaultCacheMaxEntries = 64
+defaultCacheMaxBytes = 64 * 1024 * 1024
+defaultFragmentCacheMaxBlocks = 200000
+defaultFragmentCacheMaxAge = 16
+
+generatorDirectory = os.path.dirname(os.path.abspath(__file__))
+generatorVersion = None
+
+
+def generatorVersionHash():
+    # Any change to the generator sources invalidates every cached generation
+    global generatorVersion
+    if (generatorVersion == None):
+        versionHash = hashlib.sha256()
+        for fileName in sorted(os.listdir(generatorDirectory)):
+            if (fileName.startswith("pykotlinswift") and fileName.endswith(".py")):
+                versionHash.update(fileName.encode("utf-8"))
+                with open(os.path.join(generatorDirectory, fileName), "rb") as file:
+                    versionHash.update(file.read())
+        generatorVersion = versionHash.hexdigest()
+    return generatorVersion
+
+
+def fileContentHash(filePath, chunkSize=1024 * 1024):
+    contentHash = hashlib.sha256()
+    with open(filePath, "rb") as file:
+        chunk = file.read(chunkSize)
+        while (len(chunk) > 0):
+            contentHash.update(chunk)
+            chunk = file.read(chunkSize)
+    return contentHash.hexdigest()
+
+
+def writeFileAtomically(filePath, content):
+    fileDescriptor, temporaryFilePath = tempfile.mkstemp(dir=os.path.dirname(filePath), prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fileDescriptor, "wb") as file:
+            file.write(content)
+        os.replace(temporaryFilePath, filePath)
+    except BaseException:
+        if (os.path.exists(temporaryFilePath)):
+            os.remove(temporaryFilePath)
+        raise
+
+
+class FragmentCache:
+    # Generated lines of subgroups, keyed by language, nesting level, name and subtree fingerprint.
+    # A block is a list of text chunks (consecutive lines joined) where the blocks of its own subgroups are
+    # kept as (blockKey,) references, so every line is stored once however deep the subgroup is.
+    def __init__(self, directory=defaultCacheDirectory, languages=("Kotlin", "Swift"), maxBlocks=defaultFragmentCacheMaxBlocks, maxAge=defaultFragmentCacheMaxAge):
+        self.directory = directory
+        self.path = os.path.join(directory, "fragments.pickle")
+        self.languages = languages
+        self.maxBlocks = maxBlocks
+        self.maxAge = maxAge
+        self.blocks = None
+        self.lastUsed = None
+        self.generation = 0
+        self.completeBlocks = set()
+        self.storedKeys = set()
+        self.usedKeys = set()
+        self.modified = False
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        if (self.blocks == None):
+            self.blocks = {}
+            self.lastUsed = {}
+            if (os.path.exists(self.path)):
+                try:
+                    with open(self.path, "rb") as file:
+                        cached = pickle.load(file)
+                    if (cached["version"] == generatorVersionHash()):
+                        self.blocks = cached["blocks"]
+                        self.lastUsed = cached["lastUsed"]
+                        self.generation = cached["generation"]
+                except Exception:
+                    pass # A corrupted or outdated cache only costs a regeneration
+            self.generation += 1
+        return self.blocks
+
+    def blockKey(self, language, name, level, fingerprint):
+        return "%s:%d:%s:%s" % (language, level, name, fingerprint)
+
+    def hasBlock(self, blockKey):
+        # A block is only usable when every block it references is cached too
+        if (blockKey in self.completeBlocks):
+            return True
+
+        block = self.load().get(blockKey)
+        if (block == None):
+            return False
+
+        for chunk in block:
+            if (isinstance(chunk, tuple) and not self.hasBlock(chunk[0])):
+                return False
+
+        self.completeBlocks.add(blockKey)
+        return True
+
+    def containsGroup(self, name, level, fingerprint):
+        for language in self.languages:
+            if (not self.hasBlock(self.blockKey(language, name, level, fingerprint))):
+                self.misses += 1
+                return False
+        self.hits += 1
+        return True
+
+    def writeBlock(self, blockKey, lines):
+        self.lastUsed[blockKey] = self.generation
+        self.usedKeys.add(blockKey)
+        for chunk in self.blocks[blockKey]:
+            if (isinstance(chunk, tuple)):
+                self.writeBlock(chunk[0], lines)
+            else:
+                lines.append(chunk)
+
+    def storeBlock(self, blockKey, block):
+        chunks = []
+        chunkLines = []
+        for line in block:
+            if (isinstance(line, tuple)):
+                if (len(chunkLines) > 0):
+                    chunks.append("\n".join(chunkLines))
+                    chunkLines = []
+                chunks.append(line)
+            else:
+                chunkLines.append(line)
+        if (len(chunkLines) > 0):
+            chunks.append("\n".join(chunkLines))
+
+        self.load()[blockKey] = chunks
+        self.lastUsed[blockKey] = self.generation
+        self.completeBlocks.add(blockKey)
+        self.storedKeys.add(blockKey)
+        self.modified = True
+
+    def takeUpdates(self):
+        # Blocks stored and used since the last call, for a worker process to hand them back to the parent
+        storedBlocks = {}
+        for blockKey in self.storedKeys:
+            storedBlocks[blockKey] = self.blocks[blockKey]
+        updates = (storedBlocks, self.usedKeys)
+        self.storedKeys = set()
+        self.usedKeys = set()
+        return updates
+
+    def mergeUpdates(self, updates):
+        (storedBlocks, usedKeys) = updates
+        blocks = self.load()
+        for blockKey in storedBlocks:
+            blocks[blockKey] = storedBlocks[blockKey]
+            self.lastUsed[blockKey] = self.generation
+            self.modified = True
+        for blockKey in usedKeys:
+            self.lastUsed[blockKey] = self.generation
+
+    def prune(self):
+        # Blocks not used by any of the last maxAge saved generations are dropped,
+        # then the least recently used ones past maxBlocks
+        for blockKey in list(self.blocks):
+            if (self.lastUsed.get(blockKey, 0) <= self.generation - self.maxAge):
+                del self.blocks[blockKey]
+                self.lastUsed.pop(blockKey, None)
+                self.modified = True
+
+        if (len(self.blocks) > self.maxBlocks):
+            leastRecentlyUsed = sorted(self.blocks, key=lambda blockKey: self.lastUsed.get(blockKey, 0))
+            for blockKey in leastRecentlyUsed[0:(len(self.blocks) - self.maxBlocks)]:
+                del self.blocks[blockKey]
+                self.lastUsed.pop(blockKey, None)
+            self.modified = True
+
+    def save(self):
+        if (self.blocks == None):
+            return
+        self.prune()
+        if (not self.modified):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        writeFileAtomically(self.path, pickle.dumps({
+            "version": generatorVersionHash(),
+            "generation": self.generation,
+            "blocks": self.blocks,
+            "lastUsed": self.lastUsed
+        }, protocol=pickle.HIGHEST_PROTOCOL))
+        self.modified = False
+        self.completeBlocks = set()
+
+
+class GenerationCache:
+    def __init__(self, directory=defaultCacheDirectory, maxEntries=defaultCacheMaxEntries, maxBytes=defaultCacheMaxBytes):
+        self.directory = directory
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.manifestPath = os.path.join(directory, "manifest.json")
+        self.manifest = None
+        self.fragments = None
+        self.hits = 0
+        self.misses = 0
+
+    def fragmentCache(self):
+        if (self.fragments == None):
+            self.fragments = FragmentCache(self.directory)
+        return self.fragments
+
+    def loadManifest(self):
+        if (self.manifest == None):
+            self.manifest = {"entries": {}}
+            if (os.path.exists(self.manifestPath)):
+                try:
+                    with open(self.manifestPath, "rb") as file:
+                        self.manifest = json.loads(file.read())
+                except ValueError:
+                    pass # A corrupted manifest only costs a regeneration
+        return self.manifest
+
+    def generationKey(self, templateContent, settings, templateHash=None):
+        # templateHash (the hex sha256 of the content) replaces the content of templates too large to be read at once
+        if (templateHash == None):
+            templateHash = hashlib.sha256(templateContent).hexdigest()
+        key = hashlib.sha256()
+        key.update(generatorVersionHash().encode("utf-8"))
+        key.update(bytes.fromhex(templateHash))
+        key.update(json.dumps(settings).encode("utf-8"))
+        return key.hexdigest()
+
+    def outputMatches(self, filePath, output):
+        # Whether the file (an output, or a file included by the template) is still the recorded one
+        if (not os.path.exists(filePath)):
+            return False
+
+        fileStat = os.stat(filePath)
+        if (fileStat.st_size != output["size"]):
+            return False
+        if (fileStat.st_mtime_ns == output["mtime"]):
+            return True
+
+        # Touched but maybe not modified (e.g. by a checkout), so the content decides
+        if (fileContentHash(filePath) != output["hash"]):
+            return False
+        output["mtime"] = fileStat.st_mtime_ns
+        return True
+
+    def lookup(self, key):
+        entry = self.loadManifest()["entries"].get(key)
+        if (entry == None):
+            self.misses += 1
+            return False
+
+        for files in [entry["outputs"], entry.get("dependencies", {})]:
+            for filePath in files:
+                if (not self.outputMatches(filePath, files[filePath])):
+                    self.misses += 1
+                    return False
+
+        entry["lastUsed"] = time.time()
+        self.hits += 1
+        return True
+
+    def dependencies(self, key):
+        # Files included by the template of an entry, which a change to any of them invalidates
+        entry = self.loadManifest()["entries"].get(key)
+        if (entry == None):
+            return []
+        return list(entry.get("dependencies", {}))
+
+    def fileRecords(self, fileHashes):
+        records = {}
+        for filePath in fileHashes:
+            fileStat = os.stat(filePath)
+            records[filePath] = {
+                "hash": fileHashes[filePath],
+                "size": fileStat.st_size,
+                "mtime": fileStat.st_mtime_ns
+            }
+        return records
+
+    def store(self, key, outputHashes, dependencyHashes=None):
+        # dependencyHashes are the content hashes of the files included by the template, by path
+        entry = {
+            "outputs": self.fileRecords(outputHashes),
+            "lastUsed": time.time()
+        }
+        if (dependencyHashes != None and len(dependencyHashes) > 0):
+            entry["dependencies"] = self.fileRecords(dependencyHashes)
+        self.loadManifest()["entries"][key] = entry
+
+    def evict(self):
+        entries = self.loadManifest()["entries"]
+        if (len(entries) > self.maxEntries):
+            leastRecentlyUsed = sorted(entries, key=lambda key: entries[key]["lastUsed"])
+            for key in leastRecentlyUsed[0:(len(entries) - self.maxEntries)]:
+                del entries[key]
+
+        if (not os.path.isdir(self.directory)):
+            return
+
+        # Cached files other than the manifest are evicted by last use until the directory fits in maxBytes.
+        # Only regular files are counted, so the socket of a daemon listening in the directory is never removed.
+        cachedFiles = []
+        totalBytes = 0
+        for directoryPath, directoryNames, fileNames in os.walk(self.directory):
+            for fileName in fileNames:
+                filePath = os.path.join(directoryPath, fileName)
+                fileStat = os.lstat(filePath)
+                if (not stat.S_ISREG(fileStat.st_mode)):
+                    continue
+                totalBytes += fileStat.st_size
+                if (filePath != self.manifestPath):
+                    cachedFiles.append((fileStat.st_mtime, fileStat.st_size, filePath))
+
+        for (mtime, size, filePath) in sorted(cachedFiles):
+            if (totalBytes <= self.maxBytes):
+                break
+            os.remove(filePath)
+            totalBytes -= size
+
+    def save(self):
+        if (self.fragments != None):
+            self.fragments.save()
+        if (self.manifest == None):
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.evict()
+        writeFileAtomically(self.manifestPath, json.dumps(self.manifest).encode("utf-8"))
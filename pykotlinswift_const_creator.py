@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
+import os
 import json
 import re
+import time
+import hashlib
+import functools
 import unicodedata
-from sys import exit
+from sys import exit, intern
 from traceback import print_exc
 
 def raiseException(msg):
@@ -11,34 +15,859 @@ def raiseException(msg):
     print_exc()
     exit(3)
 
+class TemplateError(ValueError):
+    # Raised by the parsing and emitting logic on an invalid template, so it can be used as a library
+    pass
+
+class TemplateDiagnostic:
+    def __init__(self, path, message):
+        self.path = path # JSON path of the invalid value, e.g. $.Group.event._params['screen name']
+        self.message = message
+
+    def __str__(self):
+        return "%s: %s" % (self.path, self.message)
+
+class TemplateValidationError(TemplateError):
+    # Every problem found in a template, instead of only the first one
+    def __init__(self, diagnostics):
+        TemplateError.__init__(self, "\n".join([str(diagnostic) for diagnostic in diagnostics]))
+        self.diagnostics = diagnostics
+
+class CamelCaseTranslationTable(dict):
+    # str.translate table that maps each character the first time it is seen:
+    # digits and uppercase characters are kept, any other character goes through `transform`.
+    def __init__(self, transform):
+        super().__init__()
+        self.transform = transform
+
+    def __missing__(self, codePoint):
+        char = chr(codePoint)
+        if (char.isdigit() or char.isupper()):
+            mapped = char
+        else:
+            mapped = self.transform(char)
+        self[codePoint] = mapped
+        return mapped
+
+camelCaseWordStartTable = CamelCaseTranslationTable(str.upper)
+camelCaseWordTailTable = CamelCaseTranslationTable(str.lower)
+camelCaseSeparatorPattern = re.compile(r'[^\w]|_')
+
+@functools.lru_cache(maxsize=65536)
 def camelCasedString(x: str):
-    diactrictsRemoved = u"".join([c for c in unicodedata.normalize('NFKD', x) if not unicodedata.combining(c)])
-    specialCharactersRemoved = re.sub(r'[^\w]|_', ' ', diactrictsRemoved)
-    camelCase = ""
-    for i in range(0, len(specialCharactersRemoved)):        
-        char = specialCharactersRemoved[i]        
-        if char == " ": continue
-        elif char.isdigit() or char.isupper(): camelCase += char
-        elif i == 0: camelCase += char.lower()
-        elif specialCharactersRemoved[i - 1] == " ": camelCase += char.upper()
-        else: camelCase += char.lower()
-    return camelCase
+    # Memoized, since the same param keys are converted for every event. camelCasedString.cache_info() has the hit/miss stats.
+    diactrictsRemoved = x
+    if (not x.isascii()):
+        diactrictsRemoved = u"".join([c for c in unicodedata.normalize('NFKD', x) if not unicodedata.combining(c)])
+    words = camelCaseSeparatorPattern.sub(' ', diactrictsRemoved).split(" ")
+
+    # The first word keeps its first character lowercased, the following words get it uppercased
+    camelCase = [words[0].translate(camelCaseWordTailTable)]
+    for word in words[1:]:
+        if (len(word) > 0):
+            camelCase.append(word[0].translate(camelCaseWordStartTable))
+            camelCase.append(word[1:].translate(camelCaseWordTailTable))
+    return "".join(camelCase)
+
+normalizationSeparatorPattern = re.compile(r"[^a-z0-9]+")
+
+@functools.lru_cache(maxsize=65536)
+def normalizedString(x: str):
+    # String.pyNormalized() of the generated runtimes, computed at generation time. Kotlin and Swift only agree on
+    # ASCII letters and digits (e.g. "ß" is kept by Swift and replaced by Kotlin), so anything else than ASCII and
+    # the combining diacritics both remove returns None, leaving the normalization to the runtime.
+    lowered = x.lower()
+    if (not lowered.isascii()):
+        lowered = "".join([c for c in unicodedata.normalize("NFD", lowered) if not ("\u0300" <= c <= "\u036f")])
+        if (not lowered.isascii()):
+            return None
+    return "_".join([word for word in normalizationSeparatorPattern.split(lowered) if len(word) > 0])
+
+def getNormalizedEventKeys(event):
+    # The normalized name and param keys of an event, or None when any of them is left to the runtime or two keys
+    # normalize to the same one (which only one of them would keep, whichever the runtime sees last)
+    name = normalizedString(event.eventName)
+    if (name == None):
+        return None
+    keys = []
+    for param in event.params:
+        key = normalizedString(param.key)
+        if (key == None):
+            return None
+        keys.append(key)
+    if (len(set(keys)) < len(keys)):
+        return None
+    return (name, keys)
 
 ## 
-## PARSING DICTIONARY TO LANGUAGE INSTRUCTIONS LOGIC:
+## PARSING DICTIONARY TO INTERMEDIATE REPRESENTATION LOGIC: the nodes have __slots__ instead of a __dict__,
+## since large templates have hundreds of thousands of them, and the strings repeated across events (param
+## keys, masks and fixed values) are interned, so each distinct one is held once by every parse.
+##
+class TemplateConstant:
+    __slots__ = ("name", "value")
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+class TemplateMaskFragment:
+    __slots__ = ("text", "typeChar", "paramType", "paramName", "userDefined", "suffix")
+
+    def __init__(self, text, typeChar=None, paramType=None, paramName=None, userDefined=False, suffix=""):
+        self.text = text
+        self.typeChar = typeChar
+        self.paramType = paramType
+        self.paramName = paramName
+        self.userDefined = userDefined
+        self.suffix = suffix
+
+    def isParam(self):
+        return self.typeChar != None
+
+    def isEnum(self):
+        return "%{" in self.text
+
+class TemplateMaskedMethod:
+    __slots__ = ("name", "fragments")
+
+    def __init__(self, name, fragments):
+        self.name = name
+        self.fragments = fragments
+
+class TemplateEventParam:
+    __slots__ = ("key", "value", "paramType", "argumentName", "suffix", "isDefault")
+
+    def __init__(self, key, value, paramType=None, argumentName=None, suffix="", isDefault=False):
+        self.key = intern(key)
+        if (isinstance(value, str)):
+            value = intern(value)
+        self.value = value
+        self.paramType = paramType
+        self.argumentName = argumentName
+        self.suffix = suffix
+        self.isDefault = isDefault # merged from the _defaultParams of the group
+
+    def isDynamic(self):
+        return self.paramType != None
+
+    def isFixedDefault(self):
+        return self.isDefault and not self.isDynamic()
+
+    def isEnum(self):
+        return self.isDynamic() and "%{" in self.value
+
+class TemplateEvent:
+    __slots__ = ("methodName", "eventName", "params")
+
+    def __init__(self, methodName, eventName, params):
+        self.methodName = intern(methodName)
+        self.eventName = intern(eventName)
+        self.params = params
+
+class TemplateEnumCase:
+    __slots__ = ("name", "value", "method")
+
+    def __init__(self, name, value, method=None):
+        self.name = name
+        self.value = value
+        self.method = method
+
+class TemplateEnum:
+    __slots__ = ("name", "cases")
+
+    def __init__(self, name, cases):
+        self.name = name
+        self.cases = cases
+
+class TemplateGroup:
+    __slots__ = ("name", "level", "enums", "constants", "methods", "subgroups", "defaultParameters", "fingerprint", "cached")
+
+    def __init__(self, name, level=0):
+        self.name = name
+        self.level = level
+        self.enums = []
+        self.constants = []
+        self.methods = []
+        self.subgroups = []
+        self.defaultParameters = {}
+        self.fingerprint = None
+        self.cached = False
+
+def countTemplateNodes(group, counts=None):
+    # Number of nodes of each kind in the tree, subgroups whose lines come from the fragment cache counted apart
+    if (counts == None):
+        counts = dict.fromkeys(["groups", "cachedGroups", "constants", "maskedMethods", "events", "eventParams", "enums", "enumCases"], 0)
+
+    if (group.cached):
+        counts["cachedGroups"] += 1
+        return counts
+
+    counts["groups"] += 1
+    counts["constants"] += len(group.constants)
+    counts["enums"] += len(group.enums)
+    for enum in group.enums:
+        counts["enumCases"] += len(enum.cases)
+    for method in group.methods:
+        if (isinstance(method, TemplateEvent)):
+            counts["events"] += 1
+            counts["eventParams"] += len(method.params)
+        else:
+            counts["maskedMethods"] += 1
+    for subgroup in group.subgroups:
+        countTemplateNodes(subgroup, counts)
+    return counts
+
+def getOptionalitySuffix(paramValue):
+    suffix = ""
+    if (paramValue[len(paramValue) - 1] == "?"):            
+        suffix = "?"
+    return suffix
+
+##
+## Mask tokenizer: masks are split with patterns compiled once, and the typed tokens of every
+## distinct mask are memoized, since templates repeat the same masks a lot.
+##
+maskSplitPattern = re.compile(r"(%[sfd][^\{])|(%[sfd]$)|(%[sfd]{[^}]+})")
+maskTypeCharPattern = re.compile("%.")
+maskParamNamePattern = re.compile(r"\{(.*)\}")
+
+class MaskError(ValueError):
+    pass
+
+def getMaskTypeChar(mask):
+    typeCharMatch = maskTypeCharPattern.search(mask)
+    if (typeCharMatch == None):
+        raise MaskError(mask)
+    return typeCharMatch.group(0)
+
+@functools.lru_cache(maxsize=16384)
+def getMaskParamType(paramValue):
+    typeChar = getMaskTypeChar(paramValue)
+    suffix = getOptionalitySuffix(paramValue)
+    
+    if (len(suffix) > 0 ):
+        paramValue = paramValue[0:(len(paramValue) - 1)]
+
+    if ("d" in typeChar):
+        return "Int%s" % suffix
+    elif ("f" in typeChar):
+        return "Double%s" % suffix
+    elif ("s" in typeChar):
+        return "String%s" % suffix
+    elif ("%{" in typeChar):
+        return "%s%s" % (paramValue[2:(len(paramValue) - 1)], suffix)
+    raise MaskError(paramValue)
+
+@functools.lru_cache(maxsize=16384)
+def tokenizeMask(mask):
+    paramCount = 1
+    tokens = []
+
+    for splitValue in maskSplitPattern.split(mask):            
+        if (splitValue == None or splitValue == ''): 
+            continue
+        
+        if ("%" in splitValue):                
+            # Define name of param
+            paramHasName = "{" in splitValue
+            paramName = ""
+            if (paramHasName):
+                paramNameMatch = maskParamNamePattern.search(splitValue)
+                if (paramNameMatch == None):
+                    raise MaskError(splitValue) # Unterminated name, e.g. %s{name
+                paramName = camelCasedString(paramNameMatch.group(1))
+            else:
+                paramName = "a%d" % paramCount                                
+
+            paramCount += 1
+
+            tokens.append(TemplateMaskFragment(
+                text=splitValue,
+                typeChar=getMaskTypeChar(splitValue),
+                paramType=getMaskParamType(splitValue),
+                paramName=paramName,
+                userDefined=paramHasName,
+                suffix=getOptionalitySuffix(splitValue)
+            ))
+            continue
+        
+        tokens.append(TemplateMaskFragment(text=splitValue))
+
+    return tuple(tokens)
+
+def parseParamType(paramValue, className):
+    if ("%" in paramValue):                
+        try:
+            return getMaskParamType(paramValue)
+        except MaskError as error:
+            raise TemplateError("Unknown param type for param %s inside class %s" % (error, className))
+    else:
+        return None
+
+def parseMaskedMethod(name, value, className):
+    try:
+        return TemplateMaskedMethod(name, tokenizeMask(value))
+    except MaskError as error:
+        raise TemplateError("Unknown param type for param %s inside class %s" % (error, className))
+
+def checkParamValues(params, className):
+    # Values the emitters can't write, rejected here as validateParams rejects them
+    if (not isinstance(params, dict)):
+        raise TemplateError("Params must be an object inside class %s" % className)
+    for paramName in params:
+        paramValue = params[paramName]
+        if (paramValue == None):
+            raise TemplateError("Null values are not supported! Use only strings, floats, ints and objects.")
+        elif (isinstance(paramValue, dict)):
+            raise TemplateError("Objects are not supported as param values, but param %s inside class %s is one" % (paramName, className))
+
+def parseEvent(methodName, eventName, eventParams, excludeParams, defaultParameters, className):
+    checkParamValues(eventParams, className)
+    if (not isinstance(excludeParams, list)):
+        raise TemplateError("_excludeParams must be an array of param names, but it isn't in event %s inside class %s" % (methodName, className))
+
+    # Merging into a copy, so the template object is never mutated by the parse
+    mergedParams = dict(eventParams)
+
+    defaultParamNames = set()
+    for paramName in defaultParameters:
+        if (paramName in mergedParams):
+            continue
+        mergedParams[paramName] = defaultParameters[paramName]
+        defaultParamNames.add(paramName)
+    
+    for paramName in excludeParams:
+        if (paramName in mergedParams):
+            del mergedParams[paramName]
+
+    params = []
+    for paramName in mergedParams:
+        paramValue = mergedParams[paramName]
+        if (isinstance(paramValue, str) and "%" in paramValue):
+            params.append(TemplateEventParam(
+                key=paramName,
+                value=paramValue,
+                paramType=parseParamType(paramValue, className),
+                argumentName=camelCasedString(paramName),
+                suffix=getOptionalitySuffix(paramValue),
+                isDefault=paramName in defaultParamNames
+            ))
+        elif (isinstance(paramValue, list)):
+            raise TemplateError("Arrays are not supported! Use only strings, floats, ints and objects.")
+        else:
+            params.append(TemplateEventParam(key=paramName, value=paramValue, isDefault=paramName in defaultParamNames)) # fixed value
+
+    return TemplateEvent(methodName, eventName, params)
+
+def parseEnum(name, caseParams, className):
+    cases = []
+    for case in caseParams:            
+        value = caseParams[case]
+        method = None
+        if (value == None or isinstance(value, dict)):
+            raise TemplateError("Enum cases must be strings, floats or ints, but %s.%s isn't" % (name, case))
+        if (isinstance(value, str) and "%" in value):
+            if (value.count("%") > 1):
+                raise TemplateError("Enums cannot have more than one parameter, but it has at case %s.%s with value %s" % (name, case, value))
+            method = parseMaskedMethod(case, value, className)
+        cases.append(TemplateEnumCase(case, value, method))
+    return TemplateEnum(name, cases)
+
+def isSubgroupObject(key, value):
+    return isinstance(value, dict) and key != "_defaultParams" and key != "_enums" and "_name" not in value
+
+##
+## VALIDATION: a single pass over the template collecting every problem with its JSON path, which the
+## parsing logic runs when it fails, so a template can be fixed in one go.
+##
+identifierPattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+def jsonPath(path, key):
+    if (identifierPattern.match(key)):
+        return "%s.%s" % (path, key)
+    return "%s[%s]" % (path, json.dumps(key, ensure_ascii=False))
+
+def validateMask(value, path, diagnostics):
+    try:
+        tokenizeMask(value)
+    except MaskError as error:
+        diagnostics.append(TemplateDiagnostic(path, "Unknown param type for param %s" % error))
+
+def validateValue(value, path, diagnostics):
+    if (value == None):
+        diagnostics.append(TemplateDiagnostic(path, "Null values are not supported! Use only strings, floats, ints and objects."))
+    elif (isinstance(value, list)):
+        diagnostics.append(TemplateDiagnostic(path, "Arrays are not supported! Use only strings, floats, ints and objects."))
+    elif (isinstance(value, str) and "%" in value):
+        validateMask(value, path, diagnostics)
+
+def validateParams(params, path, diagnostics):
+    if (not isinstance(params, dict)):
+        diagnostics.append(TemplateDiagnostic(path, "Params must be an object"))
+        return
+
+    for paramName in params:
+        paramValue = params[paramName]
+        paramPath = jsonPath(path, paramName)
+        if (isinstance(paramValue, dict)):
+            diagnostics.append(TemplateDiagnostic(paramPath, "Objects are not supported as param values"))
+        elif (isinstance(paramValue, str) and "%" in paramValue):
+            try:
+                getMaskParamType(paramValue)
+            except MaskError as error:
+                diagnostics.append(TemplateDiagnostic(paramPath, "Unknown param type for param %s" % error))
+        else:
+            validateValue(paramValue, paramPath, diagnostics)
+
+def validateEvent(event, path, diagnostics):
+    if (not isinstance(event["_name"], str)):
+        diagnostics.append(TemplateDiagnostic(jsonPath(path, "_name"), "Event names must be strings"))
+
+    if ("_params" not in event):
+        diagnostics.append(TemplateDiagnostic(path, "Missing _params in event %s" % event["_name"]))
+    else:
+        validateParams(event["_params"], jsonPath(path, "_params"), diagnostics)
+
+    if ("_excludeParams" in event and not isinstance(event["_excludeParams"], list)):
+        diagnostics.append(TemplateDiagnostic(jsonPath(path, "_excludeParams"), "_excludeParams must be an array of param names"))
+
+def validateEnums(enums, path, diagnostics):
+    if (not isinstance(enums, dict)):
+        diagnostics.append(TemplateDiagnostic(path, "_enums must be an object of enum classes"))
+        return
+
+    for enumClass in enums:
+        enumPath = jsonPath(path, enumClass)
+        caseParams = enums[enumClass]
+        if (not isinstance(caseParams, dict)):
+            diagnostics.append(TemplateDiagnostic(enumPath, "Enum classes must be objects of cases"))
+            continue
+
+        for case in caseParams:
+            value = caseParams[case]
+            casePath = jsonPath(enumPath, case)
+            if (isinstance(value, str) and value.count("%") > 1):
+                diagnostics.append(TemplateDiagnostic(casePath, "Enums cannot have more than one parameter, but it has at case %s.%s with value %s" % (enumClass, case, value)))
+            elif (isinstance(value, dict)):
+                diagnostics.append(TemplateDiagnostic(casePath, "Objects are not supported as enum case values"))
+            else:
+                validateValue(value, casePath, diagnostics)
+
+def validateTemplateGroup(jsonObject, path="$", diagnostics=None):
+    # Returns the list of TemplateDiagnostic found in the group and its subgroups
+    if (diagnostics == None):
+        diagnostics = []
+
+    if (not isinstance(jsonObject, dict)):
+        diagnostics.append(TemplateDiagnostic(path, "Groups must be objects"))
+        return diagnostics
+
+    for key in jsonObject:
+        value = jsonObject[key]
+        memberPath = jsonPath(path, key)
+        if (key in includeKeys):
+            diagnostics.append(TemplateDiagnostic(memberPath, "Includes are only resolved by parseTemplate and validateTemplate"))
+        elif (not isinstance(value, dict)):
+            validateValue(value, memberPath, diagnostics)
+        elif (key == "_defaultParams"):
+            validateParams(value, memberPath, diagnostics)
+        elif (key == "_enums"):
+            validateEnums(value, memberPath, diagnostics)
+        elif ("_name" in value):
+            validateEvent(value, memberPath, diagnostics)
+        else:
+            validateTemplateGroup(value, memberPath, diagnostics)
+
+    return diagnostics
+
+def validateTemplate(templateFileJson, templatePath=None):
+    # templatePath is the file of the template, whose includes are relative to its directory
+    try:
+        templateFileObject = json.loads(templateFileJson)
+    except ValueError as error:
+        return [TemplateDiagnostic("$", "Invalid JSON: %s" % error)]
+    if (not isinstance(templateFileObject, dict)):
+        return [TemplateDiagnostic("$", "Groups must be objects")]
+    if (hasTemplateIncludes(templateFileJson)):
+        try:
+            templateFileObject = TemplateIncludeLoader().expandTemplate(templateFileObject, templatePath)
+        except TemplateValidationError as error:
+            return error.diagnostics
+    return validateTemplateGroup(templateFileObject)
+
+class TemplateParser:
+    def __init__(self, fragmentCache=None, parsedGroups=None, stubCachedGroups=True):
+        # When a fragment cache is given, subgroups whose generated lines are cached are not parsed again, unless
+        # stubCachedGroups is False (e.g. for the event registry, which needs every event): their lines are still spliced.
+        # When parsedGroups is given, subgroups found in it (by name, level and fingerprint) are reused as they are,
+        # and it is refilled with the subgroups of this parse, ready for the next one.
+        self.fragmentCache = fragmentCache
+        self.stubCachedGroups = stubCachedGroups
+        self.fingerprints = {}
+        self.parsedGroups = parsedGroups
+        self.previousGroups = {}
+        if (parsedGroups != None):
+            self.previousGroups = dict(parsedGroups)
+            parsedGroups.clear()
+
+    def fingerprintGroup(self, jsonObject):
+        # Fingerprints are built bottom-up: a group hashes its own members plus the fingerprints of its subgroups.
+        # Subgroups don't inherit _defaultParams or _enums from their parents, so their own content is all they depend on.
+        members = []
+        for key in jsonObject:
+            value = jsonObject[key]
+            if (isSubgroupObject(key, value)):
+                members.append([key, self.fingerprintGroup(value), 0])
+            else:
+                members.append([key, value])
+
+        fingerprint = hashlib.sha1(json.dumps(members).encode("utf-8")).hexdigest()
+        self.fingerprints[id(jsonObject)] = fingerprint
+        return fingerprint
+
+    def keepParsedGroup(self, group):
+        # A group can only be reused along with all of its subgroups, which are kept for the next parse too.
+        # Groups holding cached stubs are not, their lines may have been evicted from the fragment cache since.
+        if (group.cached):
+            return False
+        for subgroup in group.subgroups:
+            if (not self.keepParsedGroup(subgroup)):
+                return False
+        self.parsedGroups[(group.name, group.level, group.fingerprint)] = group
+        return True
+
+    def parseGroup(self, jsonObject, name, level=0):
+        group = TemplateGroup(name, level)
+        properties = jsonObject
+
+        if (self.fragmentCache != None or self.parsedGroups != None):
+            if (id(jsonObject) not in self.fingerprints):
+                self.fingerprintGroup(jsonObject)
+            group.fingerprint = self.fingerprints[id(jsonObject)]
+            if (level > 0 and self.stubCachedGroups and self.fragmentCache != None and self.fragmentCache.containsGroup(name, level, group.fingerprint)):
+                group.cached = True
+                return group
+
+            previousGroup = self.previousGroups.get((name, level, group.fingerprint))
+            if (level > 0 and previousGroup != None and self.keepParsedGroup(previousGroup)):
+                return previousGroup
+
+        for key in properties:
+            value = properties[key]
+            if (isinstance(value, str)):
+                if "%" in value:
+                    group.methods.append(parseMaskedMethod(key, value, name))
+                elif (key in includeKeys):
+                    raise TemplateError("Include %s of class %s was not resolved, parse the template with parseTemplate" % (value, name))
+                else:
+                    group.constants.append(TemplateConstant(key, value))
+            elif (isinstance(value, float)):
+                group.constants.append(TemplateConstant(key, value))
+            elif (isinstance(value, int)):
+                group.constants.append(TemplateConstant(key, value))
+            elif (isinstance(value, list)):
+                raise TemplateError("Arrays are not supported! Use only strings, floats, ints and objects.")
+            elif (isinstance(value, object)):
+                if (key == "_defaultParams"):
+                    checkParamValues(value, name)
+                    group.defaultParameters = value
+                elif (key == "_enums"):
+                    for enumClass in value:
+                        group.enums.append(parseEnum(enumClass, value[enumClass], name))
+                elif "_name" in value:
+                    eventName = value["_name"]
+                    eventParams = value["_params"]
+                    excludeParams = []
+                    if ("_excludeParams" in value):
+                        excludeParams = value["_excludeParams"]
+
+                    group.methods.append(parseEvent(key, eventName, eventParams, excludeParams, group.defaultParameters, name))
+                else:  
+                    group.subgroups.append(self.parseGroup(value, key, level + 1))
+
+        if (level > 0 and self.parsedGroups != None):
+            # Kept subgroups were registered by their own parseGroup call, so only the direct ones are checked
+            for subgroup in group.subgroups:
+                if ((subgroup.name, subgroup.level, subgroup.fingerprint) not in self.parsedGroups):
+                    return group
+            self.parsedGroups[(name, level, group.fingerprint)] = group
+        return group
+
+def parseTemplateGroup(jsonObject, name, level=0, fragmentCache=None, parsedGroups=None, path="$", stubCachedGroups=True):
+    # A valid template is parsed without a validation pass, which only runs to report every problem
+    # (as a TemplateValidationError) once the parse failed on one of them.
+    try:
+        return TemplateParser(fragmentCache, parsedGroups, stubCachedGroups).parseGroup(jsonObject, name, level)
+    except (TemplateError, KeyError, TypeError, AttributeError):
+        diagnostics = validateTemplateGroup(jsonObject, path)
+        if (len(diagnostics) == 0):
+            raise
+        raise TemplateValidationError(diagnostics)
+
+def parseTemplate(templateFileJson, className, fragmentCache=None, parsedGroups=None, stats=None, stubCachedGroups=True, includeLoader=None, templatePath=None):
+    # stats, when given, gets the time spent decoding and parsing (see GenerationStats in pykotlinswift.py).
+    # The includes of the template are resolved relatively to the directory of templatePath (the working directory
+    # when None) by includeLoader, which can be shared by the templates of a run to load their common files once.
+    start = time.perf_counter()
+    try:
+        templateFileObject = json.loads(templateFileJson)
+    except ValueError as error:
+        raise TemplateValidationError([TemplateDiagnostic("$", "Invalid JSON: %s" % error)])
+    if (not isinstance(templateFileObject, dict)):
+        raise TemplateValidationError([TemplateDiagnostic("$", "Groups must be objects")])
+    decoded = time.perf_counter()
+
+    if (hasTemplateIncludes(templateFileJson)):
+        if (includeLoader == None):
+            includeLoader = TemplateIncludeLoader()
+        templateFileObject = includeLoader.expandTemplate(templateFileObject, templatePath)
+
+    template = parseTemplateGroup(templateFileObject, className, fragmentCache=fragmentCache, parsedGroups=parsedGroups, stubCachedGroups=stubCachedGroups)
+    if (stats != None):
+        stats.addTime("json.loads", decoded - start)
+        stats.addTime("parse", time.perf_counter() - decoded)
+    return template
+
 ##
+## INCLUDES: "$include" (or "$ref") members of a group splice the members of other JSON files (a path or a list of
+## paths, relative to the including file), e.g. a group shared by several templates or their common _enums and
+## _defaultParams. They are resolved on the decoded template, before it is fingerprinted and parsed.
+##
+includeKeys = ("$include", "$ref")
+
+def hasTemplateIncludes(templateFileJson):
+    # Templates without includes skip the expansion pass
+    if (isinstance(templateFileJson, bytes)):
+        return b'"$include"' in templateFileJson or b'"$ref"' in templateFileJson
+    return '"$include"' in templateFileJson or '"$ref"' in templateFileJson
+
+class TemplateIncludeLoader:
+    # Each included file is read, decoded and expanded once, however many templates and groups include it
+    def __init__(self):
+        self.fragments = {} # real path -> (expanded object, real paths of the files it includes, its own included)
+        self.fileHashes = {} # real path -> sha256 of the content, to know when a generation must be redone
+        self.templateIncludes = {} # template real path -> real paths of the files it includes
+        self.loadingPaths = []
+
+    def expandTemplate(self, jsonObject, templatePath=None):
+        includedPaths = set()
+        if (templatePath == None):
+            return self.expandGroup(jsonObject, os.getcwd(), "$", includedPaths)
+
+        realPath = os.path.realpath(templatePath)
+        self.loadingPaths.append(realPath)
+        try:
+            expanded = self.expandGroup(jsonObject, os.path.dirname(realPath), "$", includedPaths)
+        finally:
+            self.loadingPaths.pop()
+        self.templateIncludes[realPath] = includedPaths
+        return expanded
+
+    def expandMember(self, key, value, templatePath):
+        # A member of the root object of templatePath, as the (key, value) members it stands for once expanded
+        realPath = os.path.realpath(templatePath)
+        self.loadingPaths.append(realPath)
+        try:
+            expanded = self.expandGroup({key: value}, os.path.dirname(realPath), "$", self.templateIncludes.setdefault(realPath, set()))
+        finally:
+            self.loadingPaths.pop()
+        return list(expanded.items())
+
+    def includedFiles(self, templatePath):
+        return self.templateIncludes.get(os.path.realpath(templatePath), set())
+
+    def loadFragment(self, filePath, directory, path):
+        realPath = os.path.realpath(os.path.join(directory, filePath))
+        fragment = self.fragments.get(realPath)
+        if (fragment != None):
+            return fragment
+
+        if (realPath in self.loadingPaths):
+            cycle = self.loadingPaths[self.loadingPaths.index(realPath):] + [realPath]
+            raise TemplateValidationError([TemplateDiagnostic(path, "Include cycle: %s" % " -> ".join(cycle))])
+        try:
+            with open(realPath, "rb") as file:
+                content = file.read()
+        except OSError as error:
+            raise TemplateValidationError([TemplateDiagnostic(path, "Can't read the included file %s: %s" % (filePath, error.strerror))])
+        try:
+            jsonObject = json.loads(content)
+        except ValueError as error:
+            raise TemplateValidationError([TemplateDiagnostic(path, "Invalid JSON in the included file %s: %s" % (filePath, error))])
+        if (not isinstance(jsonObject, dict)):
+            raise TemplateValidationError([TemplateDiagnostic(path, "The included file %s must hold an object" % filePath)])
+
+        self.fileHashes[realPath] = hashlib.sha256(content).hexdigest()
+        includedPaths = set([realPath])
+        self.loadingPaths.append(realPath)
+        try:
+            fragment = (self.expandGroup(jsonObject, os.path.dirname(realPath), path, includedPaths), includedPaths)
+        finally:
+            self.loadingPaths.pop()
+        self.fragments[realPath] = fragment
+        return fragment
+
+    def expandGroup(self, jsonObject, directory, path, includedPaths):
+        # The group with its includes, and the ones of its subgroups, replaced by the included members (a member
+        # included again replaces the previous one). A group without any is returned as it is, and a group only
+        # made of the include of a single file is the object of that file, shared by every group including it.
+        expanded = {}
+        changed = False
+        for key in jsonObject:
+            value = jsonObject[key]
+            if (key in includeKeys):
+                filePaths = value
+                if (isinstance(value, str)):
+                    filePaths = [value]
+                elif (not isinstance(value, list) or not all([isinstance(filePath, str) for filePath in value])):
+                    raise TemplateValidationError([TemplateDiagnostic(jsonPath(path, key), "Includes must be a file path or an array of file paths")])
+
+                for filePath in filePaths:
+                    (fragment, fragmentPaths) = self.loadFragment(filePath, directory, path)
+                    includedPaths.update(fragmentPaths)
+                    if (len(jsonObject) == 1 and len(filePaths) == 1):
+                        return fragment
+                    expanded.update(fragment)
+                changed = True
+            elif (isSubgroupObject(key, value)):
+                expandedValue = self.expandGroup(value, directory, jsonPath(path, key), includedPaths)
+                changed = changed or expandedValue is not value
+                expanded[key] = expandedValue
+            else:
+                expanded[key] = value
+
+        if (changed):
+            return expanded
+        return jsonObject
+
+##
+## EVENT REGISTRY: every event of a template indexed by its normalized name, to find the duplicated ones, emit a
+## lookup table next to the root class and export a JSON manifest (see exportTargets in pykotlinswift.py)
+##
+class RegistryEvent:
+    __slots__ = ("event", "method", "name", "normalizedKeys")
+
+    def __init__(self, event, method):
+        self.event = event
+        self.method = method # path of the generated method, e.g. Events.Group.event
+        self.name = normalizedString(event.eventName)
+        # Only events whose name and keys are normalized at generation time are in the generated lookup table,
+        # since the runtime normalization of the other ones differs between Kotlin and Swift
+        self.normalizedKeys = getNormalizedEventKeys(event)
+
+    def isRegistered(self):
+        return self.normalizedKeys != None
+
+    def key(self):
+        if (self.name == None):
+            return self.event.eventName
+        return self.name
+
+def getRegistryParamType(param):
+    if (param.isDynamic()):
+        return param.paramType
+    elif (isinstance(param.value, str)):
+        return "String"
+    elif (isinstance(param.value, float)):
+        return "Double"
+    return "Int"
+
+class EventRegistry:
+    def __init__(self, className):
+        self.className = className
+        self.events = []
+
+    def addGroup(self, group, path=None):
+        if (group.cached):
+            raise TemplateError("Group %s was taken from the fragment cache without being parsed, the registry needs all of its events" % group.name)
+        if (path == None):
+            path = group.name
+        for member in group.methods:
+            if (isinstance(member, TemplateEvent)):
+                self.events.append(RegistryEvent(member, "%s.%s" % (path, member.methodName)))
+        for subgroup in group.subgroups:
+            self.addGroup(subgroup, "%s.%s" % (path, subgroup.name))
+        return self
+
+    def sortedEvents(self):
+        return sorted(self.events, key=lambda registryEvent: (registryEvent.key(), registryEvent.method))
+
+    def registeredEvents(self):
+        # One event per normalized name (the first method of duplicated ones), sorted by name for a binary search
+        registeredEvents = []
+        for registryEvent in self.sortedEvents():
+            if (not registryEvent.isRegistered()):
+                continue
+            if (len(registeredEvents) > 0 and registeredEvents[-1].name == registryEvent.name):
+                continue
+            registeredEvents.append(registryEvent)
+        return registeredEvents
+
+    def duplicates(self):
+        # The methods of every event name sent by more than one of them
+        methods = {}
+        for registryEvent in self.sortedEvents():
+            methods.setdefault(registryEvent.key(), []).append(registryEvent.method)
+        return dict([(name, methods[name]) for name in methods if len(methods[name]) > 1])
+
+    def unregisteredEvents(self):
+        return [registryEvent for registryEvent in self.sortedEvents() if not registryEvent.isRegistered()]
+
+    def manifest(self):
+        events = []
+        for registryEvent in self.sortedEvents():
+            params = []
+            for param in registryEvent.event.params:
+                manifestParam = {
+                    "key": param.key,
+                    "normalizedKey": normalizedString(param.key),
+                    "type": getRegistryParamType(param),
+                    "dynamic": param.isDynamic(),
+                    "default": param.isDefault
+                }
+                if (not param.isDynamic()):
+                    manifestParam["value"] = param.value
+                params.append(manifestParam)
+            events.append({
+                "name": registryEvent.name,
+                "eventName": registryEvent.event.eventName,
+                "method": registryEvent.method,
+                "registered": registryEvent.isRegistered(),
+                "params": params
+            })
+        return {
+            "className": self.className,
+            "events": events,
+            "duplicates": self.duplicates()
+        }
+
+def buildEventRegistry(template):
+    return EventRegistry(template.name).addGroup(template)
+
+## 
+## EMITTING INTERMEDIATE REPRESENTATION AS LANGUAGE INSTRUCTIONS LOGIC:
+##
+indentationStrings = {}
+
 class CodeClass:
-    def __init__(self, indentationCharacter, language, constKeyword):
-        self.indentationCharacter = indentationCharacter
-        self.language = language
-        self.constKeyword = constKeyword
+    # A class is created for every group written, so the language settings are class attributes of each backend
+    # (KotlinClass, SwiftClass), held once instead of by every instance
+    indentationCharacter = None
+    language = None
+    constKeyword = None
+    __slots__ = ("indentationLevel", "name", "template", "fragmentCache", "typedPayloads", "defaultParams", "registry")
+
+    def __init__(self):
         self.indentationLevel = 0
         self.name = "Unknown"
-        self.innerClasses = []
-        self.methodProperties = []
-        self.attributeLines = []
-        self.defaultParameters = {}
-        self.innerEnums = []
+        self.template = TemplateGroup(self.name)
+        self.fragmentCache = None
+        # Events generated as typed payloads (see createTypedEventMethodDefinition) instead of EventData maps
+        self.typedPayloads = False
+        self.defaultParams = {}
+        # EventRegistry of the template, whose lookup table is written after the root class when set
+        self.registry = None
 
     def createInnerClass(self):
         return None
@@ -55,244 +884,364 @@ class CodeClass:
     def createEventClassDefinition(self):
         return None
 
-    def createMapDefinition(self, values):
+    def createMapDefinition(self, params, normalizedKeys=None):
         return None
 
     def createEventClassInstance(self, name, value):
         return None
 
-    def createEnumClassDefinition(self, name, caseParams):
+    def createNormalizedEventClassInstance(self, name, value, defaultParamsName=None):
         return None
 
-    def getOptionalitySuffix(self, paramValue):
-        suffix = ""
-        if (paramValue[len(paramValue) - 1] == "?"):            
-            suffix = "?"
-        return suffix
+    def createDefaultParamsDefinition(self, name, value):
+        return None
 
-    def parseParamType(self, paramValue):
-        if ("%" in paramValue):                
-            typeChar = re.findall("%.", paramValue)[0]
-            suffix = self.getOptionalitySuffix(paramValue)
-            
-            if (len(suffix) > 0 ):
-                paramValue = paramValue[0:(len(paramValue) - 1)]
-
-            if ("d" in typeChar):
-                return "Int%s" % suffix
-            elif ("f" in typeChar):
-                return "Double%s" % suffix
-            elif ("s" in typeChar):
-                return "String%s" % suffix
-            elif ("%{" in typeChar):
-                return "%s%s" % (paramValue[2:(len(paramValue) - 1)], suffix)
-            else:
-                raiseException("Unknown param type for param %s inside class %s" % (paramValue, self.name))
-        else:
-            return None
+    def createNormalizedValue(self, value):
+        return None
+
+    def createTypedEventMethodDefinition(self, event):
+        return None
+
+    def createEnumClassDefinition(self, enum):
+        return None
+
+    def createRegistryDefinition(self, chunks):
+        return None
+
+    def escapeStringLiteral(self, value):
+        # The content of a string literal holding value
+        return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\t", "\\t").replace("\n", "\\n")
+
+    def createConstantDefinition(self, constant):
+        value = constant.value
+        if (isinstance(value, str)):
+            return "%s %s = \"%s\"" % (self.constKeyword, constant.name, value)
+        elif (isinstance(value, float)):
+            return "%s %s = %.2f" % (self.constKeyword, constant.name, value)
+        return "%s %s = %d" % (self.constKeyword, constant.name, value)
 
-    def createMethodDefinition(self, name, value):
-        paramCount = 1
+    def createMethodDefinition(self, method):
         methodArguments = ""
         methodReturnValue = ""
 
-        splitValues = re.split("(%[sfd][^\{])|(%[sfd]$)|(%[sfd]{[^}]+})", value)
-        
-        for splitValue in splitValues:            
-            if (splitValue == None or splitValue == ''): 
-                continue
-            
-            if ("%" in splitValue):                
-                typeChar = re.findall("%.", splitValue)[0]
-                paramType = self.parseParamType(splitValue)                
-
-                # Define name of param
-                paramHasName = "{" in splitValue
-                paramName = ""
-                if (paramHasName):
-                    paramName = re.findall("\{(.*)\}", splitValue)[0]
-                    paramName = camelCasedString(paramName)
-                else:
-                    paramName = "a%d" % paramCount                                
+        for fragment in method.fragments:
+            if (fragment.isParam()):
+                paramName = fragment.paramName
 
-                paramCount += 1
-                
                 # Write arguments
                 if (len(methodArguments) > 0):
                     methodArguments = "%s, " % (methodArguments)
 
-                methodArguments = "%s%s" % (methodArguments, self.createParamName(paramName, paramType, paramHasName))
+                methodArguments = "%s%s" % (methodArguments, self.createParamName(paramName, fragment.paramType, fragment.userDefined))
 
                 # Write return value
-                if ("%{" in splitValue):
-                    suffix = self.getOptionalitySuffix(splitValue)
-                    paramName = "%s%s.pyRawValue" % (paramName, suffix)
-                                        
-                if (paramHasName):
+                if (fragment.isEnum()):
+                    paramName = "%s%s.pyRawValue" % (paramName, fragment.suffix)
+                                    
+                if (fragment.userDefined):
                     methodReturnValue = "%s%s" % (methodReturnValue, self.createStringInterpolatedValue(paramName))
                 else:
-                    paramName = splitValue.replace(typeChar, "%s" % self.createStringInterpolatedValue(paramName))
+                    paramName = fragment.text.replace(fragment.typeChar, "%s" % self.createStringInterpolatedValue(paramName))
                     methodReturnValue = "%s%s" % (methodReturnValue, paramName)
                 
                 continue
             
-            methodReturnValue = "%s%s" % (methodReturnValue, splitValue)
-
-        return (name, methodArguments, methodReturnValue)
-
-    def createMapDefinition(self, values):
-        params = ""
-        for valueKey in values:
-            value = values[valueKey]
+            methodReturnValue = "%s%s" % (methodReturnValue, fragment.text)
+
+        return (method.name, methodArguments, methodReturnValue)
+
+    def createMapDefinition(self, params, normalizedKeys=None):
+        # With normalizedKeys (see getNormalizedEventKeys) the keys and fixed values are written normalized,
+        # and the dynamic string values are normalized when the method is called
+        mapParams = ""
+        for (index, param) in enumerate(params):
+            value = param.value
+            key = param.key
+            if (normalizedKeys != None):
+                key = normalizedKeys[index]
             
-            if (len(params) > 0):
-                    params += ", "
+            if (len(mapParams) > 0):
+                    mapParams += ", "
 
             if (isinstance(value, str)):
-                if ("%" in value):
-                    if ("%{" in value):
-                        suffix = self.getOptionalitySuffix(value)
-                        params += "\"%s\" = %s%s.pyRawValue" % (valueKey, camelCasedString(valueKey), suffix)
+                if (param.isEnum()):
+                    rawValue = "%s%s.pyRawValue" % (param.argumentName, param.suffix)
+                    if (normalizedKeys != None):
+                        rawValue = self.createNormalizedValue(rawValue)
+                    mapParams += "\"%s\" = %s" % (key, rawValue)
+                elif (param.isDynamic()):
+                    argument = param.argumentName
+                    if (normalizedKeys != None and param.paramType.startswith("String")):
+                        argument = "%s%s.pyNormalized()" % (argument, param.suffix)
+                    mapParams += "\"%s\" = %s" % (key, argument)
+                elif (normalizedKeys != None):
+                    normalizedValue = normalizedString(value)
+                    if (normalizedValue == None):
+                        mapParams += "\"%s\" = \"%s\".pyNormalized()" % (key, value)
                     else:
-                        params += "\"%s\" = %s" % (valueKey, camelCasedString(valueKey))
+                        mapParams += "\"%s\" = \"%s\"" % (key, normalizedValue)
                 else:
-                    params += "\"%s\" = \"%s\"" % (valueKey, value)
+                    mapParams += "\"%s\" = \"%s\"" % (key, value)
             elif (isinstance(value, float)):
-                params += "\"%s\" = %.2f" % (valueKey, value)
+                mapParams += "\"%s\" = %.2f" % (key, value)
             elif (isinstance(value, int)):
-                params += "\"%s\" = %d" % (valueKey, value)            
+                mapParams += "\"%s\" = %d" % (key, value)            
             elif (isinstance(value, list)):
-                raiseException("Arrays are not supported! Use only strings, floats, ints and objects.")
-        return params
+                raise TemplateError("Arrays are not supported! Use only strings, floats, ints and objects.")
+        return mapParams
 
-    def createEventMethodDefinition(self, methodName, eventName, eventParams, excludeParams):
+    def createEventMethodDefinition(self, event):
         methodArguments = ""
         methodReturnValue = ""
 
-        for paramName in self.defaultParameters:
-            if (paramName in eventParams):
-                continue
-            eventParams[paramName] = self.defaultParameters[paramName]
-        
-        for paramName in excludeParams:
-            if (paramName in eventParams):
-                del eventParams[paramName]
-
-        for paramName in eventParams:
-            paramValue = eventParams[paramName]
-            paramType = ""
-            # Define type of param
-            if (isinstance(paramValue, str)):
-                if ("%" in paramValue):                
-                   paramType = self.parseParamType(paramValue)
-                else:
-                    continue # fixed value
-            else:
+        for param in event.params:
+            if (not param.isDynamic()):
                 continue # fixed value
 
             # Write arguments
             if (len(methodArguments) > 0):
                 methodArguments = "%s, " % (methodArguments)
 
-            paramName = camelCasedString(paramName)
-
-            methodArguments = "%s%s" % (methodArguments, self.createParamName(paramName, paramType, True))                                                
+            methodArguments = "%s%s" % (methodArguments, self.createParamName(param.argumentName, param.paramType, True))                                                
 
         # Write return value
-        mapParams = self.createMapDefinition(eventParams)
-        methodReturnValue = self.createEventClassInstance(eventName, mapParams)
-
-        return (methodName, methodArguments, methodReturnValue)
-
-
-    def parseClassObject(self, jsonObject):
-        properties = jsonObject
-
-        for key in properties:
-            value = properties[key]
-            if (isinstance(value, str)):
-                if "%" in value:
-                    methodLines = self.createMethodDefinition(key, value)
-                    self.methodProperties.append(methodLines)
+        normalizedKeys = getNormalizedEventKeys(event)
+        if (normalizedKeys == None):
+            mapParams = self.createMapDefinition(event.params)
+            methodReturnValue = self.createEventClassInstance(event.eventName, mapParams)
+        else:
+            (params, keys) = ([], [])
+            defaultParams = self.defaultParams.get(tuple([param.key for param in event.params if param.isFixedDefault()]))
+            for (param, key) in zip(event.params, normalizedKeys[1]):
+                if (defaultParams == None or not param.isFixedDefault()):
+                    params.append(param)
+                    keys.append(key)
+            mapParams = self.createMapDefinition(params, keys)
+            if (defaultParams == None):
+                methodReturnValue = self.createNormalizedEventClassInstance(normalizedKeys[0], mapParams)
+            else:
+                methodReturnValue = self.createNormalizedEventClassInstance(normalizedKeys[0], mapParams, defaultParams[0])
+
+        return (event.methodName, methodArguments, methodReturnValue)
+
+    def getTypedEventParams(self, event):
+        # The dynamic values of a typed payload, as (property, type, argument) of its constructor, and every param
+        # as (key, visitor method, value, property, optional): value is a literal for fixed params, and a format of
+        # the (unwrapped) property for dynamic ones, whose optional values are only visited when not null
+        properties = []
+        visits = []
+        for param in event.params:
+            key = normalizedString(param.key)
+            if (key == None):
+                key = "\"%s\".pyNormalized()" % param.key
+            else:
+                key = "\"%s\"" % key
+
+            value = param.value
+            if (isinstance(value, str) and param.isDynamic()):
+                propertyName = "p%d" % len(properties)
+                properties.append((propertyName, param.paramType, param.argumentName))
+                optional = param.paramType.endswith("?")
+                if (param.isEnum()):
+                    visits.append((key, "rawParam", "%s.pyRawValue", propertyName, optional))
+                elif (param.paramType.startswith("String")):
+                    visits.append((key, "param", "%s.pyNormalized()", propertyName, optional))
+                else:
+                    visits.append((key, "param", "%s", propertyName, optional))
+            elif (isinstance(value, str)):
+                normalizedValue = normalizedString(value)
+                if (normalizedValue == None):
+                    visits.append((key, "param", "\"%s\".pyNormalized()" % value, None, False))
                 else:
-                    self.attributeLines.append(("%s %s = \"%s\"" % (self.constKeyword, key, value)))
+                    visits.append((key, "param", "\"%s\"" % normalizedValue, None, False))
             elif (isinstance(value, float)):
-                self.attributeLines.append(("%s %s = %.2f" % (self.constKeyword, key, value)))
+                visits.append((key, "param", "%.2f" % value, None, False))
             elif (isinstance(value, int)):
-                self.attributeLines.append(("%s %s = %d" % (self.constKeyword, key, value)))
+                visits.append((key, "param", "%d" % value, None, False))
             elif (isinstance(value, list)):
-                raiseException("Arrays are not supported! Use only strings, floats, ints and objects.")
-            elif (isinstance(value, object)):
-                if (key == "_defaultParams"):
-                    self.defaultParameters = value
-                elif (key == "_enums"):
-                    for enumClass in value:
-                        enum = self.createEnumClassDefinition(enumClass, value[enumClass])
-                        self.innerEnums.append(enum)
-                elif "_name" in value:
-                    eventName = value["_name"]
-                    eventParams = value["_params"]
-                    excludeParams = []
-                    if ("_excludeParams" in value):
-                        excludeParams = value["_excludeParams"]
+                raise TemplateError("Arrays are not supported! Use only strings, floats, ints and objects.")
+        return (properties, visits)
+
+    def getTypedEventName(self, event):
+        name = normalizedString(event.eventName)
+        if (name == None):
+            return "\"%s\".pyNormalized()" % event.eventName
+        return "\"%s\"" % name
+
+    def getTypedEventClassName(self, event):
+        return "%s%sPayload" % (event.methodName[0:1].upper(), event.methodName[1:])
+
+    def fragmentLanguage(self):
+        # The language of the fragment cache blocks, which differ with typed payloads
+        if (self.typedPayloads):
+            return "%s+typed" % self.language
+        return self.language
+
+    def loadTemplateGroup(self, group):
+        # Lines are only formatted while writing, so no language specific copy of the tree is kept
+        self.template = group
+        self.name = group.name
+        self.indentationLevel = group.level
+
+    def loadDefaultParams(self):
+        # The fixed params merged from _defaultParams are written once per group, in a constant shared by the events
+        # (built with normalized keys) that have the same ones: events excluding or overriding some of them get
+        # another constant. Maps the keys of each distinct set to its (constant name, params, normalized keys).
+        self.defaultParams = {}
+        if (self.typedPayloads):
+            return # typed payloads don't allocate the params, their fixed values are visited in place
+        for member in self.template.methods:
+            if (not isinstance(member, TemplateEvent)):
+                continue
+            normalizedKeys = getNormalizedEventKeys(member)
+            if (normalizedKeys == None):
+                continue
+            (params, keys) = ([], [])
+            for (param, key) in zip(member.params, normalizedKeys[1]):
+                if (param.isFixedDefault()):
+                    params.append(param)
+                    keys.append(key)
+            defaultKeys = tuple([param.key for param in params])
+            if (len(params) == 0 or defaultKeys in self.defaultParams):
+                continue
+            name = "pyDefaultParams"
+            if (len(self.defaultParams) > 0):
+                name = "pyDefaultParams%d" % (len(self.defaultParams) + 1)
+            self.defaultParams[defaultKeys] = (name, params, keys)
+
+    def createMemberDefinition(self, method):
+        if (isinstance(method, TemplateEvent)):
+            if (self.typedPayloads):
+                return self.createTypedEventMethodDefinition(method)
+            return self.createEventMethodDefinition(method)
+        return self.createMethodDefinition(method)
 
-                    eventMethodLines = self.createEventMethodDefinition(key, eventName, eventParams, excludeParams)
-                    self.methodProperties.append(eventMethodLines)
-                else:  
-                    innerClass = self.createInnerClass()
-                    innerClass.name = key
-                    innerClass.indentationLevel = self.indentationLevel + 1
-                    innerClass.parseClassObject(value)
-                    self.innerClasses.append(innerClass)
+    def parseClassObject(self, jsonObject):
+        self.loadTemplateGroup(parseTemplateGroup(jsonObject, self.name, self.indentationLevel))
 
     def indentation(self, level):
-            ident = ""
-            for i in range(0,level):
-                ident = "%s%s" % (ident, self.indentationCharacter)
-            return ident
+        key = (self.indentationCharacter, level)
+        ident = indentationStrings.get(key)
+        if (ident == None):
+            ident = self.indentationCharacter * level
+            indentationStrings[key] = ident
+        return ident
     
-    def generateClassDefinitionLines(self):
-        lines = []
-        
+    def writeClassDefinitionLines(self, lines, offset=0, block=None):
+        # Every line is written once, already prefixed with the indentation of the enclosing classes (offset).
+        # `lines` can be a list or a BufferedLineWriter streaming straight to the output file.
+        # When a fragment cache is set, the lines of this class are also recorded in `block`,
+        # with the cached blocks of its subgroups recorded as references.
+        self.writeClassHeaderLines(lines, offset, block, len(self.template.subgroups) > 0)
+        for subgroup in self.template.subgroups:
+            self.writeSubgroupLines(subgroup, lines, offset, block)
+        self.writeClassFooterLines(lines, offset, block)
+        return lines
+
+    def writeClassHeaderLines(self, lines, offset=0, block=None, hasSubgroups=False):
+        # The class definition and its own members, up to where its subgroups begin
+        group = self.template
+
         def writeLine(line, level):
-            lines.append("%s%s" % (self.indentation(level), line))
+            line = "%s%s" % (self.indentation(level + offset), line)
+            lines.append(line)
+            if (block != None):
+                block.append(line)
 
         writeLine(self.createClassDefinition(), self.indentationLevel)
         
-        for enum in self.innerEnums:
-            writeLine(enum, self.indentationLevel + 1)
+        for enum in group.enums:
+            writeLine(self.createEnumClassDefinition(enum), self.indentationLevel + 1)
+
+        for constant in group.constants:
+            writeLine(self.createConstantDefinition(constant), self.indentationLevel + 1)
 
-        for attributeLine in self.attributeLines:
-            writeLine(attributeLine, self.indentationLevel + 1)
+        self.loadDefaultParams()
+        for (name, params, keys) in self.defaultParams.values():
+            writeLine(self.createDefaultParamsDefinition(name, self.createMapDefinition(params, keys)), self.indentationLevel + 1)
 
-        if (len(self.methodProperties) > 0):
+        if (len(group.methods) > 0):
             writeLine("", self.indentationLevel)
         
-        for method in self.methodProperties:
+        for member in group.methods:
+            method = self.createMemberDefinition(member)
             writeLine(method[0], self.indentationLevel + 1)
             for line in range(1, len(method) - 1):
-                writeLine(method[line], self.indentationLevel + 2)
+                if (isinstance(method[line], tuple)):
+                    # (depth, line), indented relatively to the method body
+                    writeLine(method[line][1], self.indentationLevel + 2 + method[line][0])
+                else:
+                    writeLine(method[line], self.indentationLevel + 2)
             writeLine(method[-1], self.indentationLevel + 1)
 
-        if (len(self.innerClasses) > 0):
+        if (hasSubgroups):
             writeLine("", self.indentationLevel)
 
-        for innerClass in self.innerClasses:
-            innerClassLines = innerClass.generateClassDefinitionLines()
-            for innerClassLine in innerClassLines:
-                writeLine(innerClassLine, self.indentationLevel)
-                    
-        writeLine("}", self.indentationLevel)
-        
-        return lines
+    def writeSubgroupLines(self, subgroup, lines, offset=0, block=None):
+        if (self.fragmentCache == None or subgroup.fingerprint == None):
+            innerClass = self.createInnerClass()
+            innerClass.typedPayloads = self.typedPayloads
+            innerClass.loadTemplateGroup(subgroup)
+            innerClass.writeClassDefinitionLines(lines, offset + self.indentationLevel, block)
+            return
+
+        blockKey = self.fragmentCache.blockKey(self.fragmentLanguage(), subgroup.name, subgroup.level, subgroup.fingerprint)
+        if (block != None):
+            block.append((blockKey,))
+
+        if (subgroup.cached or self.fragmentCache.hasBlock(blockKey)):
+            self.fragmentCache.writeBlock(blockKey, lines)
+        else:
+            innerClass = self.createInnerClass()
+            innerClass.fragmentCache = self.fragmentCache
+            innerClass.typedPayloads = self.typedPayloads
+            innerClass.loadTemplateGroup(subgroup)
+            innerBlock = []
+            innerClass.writeClassDefinitionLines(lines, offset + self.indentationLevel, innerBlock)
+            self.fragmentCache.storeBlock(blockKey, innerBlock)
+
+    def writeExtensionLines(self, subgroup, lines, header=None):
+        # A top-level subgroup written in its own file, as an extension of this (root) class
+        lines.append("extension %s {" % self.name)
+        self.writeSubgroupLines(subgroup, lines)
+        lines.append("}")
+
+    def writeClassFooterLines(self, lines, offset=0, block=None):
+        line = "%s}" % self.indentation(self.indentationLevel + offset)
+        lines.append(line)
+        if (block != None):
+            block.append(line)
+
+    def generateClassDefinitionLines(self):
+        return self.writeClassDefinitionLines([])
+
+    def getRegistryChunks(self, maxChunkLength=16384):
+        # A "name<TAB>method<TAB>key:type,key:type" line per registered event, sorted by name, as string literals
+        # short enough to be constants of any of the languages (a class file constant can't exceed 64KB)
+        chunks = []
+        chunkLines = []
+        chunkLength = 0
+        for registryEvent in self.registry.registeredEvents():
+            params = ",".join(["%s:%s" % (key, getRegistryParamType(param)) for (param, key) in zip(registryEvent.event.params, registryEvent.normalizedKeys[1])])
+            line = self.escapeStringLiteral("%s\t%s\t%s\n" % (registryEvent.name, registryEvent.method, params))
+            if (chunkLength + len(line) > maxChunkLength and len(chunkLines) > 0):
+                chunks.append("\"%s\"" % "".join(chunkLines))
+                chunkLines = []
+                chunkLength = 0
+            chunkLines.append(line)
+            chunkLength += len(line)
+        if (len(chunkLines) > 0):
+            chunks.append("\"%s\"" % "".join(chunkLines))
+        return chunks
+
+    def writeRegistryLines(self, lines):
+        lines.append(self.createRegistryDefinition(self.getRegistryChunks()))
 
 class KotlinClass(CodeClass):    
-    def __init__(self):
-        super().__init__(
-            indentationCharacter="    ",
-            language= "Kotlin",
-            constKeyword= "const val"
-        )
+    indentationCharacter = "    "
+    language = "Kotlin"
+    constKeyword = "const val"
+    __slots__ = ()
     
     def createInnerClass(self):
         return KotlinClass()
@@ -303,26 +1252,79 @@ class KotlinClass(CodeClass):
     def createStringInterpolatedValue(self, value):
         return "${%s}" % value
 
+    def writeExtensionLines(self, subgroup, lines, header=None):
+        # Kotlin objects can't be extended with nested objects, so the subgroup becomes a top-level object
+        # reached through an extension property of the root object: Root.Group.event() still compiles.
+        # It is no longer nested in the root object, whose enums are then imported.
+        shardName = "%s%s" % (self.name, subgroup.name)
+        packagePrefix = ""
+        if (header != None and header.startswith("package ")):
+            packagePrefix = "%s." % header[len("package "):].strip()
+        for enum in self.template.enums:
+            lines.append("import %s%s.%s" % (packagePrefix, self.name, enum.name))
+        if (len(self.template.enums) > 0):
+            lines.append("")
+
+        lines.append("val %s.%s: %s" % (self.name, subgroup.name, shardName))
+        lines.append("%sget() = %s" % (self.indentation(1), shardName))
+        lines.append("")
+
+        # The subgroup lines (maybe spliced from the fragment cache) are written one level less indented
+        subgroupLines = []
+        self.writeSubgroupLines(subgroup, subgroupLines)
+        subgroupLines[0] = subgroupLines[0].replace("object %s {" % subgroup.name, "object %s {" % shardName, 1)
+        indentation = self.indentation(1)
+        for chunk in subgroupLines:
+            chunk = chunk.replace("\n%s" % indentation, "\n")
+            if (chunk.startswith(indentation)):
+                chunk = chunk[len(indentation):]
+            lines.append(chunk)
+
     def createParamName(self, name, type, userDefined):
         return "%s: %s" % (name, type)
 
-    def createMethodDefinition(self, name, value):
-        methodProps = super().createMethodDefinition(name, value)
+    def createMethodDefinition(self, method):
+        methodProps = super().createMethodDefinition(method)
         return [
             "fun %s(%s): String {" % (methodProps[0], methodProps[1]),
             "return \"%s\"" % (methodProps[2]),
             "}"
         ]
     
-    def createEventMethodDefinition(self, methodName, eventName, eventParams, excludeParams):
-        methodProps = super().createEventMethodDefinition(methodName, eventName, eventParams, excludeParams)
+    def createEventMethodDefinition(self, event):
+        methodProps = super().createEventMethodDefinition(event)
         return [
             "fun %s(%s): EventData {" % (methodProps[0], methodProps[1]),
             "return %s" % (methodProps[2]),
             "}"
         ]
 
-    def createEnumClassDefinition(self, name, caseParams):
+    def createTypedEventMethodDefinition(self, event):
+        # A class per event holding its dynamic values unboxed, and the method returning it
+        className = self.getTypedEventClassName(event)
+        (properties, visits) = self.getTypedEventParams(event)
+        constructorParams = ", ".join(["private val %s: %s" % (propertyName, paramType) for (propertyName, paramType, argument) in properties])
+        lines = [
+            "class %s(%s) : TypedEventData(%s, %d) {" % (className, constructorParams, self.getTypedEventName(event), len(visits)),
+            "override fun forEachParam(visitor: EventParamVisitor) {"
+        ]
+        for (key, method, value, propertyName, optional) in visits:
+            if (propertyName == None):
+                lines.append((1, "visitor.%s(%s, %s)" % (method, key, value)))
+            elif (optional):
+                lines.append((1, "this.%s?.let { visitor.%s(%s, %s) }" % (propertyName, method, key, value % "it")))
+            else:
+                lines.append((1, "visitor.%s(%s, %s)" % (method, key, value % ("this.%s" % propertyName))))
+        lines.append("}")
+        lines.append((-1, "}"))
+
+        methodArguments = ", ".join([self.createParamName(argument, paramType, True) for (propertyName, paramType, argument) in properties])
+        constructorArguments = ", ".join([argument for (propertyName, paramType, argument) in properties])
+        lines.append("fun %s(%s): %s = %s(%s)" % (event.methodName, methodArguments, className, className, constructorArguments))
+        return lines
+
+    def createEnumClassDefinition(self, enum):
+        name = enum.name
         indent = self.indentation(self.indentationLevel + 1)
         enumHeader = """
 %sinterface %s: PyRawRepresentable {
@@ -330,13 +1332,12 @@ class KotlinClass(CodeClass):
 %s        private data class EnumData(override val pyRawValue: Any): %s
 """ % (indent, name, indent, indent, name)
         enumCases = ""
-        for case in caseParams:            
-            value = caseParams[case]
+        for enumCase in enum.cases:
+            case = enumCase.name
+            value = enumCase.value
             if (isinstance(value, str)):
-                if ("%" in value):
-                    if (value.count("%") > 1):
-                        raiseException("Enums cannot have more than one parameter, but it has at case %s.%s with value %s" % (name, case, value))
-                    methodProps = super().createMethodDefinition(case, value)
+                if (enumCase.method != None):
+                    methodProps = super().createMethodDefinition(enumCase.method)
                     paramDefinition = methodProps[1]
                     argument = methodProps[2] 
                     argument = argument[2:len(argument) - 1] # trimming interpolation characters
@@ -353,27 +1354,45 @@ class KotlinClass(CodeClass):
 
 
     def createEventClassDefinition(self):
-        return """
+        runtime = """
 import java.text.Normalizer
 
-private val pyDiactricsRegex = "\\\\p{Mn}+".toRegex()
-private val pyNormalizationRegex = "[^\\\\w]".toRegex()
-
 interface PyRawRepresentable {
     val pyRawValue: Any
 }
 
+// Lowercased, without diacritics, and with each run of characters other than ASCII letters and digits
+// replaced by a single underscore (none at the ends), in a single pass over the decomposed string
 fun String.pyNormalized(): String {
-    return Normalizer.normalize(this.lowercase(), Normalizer.Form.NFD)
-        .replace(pyDiactricsRegex, "")
-        .replace(pyNormalizationRegex, "_")
-        .split("_")
-        .filter({  s -> s.length > 0 })
-        .joinToString(separator = "_")
+    val decomposed = Normalizer.normalize(this.lowercase(), Normalizer.Form.NFD)
+    val normalized = StringBuilder(decomposed.length)
+    var separated = false
+    var index = 0
+    while (index < decomposed.length) {
+        val codePoint = decomposed.codePointAt(index)
+        index += Character.charCount(codePoint)
+        if (Character.getType(codePoint) == Character.NON_SPACING_MARK.toInt()) {
+            continue
+        }
+        if ((codePoint >= 'a'.code && codePoint <= 'z'.code) || (codePoint >= 'A'.code && codePoint <= 'Z'.code) || (codePoint >= '0'.code && codePoint <= '9'.code)) {
+            if (separated && normalized.length > 0) {
+                normalized.append('_')
+            }
+            normalized.append(codePoint.toChar())
+            separated = false
+        }
+        else {
+            separated = true
+        }
+    }
+    return normalized.toString()
 }
 
+// Capacity of a HashMap holding count entries without being resized
+private fun pyHashMapCapacity(count: Int): Int = (count / 0.75f).toInt() + 1
+
 fun Map<String, Any?>.pyNormalized(): Map<String, Any> {
-    var map = HashMap<String, Any>()
+    val map = HashMap<String, Any>(pyHashMapCapacity(this.size))
     for ((key, value) in this) {
         val v = value ?: continue
         if (v is String) {
@@ -386,29 +1405,146 @@ fun Map<String, Any?>.pyNormalized(): Map<String, Any> {
     return map
 }
 
-data class EventData(private val rawName: String, private val rawParams: Map<String, Any?>) {
-    val name = this.rawName.pyNormalized()
-    val params = this.rawParams.pyNormalized()
-    
+class EventData private constructor(val name: String, val params: Map<String, Any>, @Suppress("UNUSED_PARAMETER") normalized: Boolean) {
+    constructor(rawName: String, rawParams: Map<String, Any?>) : this(rawName.pyNormalized(), rawParams.pyNormalized(), true)
+
+    override fun equals(other: Any?) = other is EventData && other.name == this.name && other.params == this.params
+    override fun hashCode() = 31 * this.name.hashCode() + this.params.hashCode()
     override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+
+    companion object {
+        // The generated methods write the name and the keys already normalized, only their values are normalized when called
+        fun normalized(name: String, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(params.size))
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        // Same, with the fixed default params of the event's group shared by its events
+        fun normalized(name: String, defaults: Map<String, Any>, params: Map<String, Any?>): EventData {
+            val map = HashMap<String, Any>(pyHashMapCapacity(defaults.size + params.size))
+            map.putAll(defaults)
+            for ((key, value) in params) {
+                map.put(key, value ?: continue)
+            }
+            return EventData(name, map, true)
+        }
+
+        fun normalizedValue(value: Any?): Any? = if (value is String) value.pyNormalized() else value
+    }
 }
         """
+        if (self.typedPayloads):
+            runtime += """
+// Receives the params of a typed event without boxing its numbers
+interface EventParamVisitor {
+    fun param(key: String, value: String)
+    fun param(key: String, value: Int)
+    fun param(key: String, value: Double)
+
+    fun rawParam(key: String, value: Any) {
+        when (value) {
+            is String -> this.param(key, value.pyNormalized())
+            is Int -> this.param(key, value)
+            is Double -> this.param(key, value)
+        }
+    }
+}
+
+abstract class TypedEventData(val name: String, private val paramCount: Int) {
+    private var paramsMap: Map<String, Any>? = null
+
+    abstract fun forEachParam(visitor: EventParamVisitor)
+
+    // Map view of the params, only built when asked for
+    val params: Map<String, Any>
+        get() {
+            val cached = this.paramsMap
+            if (cached != null) {
+                return cached
+            }
+            val map = HashMap<String, Any>(pyHashMapCapacity(this.paramCount))
+            this.forEachParam(object : EventParamVisitor {
+                override fun param(key: String, value: String) { map.put(key, value) }
+                override fun param(key: String, value: Int) { map.put(key, value) }
+                override fun param(key: String, value: Double) { map.put(key, value) }
+            })
+            this.paramsMap = map
+            return map
+        }
+
+    fun toEventData(): EventData = EventData.normalized(this.name, this.params)
+
+    override fun toString() = "EventData(name=${this.name}, params=${this.params})"
+}
+"""
+        return runtime
 
     def createEventClassInstance(self, name, value):
         return "EventData(\"%s\", %s)" % (name, value)
 
-    def createMapDefinition(self, values):
-        mapValues = super().createMapDefinition(values)
+    def createNormalizedEventClassInstance(self, name, value, defaultParamsName=None):
+        if (defaultParamsName != None):
+            return "EventData.normalized(\"%s\", %s, %s)" % (name, defaultParamsName, value)
+        return "EventData.normalized(\"%s\", %s)" % (name, value)
+
+    def createDefaultParamsDefinition(self, name, value):
+        return "private val %s: Map<String, Any> = %s" % (name, value)
+
+    def createNormalizedValue(self, value):
+        return "EventData.normalizedValue(%s)" % value
+
+    def escapeStringLiteral(self, value):
+        return super().escapeStringLiteral(value).replace("$", "\\$")
+
+    def createRegistryDefinition(self, chunks):
+        registryChunks = ",\n        ".join(chunks)
+        registry = """
+// Every event of %s by its normalized name (the one of EventData.name), found with a binary search
+object %sEventRegistry {
+    class Entry(val name: String, val method: String, val params: Map<String, String>)
+
+    // A "name\\tmethod\\tkey:type,key:type" line per event, sorted by name
+    private val chunks: Array<String> = arrayOf(
+        %s
+    )
+    private val lines: List<String> by lazy { chunks.joinToString("").split('\\n').dropLast(1) }
+    private val names: Array<String> by lazy { Array(lines.size) { lines[it].substringBefore('\\t') } }
+
+    val size: Int
+        get() = names.size
+
+    fun contains(name: String): Boolean = java.util.Arrays.binarySearch(names, name) >= 0
+
+    fun lookup(name: String): Entry? {
+        val index = java.util.Arrays.binarySearch(names, name)
+        if (index < 0) {
+            return null
+        }
+        val fields = lines[index].split('\\t')
+        val params = LinkedHashMap<String, String>()
+        if (fields[2].isNotEmpty()) {
+            for (param in fields[2].split(',')) {
+                params.put(param.substringBefore(':'), param.substringAfter(':'))
+            }
+        }
+        return Entry(fields[0], fields[1], params)
+    }
+}""" % (self.name, self.name, registryChunks)
+        return registry
+
+    def createMapDefinition(self, params, normalizedKeys=None):
+        mapValues = super().createMapDefinition(params, normalizedKeys)
         return "mapOf(%s)" % (mapValues.replace("=","to"))
                 
 
 class SwiftClass(CodeClass):    
-    def __init__(self):
-        super().__init__(
-            indentationCharacter="    ",
-            language= "Swift",
-            constKeyword= "public static let"
-        )
+    indentationCharacter = "    "
+    language = "Swift"
+    constKeyword = "public static let"
+    __slots__ = ()
     
     def createInnerClass(self):
         return SwiftClass()
@@ -424,23 +1560,51 @@ class SwiftClass(CodeClass):
             return "%s: %s" % (name, type)
         return "_ %s: %s" % (name, type)
 
-    def createMethodDefinition(self, name, value):
-        methodProps = super().createMethodDefinition(name, value)
+    def createMethodDefinition(self, method):
+        methodProps = super().createMethodDefinition(method)
         return [
             "public static func %s(%s) -> String {" % (methodProps[0], methodProps[1]),
             "return \"%s\"" % (methodProps[2]),
             "}"
         ]
     
-    def createEventMethodDefinition(self, methodName, eventName, eventParams, excludeParams):
-        methodProps = super().createEventMethodDefinition(methodName, eventName, eventParams, excludeParams)
+    def createEventMethodDefinition(self, event):
+        methodProps = super().createEventMethodDefinition(event)
         return [
             "public static func %s(%s) -> EventData {" % (methodProps[0], methodProps[1]),
             "return %s" % (methodProps[2]),
             "}"
         ]
 
-    def createEnumClassDefinition(self, name, caseParams):
+    def createTypedEventMethodDefinition(self, event):
+        # A struct per event holding its dynamic values unboxed, and the method returning it
+        className = self.getTypedEventClassName(event)
+        (properties, visits) = self.getTypedEventParams(event)
+        lines = ["public struct %s: TypedEventData {" % className]
+        for (propertyName, paramType, argument) in properties:
+            lines.append("let %s: %s" % (propertyName, paramType))
+        lines.append("public var name: String { return %s }" % self.getTypedEventName(event))
+        lines.append("public var paramCount: Int { return %d }" % len(visits))
+        lines.append("public func forEachParam(_ visitor: EventParamVisitor) {")
+        for (key, method, value, propertyName, optional) in visits:
+            if (propertyName == None):
+                lines.append((1, "visitor.%s(%s, %s)" % (method, key, value)))
+            elif (optional):
+                lines.append((1, "if let %s = self.%s { visitor.%s(%s, %s) }" % (propertyName, propertyName, method, key, value % propertyName)))
+            else:
+                lines.append((1, "visitor.%s(%s, %s)" % (method, key, value % ("self.%s" % propertyName))))
+        lines.append("}")
+        lines.append((-1, "}"))
+
+        methodArguments = ", ".join([self.createParamName(argument, paramType, True) for (propertyName, paramType, argument) in properties])
+        constructorArguments = ", ".join(["%s: %s" % (propertyName, argument) for (propertyName, paramType, argument) in properties])
+        lines.append((-1, "public static func %s(%s) -> %s {" % (event.methodName, methodArguments, className)))
+        lines.append("return %s(%s)" % (className, constructorArguments))
+        lines.append("}")
+        return lines
+
+    def createEnumClassDefinition(self, enum):
+        name = enum.name
         indent = self.indentation(self.indentationLevel + 1)
         enumHeader = """
 %spublic struct %s: PyRawRepresentable {
@@ -448,13 +1612,12 @@ class SwiftClass(CodeClass):
 %s    private init(_ value: Any) { self.pyRawValue = value }
 """ % (indent, name, indent, indent)
         enumCases = ""
-        for case in caseParams:            
-            value = caseParams[case]
+        for enumCase in enum.cases:
+            case = enumCase.name
+            value = enumCase.value
             if (isinstance(value, str)):
-                if ("%" in value):
-                    if (value.count("%") > 1):
-                        raiseException("Enums cannot have more than one parameter, but it has at case %s.%s with value %s" % (name, case, value))
-                    methodProps = super().createMethodDefinition(case, value)
+                if (enumCase.method != None):
+                    methodProps = super().createMethodDefinition(enumCase.method)
                     paramDefinition = methodProps[1]
                     argument = methodProps[2] 
                     argument = argument[2:len(argument) - 1] # trimming interpolation characters
@@ -470,32 +1633,47 @@ class SwiftClass(CodeClass):
 
 
     def createEventClassDefinition(self):
-        return  """
+        runtime = """
 import Foundation
 
 protocol PyRawRepresentable {
     var pyRawValue: Any { get }
 }
 
+private let pyAlphanumerics = CharacterSet.alphanumerics
+
 extension String {
+    // Folded, and with each run of characters other than letters and digits replaced by a single underscore
+    // (none at the ends), in a single pass over the folded string
     func pyNormalized() -> String {
         let simple = folding(options: [.diacriticInsensitive, .widthInsensitive, .caseInsensitive], locale: nil)
-        let nonAlphaNumeric = CharacterSet.alphanumerics.inverted
-        return simple.components(separatedBy: nonAlphaNumeric)
-            .joined(separator: "_")
-            .split(separator: "_")
-            .filter({ $0.count > 0 })
-            .joined(separator: "_")
+        var normalized = ""
+        normalized.reserveCapacity(simple.utf8.count)
+        var separated = false
+        for scalar in simple.unicodeScalars {
+            if (pyAlphanumerics.contains(scalar)) {
+                if (separated && !normalized.isEmpty) {
+                    normalized.unicodeScalars.append("_")
+                }
+                normalized.unicodeScalars.append(scalar)
+                separated = false
+            }
+            else {
+                separated = true
+            }
+        }
+        return normalized
     }
 }
 
 extension Dictionary where Key == String, Value == Any? {
     func pyNormalized() -> [String: Any] {
-        return self.reduce([:], { result, keyValue in
-            var r = result
-            r[keyValue.key.pyNormalized()] = ((keyValue.value as? String)?.pyNormalized()) ?? keyValue.value
-            return r
-        })
+        var normalized = [String: Any](minimumCapacity: self.count)
+        for (key, value) in self {
+            guard let value = value else { continue }
+            normalized[key.pyNormalized()] = (value as? String)?.pyNormalized() ?? value
+        }
+        return normalized
     }
 }
 
@@ -507,62 +1685,527 @@ public struct EventData {
         self.name = name.pyNormalized()
         self.params = params.pyNormalized()
     }
+
+    // The generated methods write the name and the keys already normalized, only their values are normalized when called
+    init(normalizedName: String, params: [String: Any?]) {
+        var normalizedParams = [String: Any](minimumCapacity: params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    // Same, with the fixed default params of the event's group shared by its events
+    init(normalizedName: String, defaults: [String: Any], params: [String: Any?]) {
+        var normalizedParams = defaults
+        normalizedParams.reserveCapacity(defaults.count + params.count)
+        for (key, value) in params {
+            guard let value = value else { continue }
+            normalizedParams[key] = value
+        }
+        self.name = normalizedName
+        self.params = normalizedParams
+    }
+
+    static func normalizedValue(_ value: Any?) -> Any? {
+        return (value as? String)?.pyNormalized() ?? value
+    }
 }
         """
+        if (self.typedPayloads):
+            runtime += """
+// Receives the params of a typed event without boxing its numbers
+public protocol EventParamVisitor: AnyObject {
+    func param(_ key: String, _ value: String)
+    func param(_ key: String, _ value: Int)
+    func param(_ key: String, _ value: Double)
+}
+
+extension EventParamVisitor {
+    func rawParam(_ key: String, _ value: Any) {
+        if let value = value as? String {
+            self.param(key, value.pyNormalized())
+        } else if let value = value as? Int {
+            self.param(key, value)
+        } else if let value = value as? Double {
+            self.param(key, value)
+        }
+    }
+}
+
+public protocol TypedEventData {
+    var name: String { get }
+    var paramCount: Int { get }
+    func forEachParam(_ visitor: EventParamVisitor)
+}
+
+private final class PyParamsCollector: EventParamVisitor {
+    var params: [String: Any]
+
+    init(capacity: Int) {
+        self.params = [String: Any](minimumCapacity: capacity)
+    }
+
+    func param(_ key: String, _ value: String) { self.params[key] = value }
+    func param(_ key: String, _ value: Int) { self.params[key] = value }
+    func param(_ key: String, _ value: Double) { self.params[key] = value }
+}
+
+extension TypedEventData {
+    // Map view of the params, only built when asked for
+    public var params: [String: Any] {
+        let collector = PyParamsCollector(capacity: self.paramCount)
+        self.forEachParam(collector)
+        return collector.params
+    }
+
+    public var eventData: EventData {
+        return EventData(normalizedName: self.name, params: self.params)
+    }
+}
+"""
+        return runtime
     
     def createEventClassInstance(self, name, value):
         return "EventData(name: \"%s\", params: %s)" % (name, value)
 
-    def createMapDefinition(self, values):
-        mapValues = super().createMapDefinition(values)
-        return "[%s]" % (mapValues.replace("=",":"))
+    def createNormalizedEventClassInstance(self, name, value, defaultParamsName=None):
+        if (defaultParamsName != None):
+            return "EventData(normalizedName: \"%s\", defaults: %s, params: %s)" % (name, defaultParamsName, value)
+        return "EventData(normalizedName: \"%s\", params: %s)" % (name, value)
+
+    def createDefaultParamsDefinition(self, name, value):
+        return "private static let %s: [String: Any] = %s" % (name, value)
+
+    def createNormalizedValue(self, value):
+        return "EventData.normalizedValue(%s)" % value
+
+    def createRegistryDefinition(self, chunks):
+        registryChunks = ",\n        ".join(chunks)
+        registry = """
+// Every event of %s by its normalized name (the one of EventData.name), found with a binary search
+public enum %sEventRegistry {
+    public struct Entry {
+        public let name: String
+        public let method: String
+        public let params: [String: String]
+    }
 
-## 
-## FILE GENERATION METHODS:
-##
-def generateStringFromCodeClass(codeClass, version):
-    if (version == None):
-        version = "0.0.0"
-        
-    fileLines = [
-        "// %s file generated by pykotlinswift script. Version: %s \n\n" % (codeClass.language, version)        
+    // A "name\\tmethod\\tkey:type,key:type" line per event, sorted by name
+    private static let chunks: [String] = [
+        %s
     ]
+    private static let lines: [Substring] = chunks.joined().split(separator: "\\n")
+    private static let names: [String] = lines.map { String($0.prefix(while: { $0 != "\\t" })) }
 
-    fileLines.append(codeClass.createEventClassDefinition())
-    
-    lines = codeClass.generateClassDefinitionLines()
-    for line in lines:
-        fileLines.append(line)
+    public static var count: Int {
+        return names.count
+    }
 
-    classFile = ""    
-    for line in fileLines:
-        classFile += ("%s\n" % line)
+    public static func contains(_ name: String) -> Bool {
+        return index(of: name) != nil
+    }
 
-    return classFile
-    
-def convertToSwiftFile(templateFileJson, className, version=None):    
-    templateFileObject = json.loads(templateFileJson)
-    
-    if (isinstance(templateFileObject, object)):
-        swiftClass = SwiftClass()
-        swiftClass.name = className
-        swiftClass.parseClassObject(templateFileObject)
-        return generateStringFromCodeClass(swiftClass, version)
+    public static func lookup(_ name: String) -> Entry? {
+        guard let index = index(of: name) else { return nil }
+        let fields = lines[index].split(separator: "\\t", omittingEmptySubsequences: false)
+        var params = [String: String]()
+        for param in fields[2].split(separator: ",") {
+            let keyAndType = param.split(separator: ":", maxSplits: 1)
+            params[String(keyAndType[0])] = String(keyAndType[1])
+        }
+        return Entry(name: String(fields[0]), method: String(fields[1]), params: params)
+    }
 
-    return "invalid json"
+    private static func index(of name: String) -> Int? {
+        var low = 0
+        var high = names.count - 1
+        while (low <= high) {
+            let middle = (low + high) / 2
+            if (names[middle] == name) {
+                return middle
+            }
+            if (names[middle] < name) {
+                low = middle + 1
+            }
+            else {
+                high = middle - 1
+            }
+        }
+        return nil
+    }
+}""" % (self.name, self.name, registryChunks)
+        return registry
+
+    def createMapDefinition(self, params, normalizedKeys=None):
+        mapValues = super().createMapDefinition(params, normalizedKeys)
+        if (len(mapValues) == 0):
+            return "[:]" # an empty dictionary, "[]" is an empty array
+        return "[%s]" % (mapValues.replace("=",":"))
 
+## 
+## FILE GENERATION METHODS:
+##
+class BufferedLineWriter:
+    def __init__(self, file, bufferSize=4096, stats=None, language=None):
+        self.file = file
+        self.bufferSize = bufferSize
+        self.buffer = []
+        self.stats = stats
+        self.language = language
+        self.assemblyTime = 0
+        self.writeTime = 0
+
+    def append(self, line):
+        self.buffer.append(line)
+        if (len(self.buffer) >= self.bufferSize):
+            self.flush()
+
+    def extend(self, lines):
+        self.buffer.extend(lines)
+        if (len(self.buffer) >= self.bufferSize):
+            self.flush()
+
+    def flush(self):
+        if (len(self.buffer) > 0):
+            self.buffer.append("")
+            if (self.stats == None):
+                self.file.write("\n".join(self.buffer))
+            else:
+                start = time.perf_counter()
+                text = "\n".join(self.buffer)
+                assembled = time.perf_counter()
+                self.file.write(text)
+                self.assemblyTime += assembled - start
+                self.writeTime += time.perf_counter() - assembled
+            self.buffer = []
+
+def writePreambleLines(codeClass, version, lines, header=None, description="file", runtime=True):
+    if (version == None):
+        version = "0.0.0"
 
-def convertToKotlinFile(templateFileJson, className, version=None):    
-    templateFileObject = json.loads(templateFileJson)
+    if (header != None):
+        lines.append(header)
+        lines.append("")
+        
+    lines.append("// %s %s generated by pykotlinswift script. Version: %s \n\n" % (codeClass.language, description, version))
+    if (runtime):
+        lines.append(codeClass.createEventClassDefinition())
+
+def writeLinesFromCodeClass(codeClass, version, lines, header=None):
+    writePreambleLines(codeClass, version, lines, header)
+    codeClass.writeClassDefinitionLines(lines)
+    if (codeClass.registry != None):
+        codeClass.writeRegistryLines(lines)
+
+    return lines
+
+# Sharded output: the runtime (EventData and its helpers), the root class without its subgroups and each of
+# its top-level subgroups are written to separate files, so a change to a group only recompiles its file
+runtimeShard = "runtime"
+rootShard = "root"
+
+def writeShardLinesFromCodeClass(codeClass, version, lines, header=None, shard=rootShard):
+    # shard is runtimeShard, rootShard or the index of a top-level subgroup of the root class
+    if (shard == runtimeShard):
+        writePreambleLines(codeClass, version, lines, header, "runtime of %s" % codeClass.name)
+    elif (shard == rootShard):
+        writePreambleLines(codeClass, version, lines, header, runtime=False)
+        codeClass.writeClassHeaderLines(lines)
+        codeClass.writeClassFooterLines(lines)
+        if (codeClass.registry != None):
+            codeClass.writeRegistryLines(lines)
+    else:
+        writePreambleLines(codeClass, version, lines, header, "shard of %s" % codeClass.name, runtime=False)
+        codeClass.writeExtensionLines(codeClass.template.subgroups[shard], lines, header)
+
+    return lines
+
+def generateStringFromCodeClass(codeClass, version, header=None):
+    fileLines = writeLinesFromCodeClass(codeClass, version, [], header)
+    fileLines.append("")
+
+    return "\n".join(fileLines)
+
+def writeFileFromCodeClass(codeClass, version, file, header=None, stats=None, shard=None):
+    start = time.perf_counter()
+    writer = BufferedLineWriter(file, stats=stats, language=codeClass.language)
+    if (shard == None):
+        writeLinesFromCodeClass(codeClass, version, writer, header)
+    else:
+        writeShardLinesFromCodeClass(codeClass, version, writer, header, shard)
+    writer.flush()
+
+    if (stats != None):
+        # Lines are generated and written interleaved, generation is what the joins and writes leave
+        elapsed = time.perf_counter() - start
+        stats.addTime("generation", elapsed - writer.assemblyTime - writer.writeTime, codeClass.language)
+        stats.addTime("assembly", writer.assemblyTime, codeClass.language)
+        stats.addTime("write", writer.writeTime, codeClass.language)
     
-    if (isinstance(templateFileObject, object)):
-        kotlinClass = KotlinClass()
-        kotlinClass.name = className
-        kotlinClass.parseClassObject(templateFileObject)
-        return generateStringFromCodeClass(kotlinClass, version)
+def generateSwiftFile(template, version=None, header=None, fragmentCache=None, typedPayloads=False, registry=None):
+    swiftClass = SwiftClass()
+    swiftClass.fragmentCache = fragmentCache
+    swiftClass.typedPayloads = typedPayloads
+    swiftClass.registry = registry
+    swiftClass.loadTemplateGroup(template)
+    return generateStringFromCodeClass(swiftClass, version, header)
+
+
+def generateKotlinFile(template, version=None, header=None, fragmentCache=None, typedPayloads=False, registry=None):
+    kotlinClass = KotlinClass()
+    kotlinClass.fragmentCache = fragmentCache
+    kotlinClass.typedPayloads = typedPayloads
+    kotlinClass.registry = registry
+    kotlinClass.loadTemplateGroup(template)
+    return generateStringFromCodeClass(kotlinClass, version, header)
+
+
+def writeSwiftFile(template, file, version=None, header=None, fragmentCache=None, stats=None, shard=None, typedPayloads=False, registry=None):
+    swiftClass = SwiftClass()
+    swiftClass.fragmentCache = fragmentCache
+    swiftClass.typedPayloads = typedPayloads
+    swiftClass.registry = registry
+    swiftClass.loadTemplateGroup(template)
+    writeFileFromCodeClass(swiftClass, version, file, header, stats, shard)
+
+
+def writeKotlinFile(template, file, version=None, header=None, fragmentCache=None, stats=None, shard=None, typedPayloads=False, registry=None):
+    kotlinClass = KotlinClass()
+    kotlinClass.fragmentCache = fragmentCache
+    kotlinClass.typedPayloads = typedPayloads
+    kotlinClass.registry = registry
+    kotlinClass.loadTemplateGroup(template)
+    writeFileFromCodeClass(kotlinClass, version, file, header, stats, shard)
 
-    return "invalid json"
 
+##
+## STREAMING: templates too large to be loaded at once are read one member of the root object at a time
+##
+whitespacePattern = re.compile(r"[ \t\n\r]*")
+numberCharacters = "0123456789.eE+-"
+
+class TemplateMemberReader:
+    # Reads the members of the root object of a JSON file one at a time, decoding each value with raw_decode
+    # as soon as it is complete, so only the member being read is held in memory.
+    def __init__(self, file, chunkSize=1024 * 1024):
+        self.file = file
+        self.chunkSize = chunkSize
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.offset = 0 # of the buffer in the file, for the error messages
+        self.ended = False
+
+    def fill(self):
+        # Reads at least as much as what is buffered, so a value larger than a chunk is only retried a
+        # logarithmic number of times
+        chunk = self.file.read(max(self.chunkSize, len(self.buffer) - self.position))
+        if (len(chunk) == 0):
+            self.ended = True
+        self.offset += self.position
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def skipWhitespace(self):
+        while (True):
+            self.position = whitespacePattern.match(self.buffer, self.position).end()
+            if (self.position < len(self.buffer) or self.ended):
+                return
+            self.fill()
+
+    def readCharacter(self, expected):
+        self.skipWhitespace()
+        if (self.position >= len(self.buffer) or self.buffer[self.position] not in expected):
+            raise ValueError("Expecting one of '%s' at character %d" % (expected, self.offset + self.position))
+        self.position += 1
+        return self.buffer[self.position - 1]
+
+    def readValue(self):
+        self.skipWhitespace()
+        while (True):
+            try:
+                (value, end) = self.decoder.raw_decode(self.buffer, self.position)
+                # A value ending the buffer, or a number followed by what could be more of it (e.g. "1." of
+                # "1.5"), may continue in the next chunk
+                if (self.ended or (end < len(self.buffer) and self.buffer[end] not in numberCharacters)):
+                    self.position = end
+                    return value
+            except json.JSONDecodeError as error:
+                if (self.ended):
+                    raise ValueError("%s at character %d" % (error.msg, self.offset + error.pos))
+            self.fill()
+
+    def readEnd(self):
+        # Like json.loads, nothing but whitespace can follow the root object
+        self.skipWhitespace()
+        if (self.position < len(self.buffer)):
+            raise ValueError("Extra data at character %d" % (self.offset + self.position))
+
+    def members(self):
+        self.readCharacter("{")
+        self.skipWhitespace()
+        if (self.buffer[self.position:self.position + 1] == "}"):
+            self.position += 1
+            self.readEnd()
+            return
+
+        while (True):
+            key = self.readValue()
+            if (not isinstance(key, str)):
+                raise ValueError("Expecting a member name at character %d" % (self.offset + self.position))
+            self.readCharacter(":")
+            yield (key, self.readValue())
+            if (self.readCharacter(",}") == "}"):
+                self.readEnd()
+                return
+
+def readTemplateMembers(templateFilePath):
+    # A repeated member is rejected: json.loads would only keep its last value, at the place of the first one,
+    # which can't be known before the whole file is read
+    keys = set()
+    with open(templateFilePath, encoding="utf-8") as templateFile:
+        members = TemplateMemberReader(templateFile).members()
+        while (True):
+            try:
+                (key, value) = next(members)
+            except StopIteration:
+                return
+            except ValueError as error:
+                raise TemplateValidationError([TemplateDiagnostic("$", "Invalid JSON: %s" % error)])
+            if (key in keys):
+                raise TemplateValidationError([TemplateDiagnostic(jsonPath("$", key), "Duplicated member, which a streamed template can't hold")])
+            keys.add(key)
+            yield (key, value)
+
+def readExpandedTemplateMembers(templateFilePath, includeLoader):
+    for (key, value) in readTemplateMembers(templateFilePath):
+        if (key in includeKeys or isinstance(value, dict)):
+            for member in includeLoader.expandMember(key, value, templateFilePath):
+                yield member
+        else:
+            yield (key, value)
+
+def readLastTemplateMember(templateFilePath, includeLoader, key):
+    # The value of a member included several times, read again as only one group is held at a time
+    lastValue = None
+    for (memberKey, value) in readExpandedTemplateMembers(templateFilePath, includeLoader):
+        if (memberKey == key):
+            lastValue = value
+    return lastValue
+
+def timeTemplateMembers(members, stats):
+    # The time spent reading and decoding the members is the json.loads phase of a streamed template
+    while (True):
+        start = time.perf_counter()
+        try:
+            member = next(members)
+        except StopIteration:
+            return
+        finally:
+            stats.addTime("json.loads", time.perf_counter() - start)
+        yield member
+
+def writeStreamedTemplateFiles(templateFilePath, className, outputs, version=None, fragmentCache=None, registry=None, includeLoader=None, stats=None):
+    # Writes the template to every (codeClass, file, header) of outputs without loading it whole. The file is
+    # read twice: first for the members of the root class, whose lines come before any subgroup, then for the
+    # top-level groups, each one parsed once and written to every output before the next one is read.
+    # The memory used is bounded by the largest top-level group instead of the whole template.
+    # An EventRegistry given as registry gets the events of every group as they are parsed, and is written last.
+    # stats, when given, gets the phases and node counts as for a template loaded whole (see GenerationStats).
+    if (includeLoader == None):
+        includeLoader = TemplateIncludeLoader()
+
+    def readMembers():
+        members = readExpandedTemplateMembers(templateFilePath, includeLoader)
+        if (stats != None):
+            members = timeTemplateMembers(members, stats)
+        return members
+
+    # A member included again replaces the previous one, keeping its place as in a decoded template, so only
+    # the last value of a key is used (and a group is parsed at its first occurrence)
+    memberCounts = {}
+    rootValues = {}
+    subgroupKeys = set()
+    for (key, value) in readMembers():
+        memberCounts[key] = memberCounts.get(key, 0) + 1
+        if (isSubgroupObject(key, value)):
+            subgroupKeys.add(key)
+        else:
+            subgroupKeys.discard(key)
+            rootValues[key] = value
+
+    rootMembers = {}
+    for key in memberCounts:
+        if (key not in subgroupKeys):
+            rootMembers[key] = rootValues[key]
+    subgroupCount = len(subgroupKeys)
+
+    stubCachedGroups = registry == None
+    start = time.perf_counter()
+    root = parseTemplateGroup(rootMembers, className, fragmentCache=fragmentCache, stubCachedGroups=stubCachedGroups)
+    parseTime = time.perf_counter() - start
+    if (stats != None):
+        stats.addNodes(countTemplateNodes(root))
+    if (registry != None):
+        registry.addGroup(root)
+    writers = []
+    # Per output, the time spent writing its lines, including the joins and writes of its writer
+    outputTimes = [0] * len(outputs)
+    for (index, (codeClass, file, header)) in enumerate(outputs):
+        start = time.perf_counter()
+        codeClass.fragmentCache = fragmentCache
+        codeClass.loadTemplateGroup(root)
+        writer = BufferedLineWriter(file, stats=stats, language=codeClass.language)
+        writePreambleLines(codeClass, version, writer, header)
+        codeClass.writeClassHeaderLines(writer, hasSubgroups=subgroupCount > 0)
+        writers.append(writer)
+        outputTimes[index] += time.perf_counter() - start
+
+    writtenKeys = set()
+    for (key, value) in readMembers():
+        if (key not in subgroupKeys or key in writtenKeys):
+            continue
+        writtenKeys.add(key)
+        if (memberCounts[key] > 1):
+            value = readLastTemplateMember(templateFilePath, includeLoader, key)
+        start = time.perf_counter()
+        subgroup = parseTemplateGroup(value, key, 1, fragmentCache, path=jsonPath("$", key), stubCachedGroups=stubCachedGroups)
+        parseTime += time.perf_counter() - start
+        if (stats != None):
+            stats.addNodes(countTemplateNodes(subgroup))
+        if (registry != None):
+            registry.addGroup(subgroup, "%s.%s" % (className, key))
+        for (index, ((codeClass, file, header), writer)) in enumerate(zip(outputs, writers)):
+            start = time.perf_counter()
+            codeClass.writeSubgroupLines(subgroup, writer)
+            outputTimes[index] += time.perf_counter() - start
+
+    for (index, ((codeClass, file, header), writer)) in enumerate(zip(outputs, writers)):
+        start = time.perf_counter()
+        codeClass.writeClassFooterLines(writer)
+        if (registry != None):
+            codeClass.registry = registry
+            codeClass.writeRegistryLines(writer)
+        writer.flush()
+        outputTimes[index] += time.perf_counter() - start
+
+    if (stats != None):
+        stats.addTime("parse", parseTime)
+        for ((codeClass, file, header), writer, outputTime) in zip(outputs, writers, outputTimes):
+            stats.addTime("generation", outputTime - writer.assemblyTime - writer.writeTime, codeClass.language)
+            stats.addTime("assembly", writer.assemblyTime, codeClass.language)
+            stats.addTime("write", writer.writeTime, codeClass.language)
+
+
+def convertToSwiftFile(templateFileJson, className, version=None, header=None):    
+    return generateSwiftFile(parseTemplate(templateFileJson, className), version, header)
+
+
+def convertToKotlinFile(templateFileJson, className, version=None, header=None):    
+    return generateKotlinFile(parseTemplate(templateFileJson, className), version, header)
 
 if __name__ == '__main__':
     jsonFilePath = "test_template.json"
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+
+# Long-lived generator listening on a Unix domain socket, so build hooks don't pay for a cold start.
+# The protocol is one JSON object per line in each direction:
+#   {"command": "generate", "settings": "<settings file path>", "cwd": "<directory the settings paths are relative to>"}
+#   {"command": "ping"}
+#   {"command": "stop"}
+# and every request gets a single response line, {"ok": true, ...} or {"ok": false, "error": "<message>"}.
+# The messages printed by a generation (e.g. the warnings of an event registry) are returned in its "log".
+import os
+import io
+import sys
+import json
+import time
+import socket
+import threading
+import contextlib
+import socketserver
+from pykotlinswift_cache import GenerationCache, defaultCacheDirectory
+from pykotlinswift import createCacheFromArgs, getArgument, getJobsArgument, getSettingsTargets, exportTargets, exportFromSettingsFile, reportExport, reportTemplateDiagnostics, SettingsError
+
+defaultSocketPath = os.path.join(defaultCacheDirectory, "daemon.sock")
+
+
+class GeneratorDaemonState:
+    # Everything kept warm between requests: the generation and fragment caches, the parsed subgroups of every
+    # template and, being the same process, the normalization and mask tokenizer caches of the generator.
+    def __init__(self, cache=None, jobs=1):
+        self.cache = cache
+        self.jobs = jobs
+        self.parsedGroups = {}
+        # The caches are shared by all the targets, so generations are serialized: requests for the same target
+        # never interleave, and as generation is CPU bound, threads couldn't run them faster anyway.
+        self.generationLock = threading.Lock()
+
+    def generate(self, request):
+        if ("settings" not in request):
+            raise ValueError("Missing 'settings' in the generate request")
+
+        with self.generationLock:
+            previousDirectory = os.getcwd()
+            output = io.StringIO()
+            try:
+                if ("cwd" in request):
+                    os.chdir(request["cwd"])
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(output):
+                    settingsJsonFile = open(request["settings"])
+                    targets = getSettingsTargets(json.loads(settingsJsonFile.read()))
+                    settingsJsonFile.close()
+                    targetResults = exportTargets(targets, self.cache, self.jobs, self.parsedGroups)
+                    if (self.cache != None):
+                        self.cache.save()
+                elapsed = time.perf_counter() - start
+            except Exception as error:
+                error.log = output.getvalue()
+                raise
+            finally:
+                os.chdir(previousDirectory)
+
+        response = {"ok": True, "elapsedMs": elapsed * 1000, "targets": [], "changedFiles": [], "log": output.getvalue()}
+        for result in targetResults:
+            files = []
+            for (fileTarget, filePath, status) in result.files:
+                files.append({"target": fileTarget, "path": filePath, "status": status})
+                if (status != "unchanged"):
+                    response["changedFiles"].append(filePath)
+            response["targets"].append({
+                "name": result.target.name,
+                "elapsedMs": result.elapsed * 1000,
+                "cacheHit": result.cacheHit,
+                "files": files
+            })
+        return response
+
+
+class GeneratorRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if (len(line.strip()) == 0):
+                continue
+
+            stopping = False
+            try:
+                request = json.loads(line)
+                command = request.get("command", "generate")
+                if (command == "generate"):
+                    response = self.server.state.generate(request)
+                elif (command == "ping"):
+                    response = {"ok": True, "pid": os.getpid()}
+                elif (command == "stop"):
+                    response = {"ok": True}
+                    stopping = True
+                else:
+                    raise ValueError("Unknown command %s" % command)
+            except Exception as error:
+                response = {"ok": False, "error": str(error)}
+                if (hasattr(error, "log")):
+                    response["log"] = error.log
+                if (hasattr(error, "diagnostics")):
+                    response["diagnostics"] = [{"path": diagnostic.path, "message": diagnostic.message} for diagnostic in error.diagnostics]
+
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            if (stopping):
+                # shutdown waits for serve_forever, which runs on another thread than this handler
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+class GeneratorDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socketPath, state):
+        self.state = state
+        self.socketPath = socketPath
+        socketserver.ThreadingUnixStreamServer.__init__(self, socketPath, GeneratorRequestHandler)
+
+    def server_close(self):
+        socketserver.ThreadingUnixStreamServer.server_close(self)
+        if (os.path.exists(self.socketPath)):
+            os.remove(self.socketPath)
+
+
+def serve(socketPath, cache=None, jobs=1):
+    socketPath = os.path.abspath(socketPath)
+    if (os.path.exists(socketPath)):
+        if (sendRequest(socketPath, {"command": "ping"}) != None):
+            print("A daemon is already listening on %s" % socketPath)
+            return
+        os.remove(socketPath) # Left by a daemon that was killed
+    os.makedirs(os.path.dirname(socketPath), exist_ok=True)
+
+    if (cache != None):
+        # Requests can change the working directory, the cache stays where the daemon was started
+        cache = GenerationCache(directory=os.path.abspath(cache.directory), maxEntries=cache.maxEntries, maxBytes=cache.maxBytes)
+
+    daemon = GeneratorDaemon(socketPath, GeneratorDaemonState(cache, jobs))
+    print("Listening on %s (Ctrl+C to stop)" % socketPath)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+
+
+def sendRequest(socketPath, request):
+    # Returns the response of the daemon, or None when no daemon is listening on socketPath
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socketPath)
+    except OSError:
+        client.close()
+        return None
+
+    with client:
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        with client.makefile("rb") as responseFile:
+            return json.loads(responseFile.readline())
+
+
+def generateWithDaemon(socketPath, settingsFilePath, args=[]):
+    response = sendRequest(socketPath, {"command": "generate", "settings": os.path.abspath(settingsFilePath), "cwd": os.getcwd()})
+    if (response == None):
+        # Without a daemon the build still works, only slower
+        print("No daemon listening on %s, generating in this process" % socketPath)
+        cache = createCacheFromArgs(args)
+        try:
+            exportFromSettingsFile(settingsFilePath, cache, getJobsArgument(args))
+        except ValueError as error:
+            from pykotlinswift_const_creator import TemplateValidationError
+            if (isinstance(error, SettingsError)):
+                print("Error: %s" % error)
+            elif (isinstance(error, TemplateValidationError)):
+                reportTemplateDiagnostics(getattr(error, "templatePath", "template"), error.diagnostics)
+            else:
+                raise
+            return False
+        if (cache != None):
+            cache.save()
+        return True
+
+    # Printed by the daemon as they would be by a generation in this process
+    sys.stdout.write(response.get("log", ""))
+    if (not response["ok"]):
+        print("Error: %s" % response["error"])
+        return False
+
+    for target in response["targets"]:
+        if (len(response["targets"]) > 1):
+            print("target %s: %.2f ms" % (target["name"], target["elapsedMs"]))
+        if (target["cacheHit"]):
+            print("Template and settings unchanged since the last generation (cache hit)")
+        for file in target["files"]:
+            reportExport(file["target"], file["path"], file["status"])
+    return True
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    socketPath = getArgument("socket", args)
+    if (socketPath == None):
+        socketPath = defaultSocketPath
+
+    if (len(args) > 0 and args[0] == "serve"):
+        try:
+            jobs = getJobsArgument(args)
+        except SettingsError as error:
+            print("Error: %s" % error)
+            exit(3)
+        serve(socketPath, createCacheFromArgs(args), jobs)
+    elif (len(args) > 0 and args[0] == "stop"):
+        if (sendRequest(socketPath, {"command": "stop"}) == None):
+            print("No daemon listening on %s" % socketPath)
+    else:
+        settingsFilePath = getArgument("settings", args)
+        if (settingsFilePath == None):
+            print("Usage: pykotlinswift_daemon.py serve [socket=<path>] | settings=<settings file> [socket=<path>] | stop [socket=<path>]")
+            exit(3)
+        if (not generateWithDaemon(socketPath, settingsFilePath, args)):
+            exit(3)